@@ -205,6 +205,25 @@ def render():
     return render
 
 
+@pytest.fixture
+def manual_frame_clock(mocker):
+    from pt_miniscreen.core.clock import FrameClock
+
+    class ManualFrameClock(FrameClock):
+        def __init__(self):
+            super().__init__()
+            # frames are only produced when the test calls tick
+            self._thread = Mock()
+
+        def tick(self, elapsed):
+            for frame_callback in list(self._callbacks):
+                frame_callback.callback(elapsed)
+
+    clock = ManualFrameClock()
+    mocker.patch("pt_miniscreen.core.transition.frame_clock", clock)
+    return clock
+
+
 @pytest.fixture
 def get_test_image_path():
     def get_test_image_path(image_name):
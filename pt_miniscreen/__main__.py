@@ -1,9 +1,10 @@
 import logging
+from os import environ
 
 import click
 import click_logging
 
-from .app import App
+from .startup import timeline
 
 logger = logging.getLogger()
 click_logging.basic_config(logger)
@@ -23,8 +24,22 @@ logging.getLogger("pitop.common").setLevel(logging.INFO)
 @click_logging.simple_verbosity_option(logger)
 @click.version_option()
 def main() -> None:
+    report_startup = environ.get("STARTUP_REPORT", "0") == "1"
+    if report_startup:
+        timeline.time_imports()
+
+    # imported here so that import times can be recorded
+    from .app import App
+
+    timeline.mark("imports done")
+
     app = App()
     app.start()
+
+    if report_startup:
+        timeline.stop_timing_imports()
+        logger.info(timeline.report())
+
     app.wait_for_stop()
 
 
@@ -1,11 +1,23 @@
 import logging
-import signal
-from os import kill, path, system
-from subprocess import Popen, check_output
+from os import path, system
+from subprocess import Popen
 
 from pitop.common.command_runner import run_command
 from pitop.common.configuration_file import add_section, has_section, remove_section
-from pitop.common.sys_info import get_ap_mode_status, get_systemd_enabled_state
+from pitop.common.sys_info import get_ap_mode_status
+
+from pt_miniscreen.services.processes import (
+    ProcessAlreadyRunning,
+    process_supervisor,
+)
+from pt_miniscreen.services.systemd import (
+    FURTHER_LINK_SERVICE,
+    SSH_SERVICE,
+    VNC_SERVICE,
+    WEB_VNC_SERVICE,
+    get_systemd_enabled_state,
+    systemd,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -13,13 +25,11 @@ CUSTOM_PREPEND_DNS_RESOLVER_CONFIG_FILE = "/etc/resolv.conf.head"
 
 
 def __enable_and_start_systemd_service(service_to_enable):
-    system("sudo systemctl enable " + service_to_enable)
-    system("sudo systemctl start " + service_to_enable)
+    systemd.enable_and_start(service_to_enable)
 
 
 def __disable_and_stop_systemd_service(service_to_disable):
-    system("sudo systemctl disable " + service_to_disable)
-    system("sudo systemctl stop " + service_to_disable)
+    systemd.disable_and_stop(service_to_disable)
 
 
 def __change_service_enabled_state(service):
@@ -32,21 +42,21 @@ def __change_service_enabled_state(service):
 
 
 def change_ssh_enabled_state():
-    __change_service_enabled_state("ssh")
+    __change_service_enabled_state(SSH_SERVICE)
 
 
 def change_vnc_enabled_state():
-    __change_service_enabled_state("vncserver-x11-serviced.service")
+    __change_service_enabled_state(VNC_SERVICE)
 
     # Force vncserver-x11-serviced and pt-web-vnc-desktop services status to match
-    vncserver_state = get_systemd_enabled_state("vncserver-x11-serviced.service")
-    pt_web_vnc_state = get_systemd_enabled_state("pt-web-vnc-desktop.service")
+    vncserver_state = get_systemd_enabled_state(VNC_SERVICE)
+    pt_web_vnc_state = get_systemd_enabled_state(WEB_VNC_SERVICE)
     if vncserver_state != pt_web_vnc_state:
-        __change_service_enabled_state("pt-web-vnc-desktop.service")
+        __change_service_enabled_state(WEB_VNC_SERVICE)
 
 
 def change_further_link_enabled_state():
-    __change_service_enabled_state("further-link.service")
+    __change_service_enabled_state(FURTHER_LINK_SERVICE)
 
 
 def change_wifi_mode():
@@ -83,14 +93,8 @@ def start_stop_project(path_to_project):
         start_script = path_to_project + "/start.sh"
         stop_script = path_to_project + "/stop.sh"
 
-        logger.debug("Checking if process is already running...")
-
-        cmd = 'pgrep -f "' + path_to_project + '" || true'
-        output = check_output(cmd, shell=True).decode("ascii", "ignore")
-        pids = list(filter(None, output.split("\n")))
-
         try:
-            if len(pids) > 1:
+            if process_supervisor.is_running(path_to_project):
                 logger.info(
                     f"Project already running: {path_to_project}. Attempting to stop..."
                 )
@@ -98,20 +102,18 @@ def start_stop_project(path_to_project):
                 if path.exists(stop_script):
                     Popen([stop_script])
                 else:
-                    for pid in pids:
-                        try:
-                            kill(int(pid), signal.SIGTERM)
-                        except ValueError:
-                            pass
+                    process_supervisor.stop(path_to_project)
             else:
                 logger.info("Starting project: " + str(path_to_project))
 
                 if path.exists(start_script):
                     logger.debug("Code file found at " + start_script + ". Running...")
-                    Popen([start_script])
+                    process_supervisor.start(path_to_project, [start_script])
                 else:
                     logger.info("No code file found at " + start_script)
 
+        except ProcessAlreadyRunning:
+            logger.info(f"Project already running: {path_to_project}")
         except Exception as e:
             logger.warning("Error starting/stopping process: " + str(e))
 
@@ -1,17 +1,33 @@
 import logging
 import traceback
+from enum import Enum, auto
+from functools import partial
 from os import environ
-from threading import Timer
+from threading import RLock
+from time import monotonic
+from typing import Optional, Tuple
+
 from pt_miniscreen.utils import ButtonEvents
 
 from pitop.system.pitop import Pitop
 
 from .core import App as BaseApp
+from .core.scheduler import scheduler
+from .input import InputDispatcher
+from .pages.root.screensaver import get_screensaver_settings
 from .root import RootComponent
+from .startup import timeline
 
 logger = logging.getLogger(__name__)
 
 
+class IdleState(Enum):
+    ACTIVE = auto()
+    DIMMED = auto()
+    SCREENSAVER = auto()
+    OFF = auto()
+
+
 class App(BaseApp):
     DIMMING_TIMEOUT = 20
     SCREENSAVER_TIMEOUT = 20
@@ -22,8 +38,19 @@ class App(BaseApp):
 
         logger.debug("Initializing miniscreen...")
         self.miniscreen = Pitop().miniscreen
+        timeline.mark("miniscreen initialised")
 
         logger.debug("Initialising app...")
+        self.screensaver_settings = get_screensaver_settings()
+        self.display_off = False
+
+        # button presses only update the last input time, the idle state is
+        # checked when the next state is due
+        self.idle_state = IdleState.ACTIVE
+        self.last_input_time = monotonic()
+        self.idle_check = None
+        self._idle_lock = RLock()
+        self.input = None
 
         # display should be `miniscreen.display_image` but that method attempts to
         # import opencv when it's called. We can catch the raised error but cannot
@@ -33,15 +60,23 @@ class App(BaseApp):
         super().__init__(
             display=self.miniscreen.device.display,
             size=self.miniscreen.size,
-            Root=RootComponent,
+            Root=partial(RootComponent, screensaver_settings=self.screensaver_settings),
         )
 
     def start(self):
         super().start()
+        timeline.mark("first frame")
+
+        self.input = InputDispatcher(
+            self._handle_input,
+            can_combine_navigation=lambda: self.root is not None
+            and self.root.is_navigable,
+        )
 
         def set_is_user_controlled(user_has_control) -> None:
             if user_has_control:
-                self.stop_timers()
+                self.stop_idle_timer()
+                self.turn_display_on()
                 if self.root.is_project_page:
                     self.root.project_uses_miniscreen(True)
             else:
@@ -54,63 +89,74 @@ class App(BaseApp):
         self.miniscreen.when_user_controlled = lambda: set_is_user_controlled(True)
         self.miniscreen.when_system_controlled = lambda: set_is_user_controlled(False)
         self.miniscreen.select_button.when_released = self.create_button_handler(
-            lambda: self.root.handle_button(ButtonEvents.SELECT_RELEASE)
+            ButtonEvents.SELECT_RELEASE
         )
         self.miniscreen.cancel_button.when_released = self.create_button_handler(
-            lambda: self.root.handle_button(ButtonEvents.CANCEL_RELEASE)
+            ButtonEvents.CANCEL_RELEASE
         )
         self.miniscreen.up_button.when_released = self.create_button_handler(
-            lambda: self.root.handle_button(ButtonEvents.UP_RELEASE)
+            ButtonEvents.UP_RELEASE
         )
         self.miniscreen.down_button.when_released = self.create_button_handler(
-            lambda: self.root.handle_button(ButtonEvents.DOWN_RELEASE)
+            ButtonEvents.DOWN_RELEASE
         )
         self.miniscreen.up_button.when_pressed = self.create_button_handler(
-            lambda: self.root.handle_button(ButtonEvents.UP_PRESS)
+            ButtonEvents.UP_PRESS
         )
         self.miniscreen.down_button.when_pressed = self.create_button_handler(
-            lambda: self.root.handle_button(ButtonEvents.DOWN_PRESS)
+            ButtonEvents.DOWN_PRESS
         )
 
-        self.dimmed = False
-        self.screensaver_timer = None
-        self.dimming_timer = None
-        self.start_dimming_timer()
+        self.reset_idle_timer()
 
     def brighten(self):
+        self.turn_display_on()
         self.miniscreen.contrast(255)
-        self.dimmed = False
 
     def dim(self):
         self.miniscreen.contrast(0)
-        self.dimmed = True
 
-    def create_button_handler(self, func):
+    def turn_display_off(self):
+        self.display_off = True
+        self.miniscreen.device.hide()
+
+    def turn_display_on(self):
+        if not self.display_off:
+            return
+
+        self.display_off = False
+        self.miniscreen.device.show()
+
+        # frames are not sent while the display is off so send the latest one
+        self.display()
+
+    def create_button_handler(self, button_event):
+        # events are handled in order on the input thread so the button
+        # callbacks return straight away
         def handler():
             if self.user_has_control:
                 logger.debug("User has control of miniscreen, omitting button press...")
                 return
 
-            self.restart_dimming_timer()
+            self.input.put(button_event)
 
-            try:
-                if self.root.is_screensaver_running:
-                    self.root.stop_screensaver()
-                    self.brighten()
-                    return
+        return handler
 
-                if callable(func):
-                    func()
+    def _handle_input(self, button_event, distance):
+        if self.root is None or self.user_has_control:
+            return
 
-            except Exception as e:
-                logger.error("Error in button handler: " + str(e))
-                traceback.print_exc()
-                self.stop(e)
+        try:
+            # the press that wakes the screensaver is not passed on
+            if self.register_input() in (IdleState.SCREENSAVER, IdleState.OFF):
+                return
 
-            if self.dimmed:
-                self.brighten()
+            self.root.handle_button(button_event, distance)
 
-        return handler
+        except Exception as e:
+            logger.error("Error in button handler: " + str(e))
+            traceback.print_exc()
+            self.stop(e)
 
     def restore_miniscreen(self):
         try:
@@ -118,19 +164,20 @@ class App(BaseApp):
         except RuntimeError as e:
             logger.error(f"Error resetting miniscreen: {e}")
 
-        if self.root.is_screensaver_running:
-            self.root.stop_screensaver()
+        with self._idle_lock:
+            self._wake()
+            self.reset_idle_timer()
 
-        self.brighten()
-        self.restart_dimming_timer()
         self.display()
 
     def display(self):
-        if self.user_has_control:
+        if self.user_has_control or self.display_off:
             return
 
         try:
             super().display()
+            if self.input:
+                self.input.frame_displayed()
 
         # When performing actions sometimes the spi addresses can change; this
         # causes a BrokenPipeError because the miniscreen instance tries to send
@@ -142,38 +189,113 @@ class App(BaseApp):
             self.stop(e)
 
     def stop(self, error=None):
+        self.stop_idle_timer()
+        if self.input:
+            self.input.stop()
+
         super().stop(error)
-        self.stop_timers()
 
     @property
     def user_has_control(self) -> bool:
         return self.miniscreen.is_active
 
-    def start_screensaver_timer(self):
-        self.screensaver_timer = Timer(
-            self.SCREENSAVER_TIMEOUT, self.root.start_screensaver
-        )
-        self.screensaver_timer.start()
+    def sleep_screensaver(self):
+        self.root.sleep_screensaver()
 
-    def start_dimming_timer(self):
-        def dim_and_start_screensaver_timer():
+        if self.screensaver_settings.sleep_mode == "off":
+            self.turn_display_off()
+
+    def get_next_idle_state(self) -> Optional[Tuple[IdleState, float]]:
+        """Returns the state after the current one and how long there has to
+        be no input for before it is entered."""
+        dimmed_after = self.DIMMING_TIMEOUT
+        screensaver_after = dimmed_after + self.SCREENSAVER_TIMEOUT
+
+        if self.idle_state == IdleState.ACTIVE:
+            return IdleState.DIMMED, dimmed_after
+
+        if self.idle_state == IdleState.DIMMED:
+            return IdleState.SCREENSAVER, screensaver_after
+
+        sleep_timeout = self.screensaver_settings.sleep_timeout
+        if self.idle_state == IdleState.SCREENSAVER and sleep_timeout:
+            return IdleState.OFF, screensaver_after + sleep_timeout
+
+        return None
+
+    def register_input(self) -> IdleState:
+        """Records that a button was pressed, waking the app if it was idle,
+        and returns the idle state the app was in."""
+        with self._idle_lock:
+            self.last_input_time = monotonic()
+
+            idle_state = self.idle_state
+            if idle_state != IdleState.ACTIVE:
+                self._wake()
+                self._schedule_idle_check()
+
+        return idle_state
+
+    def reset_idle_timer(self):
+        with self._idle_lock:
+            self.last_input_time = monotonic()
+            self._schedule_idle_check()
+
+    def stop_idle_timer(self):
+        with self._idle_lock:
+            if self.idle_check:
+                self.idle_check.cancel()
+                self.idle_check = None
+
+    def _wake(self):
+        if self.root.is_screensaver_running:
+            self.root.stop_screensaver()
+
+        self.brighten()
+        self.idle_state = IdleState.ACTIVE
+
+    def _enter_idle_state(self, idle_state):
+        logger.debug(f"Entering idle state {idle_state.name}")
+        self.idle_state = idle_state
+
+        if idle_state == IdleState.DIMMED:
             self.dim()
-            self.start_screensaver_timer()
+        elif idle_state == IdleState.SCREENSAVER:
+            self.root.start_screensaver()
+        elif idle_state == IdleState.OFF:
+            self.sleep_screensaver()
+
+    def _schedule_idle_check(self):
+        if self.idle_check:
+            self.idle_check.cancel()
+            self.idle_check = None
+
+        next_state = self.get_next_idle_state()
+        if next_state is None:
+            return
 
-        self.dimming_timer = Timer(
-            self.DIMMING_TIMEOUT, dim_and_start_screensaver_timer
+        _, idle_time = next_state
+        self.idle_check = scheduler.call_at(
+            self.last_input_time + idle_time, self._check_idle
         )
-        self.dimming_timer.start()
 
-    def restart_dimming_timer(self):
-        self.stop_timers()
-        self.start_dimming_timer()
+    def _check_idle(self):
+        with self._idle_lock:
+            # the idle timer has been stopped
+            if self.idle_check is None:
+                return
+
+            next_state = self.get_next_idle_state()
+            if next_state is None:
+                return
 
-    def stop_timers(self):
-        if isinstance(self.dimming_timer, Timer):
-            self.dimming_timer.cancel()
-            self.dimming_timer = None
+            # there may have been input since this check was scheduled
+            idle_state, idle_time = next_state
+            if monotonic() - self.last_input_time >= idle_time:
+                self._enter_idle_state(idle_state)
+
+                # entering the state can stop the app if the display fails
+                if self.idle_check is None:
+                    return
 
-        if isinstance(self.screensaver_timer, Timer):
-            self.screensaver_timer.cancel()
-            self.screensaver_timer = None
+            self._schedule_idle_check()
@@ -0,0 +1,193 @@
+import logging
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import List, Optional
+
+import click
+from PIL import Image, ImageSequence
+
+from pt_miniscreen.settings import read_settings
+from pt_miniscreen.utils import get_image_file_path
+
+logger = logging.getLogger(__name__)
+
+BOOTSPLASH_FRAMES_PATH = "/var/cache/pt-miniscreen/bootsplash.frames"
+BOOTSPLASH_SIZE = (128, 64)
+DEFAULT_FRAME_DURATION = 100  # milliseconds
+
+# magic, version, width, height, frame count, source size, source mtime and
+# the length of the source path, which follows the header
+HEADER = struct.Struct("<4sBHHHQQH")
+MAGIC = b"PTBS"
+VERSION = 1
+
+
+def get_bootsplash_image_path():
+    return read_settings().get(
+        "Bootsplash",
+        "Path",
+        fallback=get_image_file_path("startup/pi-top_startup.gif"),
+    )
+
+
+def get_frame_size(size) -> int:
+    # rows of 1-bit images are padded to a whole number of bytes
+    width, height = size
+    return (width + 7) // 8 * height
+
+
+def get_source_fingerprint(source_path: str):
+    stat = os.stat(source_path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def bake_frames(source_path: str, output_path: str, size=BOOTSPLASH_SIZE):
+    """Decodes every frame of an image and writes them to `output_path` as
+    packed 1-bit frames with their durations, so they can be shown without
+    decoding them again."""
+    frames: List[bytes] = []
+    durations: List[int] = []
+
+    with Image.open(source_path) as source:
+        for frame in ImageSequence.Iterator(source):
+            # converted and positioned as they would be pasted on the display
+            image = Image.new("1", size)
+            image.paste(frame.convert("1"), (0, 0))
+            frames.append(image.tobytes())
+            durations.append(frame.info.get("duration", DEFAULT_FRAME_DURATION))
+
+    source_size, source_mtime = get_source_fingerprint(source_path)
+    encoded_path = os.fsencode(source_path)
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        size[0],
+        size[1],
+        len(frames),
+        source_size,
+        source_mtime,
+        len(encoded_path),
+    )
+
+    # write to a temporary file so a partly written file is never loaded
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    temp_path = f"{output_path}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(header)
+        file.write(encoded_path)
+        file.write(struct.pack(f"<{len(durations)}H", *durations))
+        for frame in frames:
+            file.write(frame)
+
+    os.replace(temp_path, output_path)
+    logger.info(f"Baked {len(frames)} bootsplash frames to {output_path}")
+
+
+class BootsplashFrames:
+    """Memory maps a file written by `bake_frames`. Frames are read straight
+    from the page cache when they are shown."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._read_header()
+        except Exception:
+            self.close()
+            raise
+
+    def _read_header(self):
+        if len(self._mmap) < HEADER.size:
+            raise ValueError("Bootsplash frames file is truncated")
+
+        (
+            magic,
+            version,
+            width,
+            height,
+            frame_count,
+            self.source_size,
+            self.source_mtime,
+            path_length,
+        ) = HEADER.unpack_from(self._mmap)
+
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Unsupported bootsplash frames file")
+
+        self.size = (width, height)
+        self.frame_size = get_frame_size(self.size)
+
+        path_offset = HEADER.size
+        self.source_path = os.fsdecode(
+            self._mmap[path_offset : path_offset + path_length]
+        )
+
+        durations_offset = path_offset + path_length
+        self.durations = struct.unpack_from(
+            f"<{frame_count}H", self._mmap, durations_offset
+        )
+
+        self._frames_offset = durations_offset + 2 * frame_count
+        if len(self._mmap) < self._frames_offset + frame_count * self.frame_size:
+            raise ValueError("Bootsplash frames file is truncated")
+
+    def __len__(self):
+        return len(self.durations)
+
+    def duration(self, index: int) -> float:
+        """Returns how long frame `index` is shown for in seconds."""
+        return self.durations[index] / 1000
+
+    def frame(self, index: int) -> Image.Image:
+        offset = self._frames_offset + index * self.frame_size
+        return Image.frombytes(
+            "1", self.size, self._mmap[offset : offset + self.frame_size]
+        )
+
+    def is_baked_from(self, source_path: str) -> bool:
+        try:
+            return self.source_path == source_path and get_source_fingerprint(
+                source_path
+            ) == (self.source_size, self.source_mtime)
+        except OSError:
+            return False
+
+    def close(self):
+        self._mmap.close()
+
+
+def load_bootsplash_frames(
+    source_path: str, frames_path: str = BOOTSPLASH_FRAMES_PATH
+) -> Optional[BootsplashFrames]:
+    """Returns the baked frames for `source_path`, or None if they haven't
+    been baked or the source has changed since."""
+    try:
+        frames = BootsplashFrames(frames_path)
+    except FileNotFoundError:
+        logger.debug(f"No baked bootsplash frames at {frames_path}")
+        return None
+    except Exception as e:
+        logger.warning(f"Unable to load baked bootsplash frames: {e}")
+        return None
+
+    if not frames.is_baked_from(source_path):
+        logger.debug("Baked bootsplash frames are out of date")
+        frames.close()
+        return None
+
+    return frames
+
+
+@click.command()
+@click.option("--source", help="Image to bake, defaults to the configured one")
+@click.option("--output", default=BOOTSPLASH_FRAMES_PATH, show_default=True)
+def main(source, output) -> None:
+    """Bakes the bootsplash animation into frames that are quick to show."""
+    bake_frames(source or get_bootsplash_image_path(), output)
+
+
+if __name__ == "__main__":
+    main()  # pragma: no cover
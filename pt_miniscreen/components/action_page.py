@@ -1,12 +1,13 @@
 import logging
 import threading
 from enum import Enum, auto
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional
 
 from pt_miniscreen.core.component import Component
 from pt_miniscreen.core.components import Image, Text
 from pt_miniscreen.components.mixins import Actionable
 from pt_miniscreen.core.utils import apply_layers, layer, offset_to_center
+from pt_miniscreen.services.subscription import Publisher
 from pt_miniscreen.utils import get_image_file_path
 
 logger = logging.getLogger(__name__)
@@ -29,12 +30,19 @@ image_paths = {
 }
 
 
+# pages can be removed while their action runs, so running actions are kept
+# here for the page that replaces it
+running_actions: Dict[Callable, threading.Thread] = {}
+running_actions_lock = threading.Lock()
+
+
 class ActionPage(Component, Actionable):
     def __init__(
         self,
         text: str,
         action: Callable,
         get_enabled_state: Optional[Callable] = None,
+        state_publisher: Optional[Publisher] = None,
         font_size=14,
         **kwargs,
     ) -> None:
@@ -54,9 +62,33 @@ class ActionPage(Component, Actionable):
         self.status_icon_component = self.create_child(
             Image, image_path=get_image_file_path(image_paths[action_state])
         )
+        self.watch_state("action_state", self._on_action_state_change)
+
+        # keep state up to date when it is changed outside of this page
+        self._state_subscription = None
+        if state_publisher is not None:
+            self._state_subscription = state_publisher.subscribe(
+                self._on_enabled_state_change, active_event=self.active_event
+            )
 
-        # get initial state in background
-        threading.Thread(target=self._update_action_state, daemon=True).start()
+        # get initial state in background, after any running action finishes
+        with running_actions_lock:
+            running_action = running_actions.get(action)
+
+        threading.Thread(
+            target=self._update_action_state_after,
+            args=(running_action,),
+            daemon=True,
+        ).start()
+
+    def cleanup(self):
+        if getattr(self, "_state_subscription", None):
+            self._state_subscription.cancel()
+
+    def _on_enabled_state_change(self, _):
+        # actions update state when they finish
+        if self.state["action_state"] != ActionState.PROCESSING:
+            self._update_action_state()
 
     def _calculate_action_state(self):
         if not callable(self._get_enabled_state):
@@ -70,11 +102,16 @@ class ActionPage(Component, Actionable):
     def _update_action_state(self):
         self.state.update({"action_state": self._calculate_action_state()})
 
-    def on_state_change(self, previous_state):
-        if self.state["action_state"] != previous_state["action_state"]:
-            self.status_icon_component.state.update(
-                {"image_path": image_paths[self.state["action_state"]]}
-            )
+    def _update_action_state_after(self, running_action):
+        if running_action is not None:
+            running_action.join()
+
+        self._update_action_state()
+
+    def _on_action_state_change(self, previous_state):
+        self.status_icon_component.state.update(
+            {"image_path": image_paths[self.state["action_state"]]}
+        )
 
     def _perform_action(self):
         try:
@@ -87,6 +124,10 @@ class ActionPage(Component, Actionable):
             self.state.update({"action_state": ActionState.UNKNOWN})
             logger.error(f"{self} failed to start action: {e}")
 
+        finally:
+            with running_actions_lock:
+                running_actions.pop(self._action, None)
+
     def perform_action(self) -> None:
         if self.state["action_state"] == ActionState.PROCESSING or not callable(
             self._action
@@ -94,7 +135,10 @@ class ActionPage(Component, Actionable):
             return
 
         self.state.update({"action_state": ActionState.PROCESSING})
-        threading.Thread(target=self._perform_action, daemon=True).start()
+        thread = threading.Thread(target=self._perform_action, daemon=True)
+        with running_actions_lock:
+            running_actions[self._action] = thread
+        thread.start()
 
     def render(self, image):
         FIRST_COLUMN_POS = 5
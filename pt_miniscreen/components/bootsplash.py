@@ -0,0 +1,68 @@
+import logging
+from threading import Event, Thread
+from time import monotonic, sleep
+
+from pt_miniscreen.bootsplash import BootsplashFrames
+from pt_miniscreen.core.component import Component
+
+logger = logging.getLogger(__name__)
+
+
+class BootsplashAnimation(Component):
+    """Plays baked bootsplash frames once.
+
+    Frames are shown on a fixed schedule, so if the CPU is too busy to show
+    a frame on time it is skipped rather than making the animation longer.
+    """
+
+    def __init__(self, frames: BootsplashFrames, **kwargs):
+        self.frames = frames
+        self.stop_animating_event = Event()
+
+        super().__init__(**kwargs, initial_state={"frame": 0})
+
+        Thread(
+            target=self._animate, args=[self.stop_animating_event], daemon=True
+        ).start()
+
+    def cleanup(self):
+        self.stop_animating_event.set()
+        self.frames.close()
+
+    def _is_late(self, index, frame_time):
+        return monotonic() >= frame_time + self.frames.duration(index)
+
+    def _animate(self, stop_event):
+        index = 0
+        next_frame_time = monotonic()
+
+        while True:
+            next_frame_time += self.frames.duration(index)
+            sleep(max(next_frame_time - monotonic(), 0))
+
+            self.active_event.wait()
+
+            if stop_event.is_set():
+                return
+
+            # skip frames that should already have been replaced
+            index += 1
+            while index < len(self.frames) and self._is_late(index, next_frame_time):
+                next_frame_time += self.frames.duration(index)
+                index += 1
+
+            if index >= len(self.frames):
+                stop_event.set()
+                return
+
+            self.state.update({"frame": index})
+
+    def render(self, image):
+        frame = self.frames.frame(self.state["frame"])
+
+        # frames are baked at the display size so can be shown as they are
+        if frame.size == image.size:
+            return frame
+
+        image.paste(frame, (0, 0))
+        return image
@@ -133,12 +133,12 @@ class ConfirmationPage(Component, Actionable, Navigable):
             ],
         )
 
-    def go_next(self):
-        self.selectable_list.select_next_row()
+    def go_next(self, distance=1):
+        self.selectable_list.select_next_row(distance=distance)
         self.state.update({"selected_row": self.selectable_list.selected_row})
 
-    def go_previous(self):
-        self.selectable_list.select_previous_row()
+    def go_previous(self, distance=1):
+        self.selectable_list.select_previous_row(distance=distance)
         self.state.update({"selected_row": self.selectable_list.selected_row})
 
     def go_top(self):
@@ -1,22 +1,27 @@
 import logging
 
 import PIL.ImageDraw
-from psutil import cpu_percent
 
 from pt_miniscreen.core.component import Component
+from pt_miniscreen.services.metrics import metrics_sampler
 
 logger = logging.getLogger(__name__)
 
 
 class CPUBars(Component):
     def __init__(self, **kwargs):
-        percentages = cpu_percent(percpu=True)
+        percentages = metrics_sampler.get_snapshot().cpu_percentages
         super().__init__(**kwargs, initial_state={"percentages": percentages})
-        self.create_interval(self.update_percentages)
+        self._metrics_subscription = metrics_sampler.subscribe(
+            self.update_percentages, active_event=self.active_event
+        )
 
-    def update_percentages(self):
-        percentages = cpu_percent(interval=0.5, percpu=True)
-        self.state.update({"percentages": percentages})
+    def cleanup(self):
+        if hasattr(self, "_metrics_subscription"):
+            self._metrics_subscription.cancel()
+
+    def update_percentages(self, snapshot):
+        self.state.update({"percentages": snapshot.cpu_percentages})
 
     def render(self, image):
         percentages = self.state["percentages"]
@@ -51,11 +51,15 @@ class EnterablePageList(PageList, Navigable, Enterable, HasGutterIcons):
 
         return None
 
-    def go_next(self):
-        return super().scroll_down()
+    def go_next(self, distance=1):
+        if distance > 1:
+            distance = min(distance, self.distance_to_bottom)
+        return super().scroll_down(distance=distance)
 
-    def go_previous(self):
-        return super().scroll_up()
+    def go_previous(self, distance=1):
+        if distance > 1:
+            distance = min(distance, self.distance_to_top)
+        return super().scroll_up(distance=distance)
 
     def go_top(self):
         return super().scroll_to_top()
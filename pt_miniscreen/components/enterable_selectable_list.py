@@ -52,11 +52,11 @@ class EnterableSelectableList(SelectableList, Navigable, Enterable, HasGutterIco
 
         return None
 
-    def go_next(self):
-        return self.select_next_row()
+    def go_next(self, distance=1):
+        return self.select_next_row(distance=distance)
 
-    def go_previous(self):
-        return self.select_previous_row()
+    def go_previous(self, distance=1):
+        return self.select_previous_row(distance=distance)
 
     def go_top(self):
         pass
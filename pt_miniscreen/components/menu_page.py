@@ -19,11 +19,15 @@ class MenuPage(Component, Enterable):
         font_size=14,
         image_size=(25, 25),
         virtual_page_list=True,
+        max_warm_pages=0,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
         self.PageList = partial(
-            EnterablePageList, Pages=Pages, virtual=virtual_page_list
+            EnterablePageList,
+            Pages=Pages,
+            virtual=virtual_page_list,
+            max_warm_rows=max_warm_pages,
         )
         self.cover_image_size = image_size
         self.cover_image = self.create_child(Image, image_path=image_path)
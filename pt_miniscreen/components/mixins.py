@@ -16,11 +16,11 @@ class HasGutterIcons:
 
 class Navigable:
     @abstractmethod
-    def go_next(self):
+    def go_next(self, distance=1):
         pass
 
     @abstractmethod
-    def go_previous(self):
+    def go_previous(self, distance=1):
         pass
 
     @abstractmethod
@@ -64,3 +64,9 @@ class UpdatableByChild:
     @abstractmethod
     def on_child_action(self) -> None:
         pass
+
+
+class UserControllable:
+    @abstractmethod
+    def set_user_controls_miniscreen(self, user_using_miniscreen):
+        pass
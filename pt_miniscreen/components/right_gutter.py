@@ -29,12 +29,14 @@ class RightGutter(Component):
         self.upper_icon = self.create_child(Image, image_path=upper_icon_path)
         self.lower_icon = self.create_child(Image, image_path=lower_icon_path)
 
-    def on_state_change(self, previous_state):
-        if self.state["upper_icon_path"] != previous_state["upper_icon_path"]:
-            self.upper_icon.state.update({"image_path": self.state["upper_icon_path"]})
+        self.watch_state("upper_icon_path", self._on_upper_icon_path_change)
+        self.watch_state("lower_icon_path", self._on_lower_icon_path_change)
 
-        if self.state["lower_icon_path"] != previous_state["lower_icon_path"]:
-            self.lower_icon.state.update({"image_path": self.state["lower_icon_path"]})
+    def _on_upper_icon_path_change(self, previous_state):
+        self.upper_icon.state.update({"image_path": self.state["upper_icon_path"]})
+
+    def _on_lower_icon_path_change(self, previous_state):
+        self.lower_icon.state.update({"image_path": self.state["lower_icon_path"]})
 
     def render(self, image):
         border_width = 1
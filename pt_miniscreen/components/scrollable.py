@@ -1,7 +1,6 @@
-from time import sleep
-from threading import Thread
+from math import exp
+from threading import Lock
 import logging
-import time
 from pt_miniscreen.components.mixins import HasGutterIcons
 from pt_miniscreen.core.component import Component
 from pt_miniscreen.utils import VIEWPORT_HEIGHT
@@ -10,44 +9,64 @@ from pt_miniscreen.utils import VIEWPORT_HEIGHT
 logger = logging.getLogger(__name__)
 
 
-class SpeedRamp:
-    TOP_SPEED = 100
-    BASE_SPEED = 5
-    ACCELERATION = 10
-    ramp = False
-    direction = 1
+class ScrollEngine:
+    """Calculates scroll velocity from how long a scroll button has been held.
+
+    Velocity starts at BASE_SPEED and stays there for ACCELERATION_DELAY
+    seconds so that text can be read while scrolling slowly, then eases in
+    towards TOP_SPEED over ACCELERATION_TIME seconds. Once released the
+    velocity decays exponentially so scrolling comes to a smooth stop.
+    """
+
+    BASE_SPEED = 100  # pixels per second
+    TOP_SPEED = 2000  # pixels per second
+    ACCELERATION_DELAY = 1  # seconds
+    ACCELERATION_TIME = 1  # seconds
+    FRICTION = 20  # velocity decay rate after release
+    MIN_SPEED = 10  # pixels per second, slower than this is considered stopped
 
     def __init__(self) -> None:
-        self.speed = self.BASE_SPEED * self.direction
+        self.velocity = 0.0
+        self.direction = 0
+        self.held_time = 0.0
 
-    def forwards(self):
-        self.direction = abs(self.direction)
+    @property
+    def held(self):
+        return self.direction != 0
 
-    def backwards(self):
-        self.direction = -1 * abs(self.direction)
+    @property
+    def moving(self):
+        return self.velocity != 0
 
-    def stop(self):
-        self.ramp = False
-        self.speed = 0
+    def press(self, direction):
+        self.direction = direction
+        self.held_time = 0.0
+        self.velocity = self.BASE_SPEED * direction
 
-    def start(self):
-        self.ramp = True
-        Thread(target=self.run, daemon=True).start()
+    def release(self):
+        self.direction = 0
 
-    def run(self):
-        elapsed = 0
-        delta_t = 0.1
+    def stop(self):
+        self.direction = 0
+        self.velocity = 0.0
 
-        self.speed = self.BASE_SPEED * self.direction
+    def speed_for_held_time(self, held_time):
+        ramp = (held_time - self.ACCELERATION_DELAY) / self.ACCELERATION_TIME
+        ramp = min(max(ramp, 0), 1)
+        return self.BASE_SPEED + (self.TOP_SPEED - self.BASE_SPEED) * ramp**2
 
-        while self.ramp:
-            if elapsed > 1:
-                self.speed += self.direction * self.ACCELERATION
-                if self.speed >= self.TOP_SPEED:
-                    self.ramp = False
+    def step(self, elapsed):
+        """Advance the engine by `elapsed` seconds and return the distance
+        travelled in pixels."""
+        if self.held:
+            self.held_time += elapsed
+            self.velocity = self.direction * self.speed_for_held_time(self.held_time)
+        else:
+            self.velocity *= exp(-self.FRICTION * elapsed)
+            if abs(self.velocity) < self.MIN_SPEED:
+                self.velocity = 0.0
 
-            sleep(delta_t)
-            elapsed += delta_t
+        return self.velocity * elapsed
 
 
 class Scrollable(Component, HasGutterIcons):
@@ -61,41 +80,53 @@ class Scrollable(Component, HasGutterIcons):
             },
             **kwargs
         )
-        self.start_time = 0
-        self.scroll_speed_tracker = SpeedRamp()
-        self.create_interval(self.update_state, timeout=0.05)
-
-    def update_state(self):
-        speed = self.scroll_speed_tracker.speed
-        now = 0
-        if self.start_time > 0:
-            now = time.time()
-
-        dt = now - self.start_time
-        if 0 < dt < 1:
-            dt = 1
-
-        y_pos = self.state["y_pos"] + speed * int(dt)
-        if y_pos + VIEWPORT_HEIGHT > self.state["image"].height:
-            y_pos = self.state["image"].height - VIEWPORT_HEIGHT
-        if y_pos < 0:
-            y_pos = 0
-
-        self.state.update({"y_pos": y_pos, "speed": speed})
+        self.scroll_engine = ScrollEngine()
+        self._position = 0.0
+        self._frame_callback = None
+        self._engine_lock = Lock()
+
+    @property
+    def max_y_pos(self):
+        return max(self.state["image"].height - VIEWPORT_HEIGHT, 0)
+
+    def _start_engine(self, direction):
+        with self._engine_lock:
+            self.scroll_engine.press(direction)
+
+            # only tick while scrolling so idle pages don't wake up every frame
+            if self._frame_callback is None:
+                self._frame_callback = self.create_frame_callback(self.update_state)
+
+    def _stop_engine_if_idle(self):
+        with self._engine_lock:
+            if self.scroll_engine.moving or self._frame_callback is None:
+                return
+
+            self.remove_frame_callback(self._frame_callback)
+            self._frame_callback = None
+
+    def update_state(self, elapsed):
+        position = self._position + self.scroll_engine.step(elapsed)
+        clamped_position = min(max(position, 0), self.max_y_pos)
+
+        # keep trying to scroll while held in case the image grows
+        if clamped_position != position and not self.scroll_engine.held:
+            self.scroll_engine.stop()
+
+        self._position = clamped_position
+        self.state.update(
+            {"y_pos": int(self._position), "speed": self.scroll_engine.velocity}
+        )
+        self._stop_engine_if_idle()
 
     def scroll_down(self):
-        self.scroll_speed_tracker.forwards()
-        self.start_time = time.time()
-        self.scroll_speed_tracker.start()
+        self._start_engine(direction=1)
 
     def scroll_up(self):
-        self.scroll_speed_tracker.backwards()
-        self.start_time = time.time()
-        self.scroll_speed_tracker.start()
+        self._start_engine(direction=-1)
 
     def stop_scrolling(self):
-        self.scroll_speed_tracker.stop()
-        self.state.update({"start_time": 0})
+        self.scroll_engine.release()
 
     def render(self, image):
         return self.state["image"].crop(
@@ -46,7 +46,7 @@ class ScrollableTextFile(Scrollable):
     def __init__(self, path, **kwargs) -> None:
         initial_text = "..."
         try:
-            self.file = TextFile(path)
+            self.file = self.open_file(path)
             if self.file.len == 0:
                 initial_text = "Log file is empty"
         except Exception as e:
@@ -66,7 +66,9 @@ class ScrollableTextFile(Scrollable):
 
         if self.file and self.file.len > 0:
             self._load_images(start_line=0, lines=self.LINES_PER_IMAGE)
-            self.state.update({"image": self.image_array.image})
+
+    def open_file(self, path):
+        return TextFile(path)
 
     def _load_images(self, start_line, lines):
         if self.file is None or self.is_loading:
@@ -77,6 +79,7 @@ class ScrollableTextFile(Scrollable):
             lines = self.file.len - start_line + 1
 
         if lines == 0:
+            self.is_loading = False
             return
 
         logger.info(
@@ -89,14 +92,12 @@ class ScrollableTextFile(Scrollable):
             self.state.update({"last_line_loaded": start_line + lines})
 
         self.is_loading = False
+        self.state.update({"image": self.image_array.image})
 
-    def update_state(self):
-        if self.file is None or self.file.len == 0:
-            return
-
-        super().update_state()
+    def update_state(self, elapsed):
+        super().update_state(elapsed)
 
-        if self.state["speed"] == 0:
+        if self.file is None or self.file.len == 0 or self.is_loading:
             return
 
         # Load more lines when getting to the bottom of the image
@@ -111,5 +112,3 @@ class ScrollableTextFile(Scrollable):
                 args=(last_line_loaded, self.LINES_PER_IMAGE),
                 daemon=True,
             ).start()
-
-        self.state.update({"image": self.image_array.image})
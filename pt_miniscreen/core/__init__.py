@@ -1,2 +1,2 @@
 from .app import App
-from .component import Component
+from .component import Component, batch
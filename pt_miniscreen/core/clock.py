@@ -0,0 +1,117 @@
+import logging
+import threading
+from time import monotonic, sleep
+from weakref import WeakMethod, ref
+
+logger = logging.getLogger(__name__)
+
+
+class FrameCallback:
+    def __init__(self, clock, callback, active_event=None):
+        self._get_clock = ref(clock)
+        self.get_active_event = ref(active_event) if active_event else lambda: None
+        self.last_frame_time = None
+        self.cancelled = False
+
+        # Use a WeakMethod to store the callback so that the clock does not
+        # produce a circular reference with the Component that created it which
+        # would result in memory leaks.
+        self._get_callback = WeakMethod(callback)
+
+    @property
+    def callback(self):
+        return self._get_callback()
+
+    @property
+    def paused(self):
+        active_event = self.get_active_event()
+        return isinstance(active_event, threading.Event) and not active_event.is_set()
+
+    def cancel(self):
+        self.cancelled = True
+        clock = self._get_clock()
+        if clock is not None:
+            clock.unsubscribe(self)
+
+
+class FrameClock:
+    """Calls subscribed callbacks once per frame from a single thread.
+
+    Callbacks are passed the number of seconds elapsed since they were last
+    called so that animations can be driven by time rather than by the number
+    of frames. The clock thread sleeps while there are no subscribers, so an
+    idle app does not wake up at all.
+    """
+
+    def __init__(self, frame_time=1 / 30):
+        self.frame_time = frame_time
+        self._callbacks = []
+        self._condition = threading.Condition()
+        self._thread = None
+
+    @property
+    def running(self):
+        return len(self._callbacks) > 0
+
+    def subscribe(self, callback, active_event=None):
+        frame_callback = FrameCallback(self, callback, active_event=active_event)
+
+        with self._condition:
+            self._callbacks.append(frame_callback)
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+            # wake the clock thread if it is waiting for subscribers
+            if len(self._callbacks) == 1:
+                self._condition.notify()
+
+        return frame_callback
+
+    def unsubscribe(self, frame_callback):
+        with self._condition:
+            if frame_callback in self._callbacks:
+                self._callbacks.remove(frame_callback)
+
+    def _tick(self, frame_callback, now):
+        callback = frame_callback.callback
+        if callback is None:
+            # owner has been garbage collected
+            self.unsubscribe(frame_callback)
+            return
+
+        # don't count time spent paused as elapsed time
+        if frame_callback.paused:
+            frame_callback.last_frame_time = None
+            return
+
+        last_frame_time = frame_callback.last_frame_time
+        frame_callback.last_frame_time = now
+        elapsed = self.frame_time if last_frame_time is None else now - last_frame_time
+
+        try:
+            callback(elapsed)
+        except Exception as e:
+            logger.error(f"Error in frame callback {callback}: {e}")
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self.running)
+                callbacks = list(self._callbacks)
+
+            start_time = monotonic()
+            for frame_callback in callbacks:
+                if not frame_callback.cancelled:
+                    self._tick(frame_callback, start_time)
+
+            execution_time = monotonic() - start_time
+            if execution_time > self.frame_time:
+                logger.debug(f"Frame took {execution_time}s, dropping frames")
+
+            sleep(max(self.frame_time - execution_time, 0))
+
+
+# Components share a single clock so that animations don't each need a thread
+frame_clock = FrameClock()
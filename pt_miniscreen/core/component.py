@@ -1,11 +1,14 @@
 import logging
 import threading
+from collections.abc import Mapping
+from contextlib import contextmanager
 from time import sleep, time
 from typing import Any, Dict
 from weakref import WeakMethod, ref
 
 from PIL import Image
 
+from .clock import frame_clock
 from .utils import is_same_image
 
 logger = logging.getLogger(__name__)
@@ -73,6 +76,40 @@ class Interval(threading.Timer):
             execution_time = start_time - time()
 
 
+# marks keys that were added by an update
+_MISSING = object()
+
+
+class PreviousState(Mapping):
+    """The state as it was before an update. The previous values of the keys
+    the update set are stored and the rest are read from the current state,
+    so the state doesn't have to be copied for every update. Keys the update
+    didn't set are only accurate until the next update, so they should be read
+    while the update is handled rather than kept for later."""
+
+    def __init__(self, state, previous_values, changed_keys):
+        self._state = state
+        self._previous_values = previous_values
+        self.changed_keys = frozenset(changed_keys)
+
+    def __getitem__(self, key):
+        value = self._previous_values.get(key, self._state.get(key, _MISSING))
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        for key in self._state:
+            if self._previous_values.get(key) is not _MISSING:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
 class State(dict):
     def __repr__(self) -> str:
         return dict.__repr__(self.copy())
@@ -88,11 +125,90 @@ class State(dict):
         super().__init__(initial_state)
 
     def update(self, *args, **kwargs):
-        previous_state = self.copy()
-        super().update(*args, **kwargs)
+        """Sets keys like `dict.update`, notifying the component if any of
+        them changed. Values that are the same object as, or equal to, the
+        current value aren't changes, so updating a key with an object that
+        was mutated in place doesn't rerender; pass a new object instead."""
+        previous_values = {}
+        changed_keys = []
+        for key, value in dict(*args, **kwargs).items():
+            previous_value = self.get(key, _MISSING)
+            previous_values[key] = previous_value
+
+            # identity is checked first so unchanged values, like a list of
+            # rows, aren't compared item by item
+            if value is not previous_value and value != previous_value:
+                changed_keys.append(key)
+
+            dict.__setitem__(self, key, value)
+
+        if not changed_keys:
+            return
+
         on_state_update = self._get_on_state_update()
         if callable(on_state_update):
-            on_state_update(previous_state)
+            on_state_update(PreviousState(self, previous_values, changed_keys))
+
+
+class Batch(threading.local):
+    """Collects the reconciles and rerenders requested by state updates made
+    in `batch` so they are each made once when it closes, deepest component
+    first, rather than once per update. Batches are per thread."""
+
+    def __init__(self):
+        self.depth = 0
+        self.pending = {}
+        self.running = None
+
+    def defer(self, callback) -> bool:
+        """Queues `callback` if a batch is open, returning whether it was."""
+        if not self.depth or callback == self.running:
+            return False
+
+        self.pending[callback] = callback
+        return True
+
+    def flush(self):
+        while self.pending:
+            # children rerender their parents so they are handled first
+            callback = max(self.pending, key=_get_callback_depth)
+            del self.pending[callback]
+
+            self.running = callback
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error in batched update {callback}: {e}")
+            finally:
+                self.running = None
+
+
+_batch = Batch()
+
+
+def _get_callback_depth(callback):
+    # callbacks that aren't a component's, like the app displaying a frame,
+    # are made last
+    owner = getattr(callback, "__self__", None)
+    return owner._get_depth() if isinstance(owner, Component) else -1
+
+
+@contextmanager
+def batch():
+    """Defers reconciling components whose state is updated in the block until
+    it closes, so several updates produce a single frame."""
+    _batch.depth += 1
+    try:
+        yield
+    finally:
+        _batch.depth -= 1
+        if _batch.depth == 0:
+            # updates made while flushing are part of the batch
+            _batch.depth += 1
+            try:
+                _batch.flush()
+            finally:
+                _batch.depth -= 1
 
 
 # Always create and return copies to prevent accidentally mutating the cache
@@ -133,6 +249,8 @@ class Component:
 
         self._children = []
         self._intervals = []
+        self._frame_callbacks = []
+        self._state_watchers = []
         self._render_cache = RenderCache()
         self._get_on_rerender = WeakMethod(on_rerender)
         self._state = State(
@@ -166,6 +284,12 @@ class Component:
 
             self._intervals = []
 
+        if hasattr(self, "_frame_callbacks"):
+            for frame_callback in self._frame_callbacks:
+                frame_callback.cancel()
+
+            self._frame_callbacks = []
+
         if hasattr(self, "_children"):
             for child in self._children:
                 child._cleanup()
@@ -241,13 +365,34 @@ class Component:
         return output
 
     def _on_state_update(self, previous_state):
-        if self.state != previous_state:
-            self.on_state_change(previous_state)
+        self.on_state_change(previous_state)
+
+        for keys, get_callback in list(self._state_watchers):
+            callback = get_callback()
+            if callable(callback) and keys & previous_state.changed_keys:
+                callback(previous_state)
+
+        if self.mounted:
+            self._reconcile()
 
-            if self.mounted:
-                self._reconcile()
+    def _get_depth(self):
+        depth = 0
+        component = self
+        parent = getattr(self._get_on_rerender(), "__self__", None)
+
+        # stop at a component that passes its rerenders to itself
+        while isinstance(parent, Component) and parent is not component:
+            depth += 1
+            component = parent
+            parent = getattr(parent._get_on_rerender(), "__self__", None)
+
+        return depth
 
     def _reconcile(self):
+        # updates made in a batch are reconciled once it closes
+        if _batch.defer(self._reconcile):
+            return
+
         if self._reconciliation_queued:
             # since state is always up-to-date we can let the queued reconcile
             # handle the rerender and ignore this one. This prevents the queue
@@ -275,7 +420,8 @@ class Component:
 
             # cache the new output and notify parent about the rerender
             self._render_cache.output = render_output
-            on_rerender()
+            if not _batch.defer(on_rerender):
+                on_rerender()
 
         finally:
             self._reconciliation_queued = False
@@ -286,6 +432,7 @@ class Component:
         pass
 
     def on_state_change(self, previous_state):
+        # previous_state.changed_keys holds the keys the update changed
         pass
 
     # external API
@@ -310,6 +457,20 @@ class Component:
         self._intervals.append(interval)
         return interval
 
+    def watch_state(self, keys, callback):
+        """Calls `callback` with the previous state after an update changes
+        any of `keys`, which can be a single key."""
+        if isinstance(keys, str):
+            keys = (keys,)
+
+        # stored as a WeakMethod to avoid a circular reference to self
+        self._state_watchers.append((frozenset(keys), WeakMethod(callback)))
+
+    def create_frame_callback(self, callback):
+        frame_callback = frame_clock.subscribe(callback, active_event=self.active_event)
+        self._frame_callbacks.append(frame_callback)
+        return frame_callback
+
     def remove_child(self, child):
         if child not in self._children:
             logger.warning(f"{self} tried to remove unknown child: {child}")
@@ -326,6 +487,16 @@ class Component:
         interval.cancel()
         self._intervals.remove(interval)
 
+    def remove_frame_callback(self, frame_callback):
+        if frame_callback not in self._frame_callbacks:
+            logger.warning(
+                f"{self} tried to remove frame callback it doesn't own {frame_callback}"
+            )
+            return
+
+        frame_callback.cancel()
+        self._frame_callbacks.remove(frame_callback)
+
     def render(self, image: Image.Image):
         raise NotImplementedError(
             "Component subclasses must implement the render method"
@@ -101,7 +101,7 @@ class Image(Component):
     def on_state_change(self, previous_state):
         # on loop change
         loop = self.state["loop"]
-        if self.state["loop"] != previous_state["loop"]:
+        if "loop" in previous_state.changed_keys:
             if loop and self._image.is_animated:
                 self._start_animating()
 
@@ -110,7 +110,7 @@ class Image(Component):
 
         # on image_path change
         image_path = self.state["image_path"]
-        if image_path != previous_state["image_path"]:
+        if "image_path" in previous_state.changed_keys:
             if self.stop_animating_event:
                 self.stop_animating_event.set()
 
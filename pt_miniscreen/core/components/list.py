@@ -1,19 +1,21 @@
 import logging
 import threading
+from collections import OrderedDict
 from math import ceil
 
 from PIL import Image, ImageDraw
 
-from ..component import Component
-from ..utils import apply_layers, layer, rectangle, transition
+from ..component import Component, batch
+from ..transition import Transition
+from ..utils import apply_layers, layer, rectangle
 
 logger = logging.getLogger(__name__)
 
 
 class List(Component):
     def cleanup(self):
-        if hasattr(self, "_cleanup_transition"):
-            self._cleanup_transition.set()
+        if getattr(self, "_transition", None):
+            self._transition.cancel()
 
     def __init__(
         self,
@@ -29,6 +31,7 @@ class List(Component):
         initial_top_row_index=0,
         visible_scrollbar=True,
         virtual=False,
+        max_warm_rows=0,
         initial_state={},
         **kwargs,
     ):
@@ -56,14 +59,20 @@ class List(Component):
         )
 
         self._virtual = virtual
+        self._max_warm_rows = max_warm_rows
+        self._warm_rows = OrderedDict()
+        self._row_indices = {}
         self._rows_snapshot = None
-        self._cleanup_transition = threading.Event()
+        self._transition = None
+        self._transition_lock = threading.RLock()
 
         # setup initial rows
-        num_rows = self.state["num_visible_rows"] if virtual else len(Rows)
-        start_index = self.state["top_row_index"] if virtual else 0
-        end_index = start_index + num_rows
-        self.rows = [self.create_child(Row) for Row in Rows[start_index:end_index]]
+        if virtual:
+            start_index = self.state["top_row_index"]
+            end_index = min(start_index + self.state["num_visible_rows"], len(Rows))
+            self.rows = [self._create_row(i) for i in range(start_index, end_index)]
+        else:
+            self.rows = [self.create_child(Row) for Row in Rows]
 
     @property
     def visible_scrollbar(self):
@@ -110,35 +119,112 @@ class List(Component):
     def invisible_rows(self):
         return list(filter(lambda row: row not in self.visible_rows, self.rows))
 
+    def _create_row(self, index):
+        row = self._warm_rows.pop(index, None)
+        if row is None:
+            row = self.create_child(self.state["Rows"][index])
+
+        self._row_indices[row] = index
+        return row
+
+    def _retire_row(self, row):
+        """Keep a virtual row that is no longer visible so it can be shown
+        again without being created, removing the least recently used rows
+        once more than `max_warm_rows` are kept. Rows that aren't rendered
+        are paused so warm rows don't do any work."""
+        index = self._row_indices.pop(row, None)
+        if index is None or self._max_warm_rows <= 0:
+            self.remove_child(row)
+            return
+
+        self._warm_rows[index] = row
+        while len(self._warm_rows) > self._max_warm_rows:
+            _, evicted_row = self._warm_rows.popitem(last=False)
+            self.remove_child(evicted_row)
+
+    def _clear_warm_rows(self):
+        for row in self._warm_rows.values():
+            self.remove_child(row)
+
+        self._warm_rows.clear()
+        self._row_indices.clear()
+
     def update_rows(self, rows):
+        # warm rows were created from the previous rows
+        self._clear_warm_rows()
         self.rows = [
             self.create_child(Row) for Row in rows[0 : self.state["num_visible_rows"]]
         ]
+        if self._virtual:
+            self._row_indices = {row: index for index, row in enumerate(self.rows)}
+
         self.state.update({"Rows": rows, "top_row_index": 0})
 
+    def patch_rows(self, rows, previous_indices):
+        """Replaces Rows with `rows` while keeping rows that were already
+        created. `previous_indices` maps the index of each row in `rows` that
+        is unchanged to its index in the current Rows, other rows are created
+        again. The top row stays at the top of the list if it is unchanged."""
+        with self._transition_lock, batch():
+            if self._transition is not None:
+                self._transition.finish()
+
+            new_indices = {old: new for new, old in previous_indices.items()}
+            top_row_index = self.state["top_row_index"]
+            max_top_row_index = max(len(rows) - self.state["num_visible_rows"], 0)
+            top_row_index = min(
+                new_indices.get(top_row_index, top_row_index), max_top_row_index
+            )
+
+            if self._virtual:
+                created_rows = {index: row for row, index in self._row_indices.items()}
+                created_rows.update(self._warm_rows)
+            else:
+                created_rows = dict(enumerate(self.rows))
+
+            def get_row(index):
+                row = created_rows.pop(previous_indices.get(index), None)
+                return row or self.create_child(rows[index])
+
+            if self._virtual:
+                end_index = min(
+                    top_row_index + self.state["num_visible_rows"], len(rows)
+                )
+                self.rows = [get_row(i) for i in range(top_row_index, end_index)]
+                self._row_indices = {
+                    row: index
+                    for index, row in zip(range(top_row_index, end_index), self.rows)
+                }
+
+                # warm rows that are unchanged are kept in the same order
+                warm_rows = OrderedDict()
+                for index in list(self._warm_rows):
+                    row = created_rows.get(index)
+                    if row is not None and index in new_indices:
+                        warm_rows[new_indices[index]] = created_rows.pop(index)
+                self._warm_rows = warm_rows
+            else:
+                self.rows = [get_row(i) for i in range(len(rows))]
+
+            for row in created_rows.values():
+                self.remove_child(row)
+
+            self.state.update({"Rows": rows, "top_row_index": top_row_index})
+
     def _remove_invisible_rows(self):
         for row in self.invisible_rows:
             self.rows.remove(row)
-            self.remove_child(row)
+            self._retire_row(row)
 
-    def _scroll_transition(self, distance):
-        # only animate transition if list has been rendered before
-        if self.height:
-            scroll_distance = self._get_rows_height(num_rows=distance)
-            for step in transition(
-                distance=scroll_distance,
-                duration=self.state["transition_duration"],
-            ):
-                if self._cleanup_transition.is_set():
-                    return
-
-                progress = self.state["transition_progress"]
-                progress_step = step / scroll_distance
-                self.state.update({"transition_progress": progress + progress_step})
+    def _on_transition_step(self, travelled):
+        progress = travelled / self._transition.distance
+        self.state.update({"transition_progress": progress})
 
+    def _on_transition_finish(self):
         if self._virtual:
             self._remove_invisible_rows()
 
+        self._transition = None
         self._rows_snapshot = None
         self.state.update(
             {
@@ -148,14 +234,75 @@ class List(Component):
             }
         )
 
+    def _extend_transition(self, distance):
+        direction = 1 if self.state["active_transition"] == "DOWN" else -1
+        transition_distance = self.state["transition_distance"] + distance
+        self._transition.extend(
+            self._get_rows_height(transition_distance) - self._transition.distance
+        )
+
+        # progress is relative to the new distance, so it is updated with it
+        # to keep the rows on screen where they are
+        self._rows_snapshot = None
+        self.state.update(
+            {
+                "top_row_index": self.state["top_row_index"] + direction * distance,
+                "transition_distance": transition_distance,
+                "transition_progress": self._transition.travelled
+                / self._transition.distance,
+            }
+        )
+
+    def _add_virtual_rows(self, direction, distance):
+        for i in range(distance):
+            if direction == "UP":
+                row_index = self.state["top_row_index"] - (i + 1)
+                self.rows.insert(0, self._create_row(row_index))
+            else:
+                row_index = self.state["top_row_index"] + (i + 1)
+                self.rows.append(
+                    self._create_row(row_index + self.state["num_visible_rows"] - 1)
+                )
+
     def scroll_to(self, direction, distance=1, animate=True):
-        if self.state["active_transition"] is not None:
-            logger.info(f"{self} currently scrolling, ignoring scroll")
-            return
+        # finishing a transition and starting the next one shows one frame
+        with self._transition_lock, batch():
+            self._scroll_to(direction, distance, animate)
 
+    def _scroll_to(self, direction, distance, animate):
         if distance == 0:
             return
 
+        if self._transition is not None:
+            # a scroll in the same direction extends the one in progress. If
+            # more than a row is still to be scrolled input is outpacing the
+            # animation, so the list jumps to where it is going instead
+            active_transition = self.state["active_transition"]
+            if (
+                animate
+                and direction == active_transition
+                and self._transition.remaining < self._get_rows_height(num_rows=1)
+            ):
+                can_scroll = (
+                    self.can_scroll_up(distance)
+                    if direction == "UP"
+                    else self.can_scroll_down(distance)
+                )
+                if not can_scroll:
+                    logger.info(
+                        f"{self} can't scroll distance {distance} {direction.lower()}, ignoring scroll"
+                    )
+                    return
+
+                if self._virtual:
+                    self._add_virtual_rows(direction, distance)
+
+                self._extend_transition(distance)
+                return
+
+            animate = animate and direction != active_transition
+            self._transition.finish()
+
         if direction == "UP":
             if not self.can_scroll_up(distance):
                 logger.info(
@@ -165,12 +312,6 @@ class List(Component):
 
             next_top_row_index = self.state["top_row_index"] - distance
 
-            if self._virtual:
-                for i in range(distance):
-                    row_index = self.state["top_row_index"] - (i + 1)
-                    Row = self.state["Rows"][row_index]
-                    self.rows.insert(0, self.create_child(Row))
-
         elif direction == "DOWN":
             if not self.can_scroll_down(distance):
                 logger.info(
@@ -180,24 +321,22 @@ class List(Component):
 
             next_top_row_index = self.state["top_row_index"] + distance
 
-            if self._virtual:
-                for i in range(distance):
-                    row_index = self.state["top_row_index"] + (i + 1)
-                    Row = self.state["Rows"][
-                        row_index + self.state["num_visible_rows"] - 1
-                    ]
-                    self.rows.append(self.create_child(Row))
+        if self._virtual:
+            self._add_virtual_rows(direction, distance)
 
         if not animate:
             # remove rows that are no longer visible if virtual
             if self._virtual:
                 if direction == "UP":
+                    hidden_rows = self.rows[self.state["num_visible_rows"] :]
                     self.rows = self.rows[: self.state["num_visible_rows"]]
 
                 if direction == "DOWN":
+                    hidden_rows = self.rows[:distance]
                     self.rows = self.rows[distance:]
 
-                self._remove_invisible_rows()
+                for row in hidden_rows:
+                    self._retire_row(row)
 
             self.state.update({"top_row_index": next_top_row_index})
             return
@@ -209,9 +348,19 @@ class List(Component):
                 "transition_distance": distance,
             }
         )
-        threading.Thread(
-            target=self._scroll_transition, args=[distance], daemon=True
-        ).start()
+
+        # only animate transition if list has been rendered before
+        if not self.height:
+            self._on_transition_finish()
+            return
+
+        self._transition = Transition(
+            distance=self._get_rows_height(num_rows=distance),
+            duration=self.state["transition_duration"],
+            on_step=self._on_transition_step,
+            on_finish=self._on_transition_finish,
+            lock=self._transition_lock,
+        )
 
     def scroll_up(self, distance=1, animate=True):
         self.scroll_to(direction="UP", distance=distance, animate=animate)
@@ -37,6 +37,7 @@ class MarqueeText(Text):
         )
 
         self._stop_scroll_event = None
+        self.watch_state(("text", "font"), self._on_text_change)
 
     @property
     def needs_scrolling(self) -> bool:
@@ -81,14 +82,10 @@ class MarqueeText(Text):
             if stop_event.is_set():
                 return
 
-    def on_state_change(self, prev_state):
+    def _on_text_change(self, prev_state):
         # restart scrolling to recreate carousel with new text size if needed
-        if (
-            self.state["text"] != prev_state["text"]
-            or self.state["font"] != prev_state["font"]
-        ):
-            if self.needs_scrolling:
-                self._restart_scrolling()
+        if self.needs_scrolling:
+            self._restart_scrolling()
 
     def render(self, image):
         if not self.scrolling and self.needs_scrolling:
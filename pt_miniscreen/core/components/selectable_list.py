@@ -2,6 +2,7 @@ import logging
 
 from PIL import ImageOps
 
+from ..component import batch
 from .list import List
 
 logger = logging.getLogger(__name__)
@@ -21,12 +22,9 @@ class SelectableList(List):
             },
         )
 
+        self._selected_row = None
         self._selected_row_unmodified_render = None
-        if len(self.rows) != 0:
-            self._selected_row_unmodified_render = self.selected_row.render
-            self.selected_row.render = lambda image: ImageOps.invert(
-                self._selected_row_unmodified_render(image).convert("L")
-            ).convert("1")
+        self._highlight_selected_row()
 
     @property
     def selected_row(self):
@@ -45,33 +43,40 @@ class SelectableList(List):
         return self.state["selected_index"] < len(self.state["Rows"])
 
     def select_row(self, index, animate_scroll=True):
-        if self.state["active_transition"] is not None:
-            logger.info(f"{self} selecting new row, ignoring select")
-            return
-
         if 0 > index or index >= len(self.state["Rows"]):
             logger.info(
                 f"select_row: Invalid index {index}, should be in range 0 - {len(self.state['Rows']) - 1}"
             )
             return
 
-        offset = index - self.state["top_row_index"]
-        if offset < 0:
-            self.scroll_to(direction="UP", distance=-offset, animate=animate_scroll)
-        elif offset >= self.state["num_visible_rows"]:
-            self.scroll_to(
-                direction="DOWN",
-                distance=1 + offset - self.state["num_visible_rows"],
-                animate=animate_scroll,
-            )
+        # scrolling and selecting the row show up in the same frame
+        with batch():
+            offset = index - self.state["top_row_index"]
+            if offset < 0:
+                self.scroll_to(direction="UP", distance=-offset, animate=animate_scroll)
+            elif offset >= self.state["num_visible_rows"]:
+                self.scroll_to(
+                    direction="DOWN",
+                    distance=1 + offset - self.state["num_visible_rows"],
+                    animate=animate_scroll,
+                )
+
+            self.state.update({"selected_index": index})
 
-        self.state.update({"selected_index": index})
+    def select_next_row(self, animate_scroll=True, distance=1):
+        # stop at the last row when moving more than one row
+        index = self.state["selected_index"] + distance
+        if distance > 1:
+            index = min(index, len(self.state["Rows"]) - 1)
 
-    def select_next_row(self, animate_scroll=True):
-        self.select_row(self.state["selected_index"] + 1, animate_scroll=animate_scroll)
+        self.select_row(index, animate_scroll=animate_scroll)
 
-    def select_previous_row(self, animate_scroll=True):
-        self.select_row(self.state["selected_index"] - 1, animate_scroll=animate_scroll)
+    def select_previous_row(self, animate_scroll=True, distance=1):
+        index = self.state["selected_index"] - distance
+        if distance > 1:
+            index = max(index, 0)
+
+        self.select_row(index, animate_scroll=animate_scroll)
 
     def _get_row_at_index(self, index):
         if len(self.rows) == 0:
@@ -93,20 +98,40 @@ class SelectableList(List):
         ]
         self.state.update({"Rows": rows, "top_row_index": 0, "selected_index": 0})
 
-    def on_state_change(self, previous_state):
-        selected_row = None
-        if previous_state["Rows"] != self.state["Rows"] and len(self.rows) > 0:
-            # Handle dynamic changes in state Rows; if rows changed, reset selection to the first
-            selected_row = self.rows[0]
-        elif previous_state["selected_index"] != self.state["selected_index"]:
+    def patch_rows(self, rows, previous_indices):
+        # keep the same row selected, or stay close to it if it changed
+        new_indices = {old: new for new, old in previous_indices.items()}
+        selected_index = self.state["selected_index"]
+        selected_index = new_indices.get(
+            selected_index, max(min(selected_index, len(rows) - 1), 0)
+        )
+
+        with batch():
+            super().patch_rows(rows, previous_indices)
+            self.select_row(selected_index, animate_scroll=False)
+
+    def _highlight_selected_row(self):
+        try:
             selected_row = self.selected_row
-            previous_row = self._get_row_at_index(previous_state["selected_index"])
-            previous_row.render = self._selected_row_unmodified_render
+        except IndexError:
+            # rows are being patched, the selected row is set after
+            selected_row = None
+
+        if selected_row is self._selected_row:
+            return
+
+        if self._selected_row is not None:
+            self._selected_row.render = self._selected_row_unmodified_render
 
-        if selected_row:
+        self._selected_row = selected_row
+        if selected_row is not None:
             self._selected_row_unmodified_render = selected_row.render
             selected_row.render = lambda image: ImageOps.invert(
                 self._selected_row_unmodified_render(image).convert("L")
             ).convert("1")
 
+    def on_state_change(self, previous_state):
+        if {"Rows", "selected_index"} & previous_state.changed_keys:
+            self._highlight_selected_row()
+
         return super().on_state_change(previous_state)
@@ -1,8 +1,8 @@
 import logging
 import threading
 
-from ..component import Component
-from ..utils import transition
+from ..component import Component, batch
+from ..transition import Transition
 
 logger = logging.getLogger(__name__)
 
@@ -18,12 +18,14 @@ class Stack(Component):
     }
 
     def cleanup(self):
-        self._cleanup_transition.set()
+        if self._transition:
+            self._transition.cancel()
 
     def __init__(self, initial_stack=[], **kwargs):
-        super().__init__(**kwargs)
+        self._transition = None
+        self._transition_lock = threading.RLock()
 
-        self._cleanup_transition = threading.Event()
+        super().__init__(**kwargs)
 
         # setup initial stack
         self.state["stack"] = [
@@ -57,84 +59,101 @@ class Stack(Component):
     def stack(self):
         return self.state["stack"]
 
-    def _push_transition(self):
-        # only animate transition if we know our width
-        if self.width:
-            for step in transition(self.width, self.transition_duration):
-                if self._cleanup_transition.is_set():
-                    return
+    def _on_push_step(self, travelled):
+        self.state.update({"x_position": self.width - int(travelled)})
 
-                self.state.update(
-                    {"x_position": min(self.width, self.state["x_position"] - step)}
-                )
+    def _on_push_finish(self):
+        self._transition = None
+        self.state.update({"active_transition": None, "x_position": 0})
 
-        self.state.update({"active_transition": None})
-
-    def _pop_transition(self, elements=1):
-        # only animate transition if we know our width
-        if self.width:
-            for step in transition(self.width * elements, self.transition_duration):
-                if self._cleanup_transition.is_set():
-                    return
-
-                self.state.update(
-                    {
-                        "x_position": min(
-                            self.width * elements, self.state["x_position"] + step
-                        )
-                    }
-                )
+    def _on_pop_step(self, travelled):
+        self.state.update({"x_position": int(travelled)})
 
+    def _on_pop_finish(self):
+        self._transition = None
         stack = self.state["stack"]
-        for _ in range(elements):
+        for _ in range(self.state["elements_to_pop"]):
             self.remove_child(stack.pop())
         self.state.update(
             {"stack": stack, "active_transition": None, "elements_to_pop": 0}
         )
 
+    def _start_transition(self, on_step, on_finish, elements=1):
+        # only animate transition if we know our width
+        if not self.width:
+            on_finish()
+            return
+
+        self._transition = Transition(
+            distance=self.width * elements,
+            duration=self.transition_duration,
+            on_step=on_step,
+            on_finish=on_finish,
+            lock=self._transition_lock,
+        )
+
     @property
     def is_popping(self):
         return self.state.get("active_transition") == "POP"
 
     def push(self, Component, animate=True):
-        if self.state["active_transition"] is not None:
-            logger.debug(f"Currently transitioning, ignoring push of {Component}")
-            return
-
-        # create new stack
-        stack = self.state["stack"] + [self.create_child(Component)]
-
-        if not animate:
-            logger.debug(f"Pushing component {Component} without transition")
-            self.state.update({"stack": stack})
-            return
-
-        logger.debug(f"Starting a new push transition with component {Component}")
-        self.state.update(
-            {
-                "active_transition": "PUSH",
-                "x_position": self.width or 0,  # use 0 if self.width is None
-                "stack": stack,
-            }
-        )
+        # finishing a transition and starting the next one shows one frame
+        with self._transition_lock, batch():
+            # a new transition starts from where the current one is going
+            if self._transition is not None:
+                logger.debug(f"Finishing transition to push {Component}")
+                self._transition.finish()
+
+            # create new stack
+            stack = self.state["stack"] + [self.create_child(Component)]
+
+            if not animate:
+                logger.debug(f"Pushing component {Component} without transition")
+                self.state.update({"stack": stack})
+                return
+
+            logger.debug(f"Starting a new push transition with component {Component}")
+            self.state.update(
+                {
+                    "active_transition": "PUSH",
+                    "x_position": self.width or 0,  # use 0 if self.width is None
+                    "stack": stack,
+                }
+            )
 
-        threading.Thread(target=self._push_transition, daemon=True).start()
+            self._start_transition(self._on_push_step, self._on_push_finish)
 
     def pop(self, animate=True, elements=1):
-        if self.state["active_transition"] is not None:
-            logger.debug("Currently transitioning, ignoring pop")
-            return
+        with self._transition_lock, batch():
+            self._pop(animate, elements)
 
-        if len(self.state["stack"]) == 0:
+    def _pop(self, animate, elements):
+        # components already being popped can't be popped again
+        stack_size = len(self.state["stack"]) - self.state["elements_to_pop"]
+
+        if stack_size == 0:
             logger.debug("Unable to pop since stack is empty, ignoring pop")
             return
 
-        if len(self.state["stack"]) < elements:
+        if stack_size < elements:
             logger.debug(
-                f"Unable top pop {elements} elements, stack has {len(self.state['stack'])} elements"
+                f"Unable top pop {elements} elements, stack has {stack_size} elements"
             )
             return
 
+        if self._transition is not None:
+            # popping while popping carries on sliding further to the right
+            if animate and self.state["active_transition"] == "POP":
+                logger.debug(f"Extending pop transition by {elements} elements")
+                self._transition.extend(self.width * elements)
+                self.state.update(
+                    {"elements_to_pop": self.state["elements_to_pop"] + elements}
+                )
+                return
+
+            logger.debug("Finishing transition to pop")
+            self._transition.finish()
+
         if not animate:
             logger.debug("Popping component without transition")
             stack = self.state["stack"].copy()
@@ -152,9 +171,7 @@ class Stack(Component):
             }
         )
 
-        threading.Thread(
-            target=self._pop_transition, args=(elements,), daemon=True
-        ).start()
+        self._start_transition(self._on_pop_step, self._on_pop_finish, elements)
 
     def render(self, image):
         if len(self.state["stack"]) == 0:
@@ -0,0 +1,97 @@
+import heapq
+import itertools
+import logging
+import threading
+from time import monotonic
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduledCall:
+    def __init__(self, scheduler, when, callback):
+        self._scheduler = scheduler
+        self.when = when
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        self._scheduler.cancel(self)
+
+
+class Scheduler:
+    """Calls callbacks at given times from a single thread.
+
+    Calls are kept in a heap ordered by when they are due and the thread
+    sleeps until the first one is due, so scheduling or cancelling a call
+    doesn't create a thread and nothing wakes up while no calls are due.
+    Callbacks should be quick as they delay every call after them.
+    """
+
+    def __init__(self):
+        self._calls = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def call_at(self, when, callback) -> ScheduledCall:
+        """Calls `callback` once `monotonic()` reaches `when`."""
+        call = ScheduledCall(self, when, callback)
+
+        with self._condition:
+            # the counter keeps calls due at the same time in order
+            heapq.heappush(self._calls, (when, next(self._counter), call))
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+            # wake the thread so it waits for this call if it is due first
+            self._condition.notify()
+
+        return call
+
+    def call_later(self, delay, callback) -> ScheduledCall:
+        return self.call_at(monotonic() + delay, callback)
+
+    def cancel(self, call):
+        # cancelled calls are skipped rather than removed from the heap
+        with self._condition:
+            call.cancelled = True
+
+    @property
+    def pending(self):
+        with self._condition:
+            return sum(1 for _, _, call in self._calls if not call.cancelled)
+
+    def _next_due_call(self):
+        with self._condition:
+            while True:
+                while self._calls and self._calls[0][2].cancelled:
+                    heapq.heappop(self._calls)
+
+                if not self._calls:
+                    self._condition.wait()
+                    continue
+
+                when, _, call = self._calls[0]
+                timeout = when - monotonic()
+                if timeout <= 0:
+                    heapq.heappop(self._calls)
+                    return call
+
+                self._condition.wait(timeout)
+
+    def _run(self):
+        while True:
+            call = self._next_due_call()
+            if call.cancelled:
+                continue
+
+            try:
+                call.callback()
+            except Exception as e:
+                logger.error(f"Error in scheduled call {call.callback}: {e}")
+
+
+# the app shares a single scheduler so timeouts don't each need a thread
+scheduler = Scheduler()
@@ -0,0 +1,89 @@
+import logging
+import threading
+from math import ceil
+
+from .clock import frame_clock
+
+logger = logging.getLogger(__name__)
+
+
+class Transition:
+    """Moves through `distance` pixels over `duration` seconds on the frame
+    clock.
+
+    A running transition can be retargeted: `extend` adds to the distance and
+    the rest of it is covered in a new `duration`, so the animation speeds up
+    to keep up with input rather than queueing behind it, and `finish` jumps
+    straight to the end. `on_step` is passed the distance travelled so far
+    and `on_finish` is called once the whole distance has been travelled.
+
+    Callbacks are made with `lock` held, owners that change the state a
+    transition animates should hold the same lock while doing so.
+    """
+
+    def __init__(self, distance, duration, on_step, on_finish, lock=None, clock=None):
+        self.distance = distance
+        self.duration = duration
+        self.travelled = 0
+        self.finished = False
+        self.lock = lock or threading.RLock()
+
+        self._on_step = on_step
+        self._on_finish = on_finish
+        self._start = 0
+        self._elapsed = 0
+
+        self._frame_callback = (clock or frame_clock).subscribe(self._tick)
+
+    @property
+    def remaining(self):
+        return self.distance - self.travelled
+
+    def extend(self, distance):
+        with self.lock:
+            if self.finished:
+                return
+
+            # cover what's left from where the animation is now
+            self.distance += distance
+            self._start = self.travelled
+            self._elapsed = 0
+
+    def finish(self):
+        with self.lock:
+            if self.finished:
+                return
+
+            self.travelled = self.distance
+            self._on_step(self.travelled)
+            self._finish()
+
+    def cancel(self):
+        with self.lock:
+            self.finished = True
+            self._frame_callback.cancel()
+
+    def _finish(self):
+        self.finished = True
+        self._frame_callback.cancel()
+        self._on_finish()
+
+    def _tick(self, elapsed):
+        with self.lock:
+            if self.finished:
+                return
+
+            self._elapsed += elapsed
+            if self.duration and self._elapsed < self.duration:
+                # move in whole pixels, rounding up so every frame moves. Float
+                # error is rounded away first so it doesn't add a pixel
+                progress = self._elapsed / self.duration
+                travelled = self._start + (self.distance - self._start) * progress
+                self.travelled = min(ceil(round(travelled, 6)), self.distance)
+            else:
+                self.travelled = self.distance
+
+            self._on_step(self.travelled)
+
+            if self.travelled == self.distance:
+                self._finish()
@@ -0,0 +1,192 @@
+import logging
+import threading
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Callable, Deque, List
+
+from pt_miniscreen.utils import ButtonEvents
+
+logger = logging.getLogger(__name__)
+
+# releases that move through a list, the value is the direction they move in
+NAVIGATION_EVENTS = {ButtonEvents.UP_RELEASE: -1, ButtonEvents.DOWN_RELEASE: 1}
+SCROLL_PRESS_EVENTS = (ButtonEvents.UP_PRESS, ButtonEvents.DOWN_PRESS)
+
+# events handled without the display changing within this long are not
+# counted as they didn't produce a frame
+MAX_LATENCY = 1
+
+LATENCY_LOG_INTERVAL = 100  # events
+
+
+@dataclass
+class InputEvent:
+    button_event: ButtonEvents
+    time: float = field(default_factory=monotonic)
+
+
+class LatencyHistogram:
+    """Counts latencies in buckets, which are the upper bounds in seconds."""
+
+    BUCKETS = (0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, MAX_LATENCY)
+
+    def __init__(self):
+        self.counts = [0] * len(self.BUCKETS)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, latency: float):
+        with self._lock:
+            bucket = min(bisect_left(self.BUCKETS, latency), len(self.BUCKETS) - 1)
+            self.counts[bucket] += 1
+            self.count += 1
+            self.total += latency
+            self.max = max(self.max, latency)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Returns the upper bound of the bucket the percentile is in."""
+        with self._lock:
+            if not self.count:
+                return 0.0
+
+            target = self.count * percent / 100
+            seen = 0
+            for bound, count in zip(self.BUCKETS, self.counts):
+                seen += count
+                if seen >= target:
+                    return bound
+
+            return self.BUCKETS[-1]
+
+    def summary(self) -> str:
+        return (
+            f"{self.count} events, mean {self.mean * 1000:.1f}ms, "
+            f"p50 <={self.percentile(50) * 1000:.0f}ms, "
+            f"p95 <={self.percentile(95) * 1000:.0f}ms, "
+            f"max {self.max * 1000:.1f}ms"
+        )
+
+
+class InputDispatcher:
+    """Handles button events in order from a single thread.
+
+    Buttons only have to queue an event so their callbacks return straight
+    away. Navigation queued while an earlier event is being handled is
+    combined, so pressing down three times while the display catches up
+    moves down three rows in one step. Lists extend a running transition
+    when they are navigated again, so it isn't held until they stop.
+
+    The time from each event being queued to the frame showing its result
+    being sent to the display is recorded in `latency`.
+    """
+
+    def __init__(
+        self,
+        handle: Callable[[ButtonEvents, int], None],
+        can_combine_navigation: Callable[[], bool] = lambda: False,
+    ):
+        self._handle = handle
+        self._can_combine_navigation = can_combine_navigation
+        self._events: Deque[InputEvent] = deque()
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._awaiting_frame: List[float] = []
+        self.latency = LatencyHistogram()
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def put(self, button_event: ButtonEvents):
+        with self._condition:
+            self._events.append(InputEvent(button_event))
+            self._condition.notify()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._events.clear()
+            self._condition.notify()
+
+    def frame_displayed(self):
+        """Records the latency of events handled since the last frame."""
+        now = monotonic()
+        with self._condition:
+            event_times = self._awaiting_frame
+            self._awaiting_frame = []
+
+        for event_time in event_times:
+            if now - event_time <= MAX_LATENCY:
+                self.latency.record(now - event_time)
+                if self.latency.count % LATENCY_LOG_INTERVAL == 0:
+                    logger.info(f"Input latency: {self.latency.summary()}")
+
+    def _next_event(self):
+        with self._condition:
+            self._condition.wait_for(lambda: self._events or self._stopped)
+            if self._stopped:
+                return None
+            return self._events.popleft()
+
+    def _combine_navigation(self, event: InputEvent):
+        """Removes the navigation events queued after `event` and returns the
+        direction and distance they move in total, with their times."""
+        distance = NAVIGATION_EVENTS[event.button_event]
+        event_times = [event.time]
+
+        with self._condition:
+            while self._events:
+                next_event = self._events[0]
+
+                # presses do nothing when navigating so can be dropped
+                if next_event.button_event in SCROLL_PRESS_EVENTS:
+                    self._events.popleft()
+                    continue
+
+                if next_event.button_event not in NAVIGATION_EVENTS:
+                    break
+
+                self._events.popleft()
+                distance += NAVIGATION_EVENTS[next_event.button_event]
+                event_times.append(next_event.time)
+
+        return distance, event_times
+
+    def _dispatch(self, event: InputEvent):
+        button_event = event.button_event
+        distance = 1
+        event_times = [event.time]
+
+        if button_event in NAVIGATION_EVENTS and self._can_combine_navigation():
+            distance, event_times = self._combine_navigation(event)
+            if distance == 0:
+                # presses cancelled each other out
+                return
+
+            button_event = (
+                ButtonEvents.DOWN_RELEASE if distance > 0 else ButtonEvents.UP_RELEASE
+            )
+            distance = abs(distance)
+
+        with self._condition:
+            self._awaiting_frame.extend(event_times)
+
+        self._handle(button_event, distance)
+
+    def _run(self):
+        while True:
+            event = self._next_event()
+            if event is None:
+                return
+
+            try:
+                self._dispatch(event)
+            except Exception as e:
+                logger.error(f"Error handling {event.button_event}: {e}")
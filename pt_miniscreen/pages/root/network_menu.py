@@ -1,12 +1,7 @@
 import logging
 
 from pt_miniscreen.components.menu_page import MenuPage
-from pt_miniscreen.pages.network.ap import APPage
-from pt_miniscreen.pages.network.ethernet import EthernetPage
-from pt_miniscreen.pages.network.mac_addresses import MacAddressesPage
-from pt_miniscreen.pages.network.usb import USBPage
-from pt_miniscreen.pages.network.wifi import WifiPage
-from pt_miniscreen.utils import get_image_file_path
+from pt_miniscreen.utils import LazyComponent, get_image_file_path
 
 logger = logging.getLogger(__name__)
 
@@ -17,5 +12,13 @@ class NetworkMenuPage(MenuPage):
             **kwargs,
             text="Network",
             image_path=get_image_file_path("menu/network.gif"),
-            Pages=[WifiPage, EthernetPage, APPage, USBPage, MacAddressesPage]
+            Pages=[
+                LazyComponent("pt_miniscreen.pages.network.wifi", "WifiPage"),
+                LazyComponent("pt_miniscreen.pages.network.ethernet", "EthernetPage"),
+                LazyComponent("pt_miniscreen.pages.network.ap", "APPage"),
+                LazyComponent("pt_miniscreen.pages.network.usb", "USBPage"),
+                LazyComponent(
+                    "pt_miniscreen.pages.network.mac_addresses", "MacAddressesPage"
+                ),
+            ]
         )
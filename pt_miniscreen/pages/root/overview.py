@@ -5,7 +5,7 @@ from math import ceil
 from pitop.battery import Battery
 from pitop.common.sys_info import get_pi_top_ip
 
-from pt_miniscreen.core import Component
+from pt_miniscreen.core import Component, batch
 from pt_miniscreen.core.components.image import Image
 from pt_miniscreen.core.components.text import Text
 from pt_miniscreen.core.utils import apply_layers, layer, rectangle
@@ -13,6 +13,7 @@ from pt_miniscreen.utils import get_image_file_path
 from pt_miniscreen.components.mixins import Enterable, HasGutterIcons
 from pt_miniscreen.core.components.marquee_text import MarqueeText
 from pt_miniscreen.pages.root.bluetooth_pairing import BluetoothPairingPage
+from pt_miniscreen.services.packages import package_index
 
 logger = logging.getLogger(__name__)
 
@@ -73,14 +74,7 @@ def offset_pos_for_vertical_center(page_height, height: int) -> int:
 
 
 def package_is_installed(package_name: str) -> bool:
-    try:
-        import apt
-
-        cache = apt.Cache()
-        package = cache.get(package_name)
-        return package.is_installed
-    except Exception:
-        return False
+    return package_index.is_installed(package_name)
 
 
 class OverviewPageBase(Component):
@@ -129,9 +123,10 @@ class OverviewPageBase(Component):
         battery.when_discharging = None
 
     def update_battery_properties(self):
-        self.capacity_text.state.update({"text": get_capacity_text()})
-        self.battery_image.state.update({"image_path": get_battery_image_path()})
-        self.state.update({"capacity_size": get_capacity_size()})
+        with batch():
+            self.capacity_text.state.update({"text": get_capacity_text()})
+            self.battery_image.state.update({"image_path": get_battery_image_path()})
+            self.state.update({"capacity_size": get_capacity_size()})
 
     def render(self, image):
         BATTERY_OFFSET = -10  # offset from the vertical center of the page
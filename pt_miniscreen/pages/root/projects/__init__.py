@@ -1,2 +1,15 @@
-from .project_page import ProjectPage
-from .menu_page import ProjectsMenuPage
+import importlib
+
+# import pages when they are first used as they pull in the project runner
+_lazy_imports = {
+    "ProjectPage": ".project_page",
+    "ProjectsMenuPage": ".menu_page",
+}
+
+
+def __getattr__(name):
+    if name not in _lazy_imports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(_lazy_imports[name], __name__)
+    return getattr(module, name)
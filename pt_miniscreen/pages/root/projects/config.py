@@ -1,8 +1,10 @@
 import configparser
 import logging
 from pathlib import Path
+from typing import Optional
 from pt_miniscreen.utils import get_image_file_path
 from pt_miniscreen.pages.root.projects.enums import ProjectExitCondition
+from pt_miniscreen.pages.root.projects.limits import ProjectLimits
 from pt_miniscreen.pages.root.projects.utils import InvalidConfigFile
 
 logger = logging.getLogger(__name__)
@@ -18,6 +20,7 @@ class ProjectConfig:
         image: str,
         start: str,
         exit_condition: str,
+        limits: Optional[ProjectLimits] = None,
         **kwargs,
     ) -> None:
         self.file = file
@@ -29,6 +32,7 @@ class ProjectConfig:
         self.image = image
         self.start = start
         self.exit_condition = exit_condition
+        self.limits = limits if limits else ProjectLimits()
 
     @classmethod
     def from_file(cls, file):
@@ -50,6 +54,7 @@ class ProjectConfig:
                 image=project_config.get("image", ""),
                 start=project_config["start"],
                 exit_condition=exit_condition,
+                limits=ProjectLimits.from_config(project_config),
             )
         except Exception as e:
             logger.warning(f"Error parsing file '{file}': {e}")
@@ -8,6 +8,7 @@ class ProjectState(Enum):
     RUNNING_WITH_CLEAR_SCREEN = auto()
     STOPPING = auto()
     ERROR = auto()
+    ALREADY_RUNNING = auto()
 
 
 class ProjectExitCondition(Enum):
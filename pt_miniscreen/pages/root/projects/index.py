@@ -0,0 +1,343 @@
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from enum import Enum, auto
+from time import sleep
+from typing import Dict, List, Optional, Tuple
+
+from pt_miniscreen.pages.root.projects.config import ProjectConfig
+from pt_miniscreen.pages.root.projects.utils import InvalidConfigFile
+from pt_miniscreen.services.subscription import Publisher, Subscription
+
+logger = logging.getLogger(__name__)
+
+PROJECT_CONFIG_FILENAME = "project.cfg"
+
+
+def _stat(path: str) -> Optional[os.stat_result]:
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+@dataclass
+class DirectoryListing:
+    mtime: int
+    # (path, is_directory) tuples in the order returned by the filesystem
+    entries: List[Tuple[str, bool]] = field(default_factory=list)
+
+
+@dataclass
+class CachedConfig:
+    key: Tuple[int, int]
+    config: Optional[ProjectConfig]
+
+
+class ProjectChangeType(Enum):
+    ADDED = auto()
+    REMOVED = auto()
+    MODIFIED = auto()
+
+
+@dataclass
+class ProjectChange:
+    type: ProjectChangeType
+    file: str
+    # modification time of the config, None for removed projects
+    mtime: Optional[int] = None
+
+
+@dataclass
+class WatchedDirectory:
+    mtime: int
+    # (mtime, size) of the project config in the directory
+    config_key: Optional[Tuple[int, int]]
+    subdirectories: List[str] = field(default_factory=list)
+
+
+def get_project_changes(
+    previous_snapshot: Dict[str, Tuple[int, int]],
+    snapshot: Dict[str, Tuple[int, int]],
+) -> List[ProjectChange]:
+    changes = [
+        ProjectChange(ProjectChangeType.REMOVED, file)
+        for file in previous_snapshot
+        if file not in snapshot
+    ]
+    for file, key in snapshot.items():
+        if file not in previous_snapshot:
+            changes.append(ProjectChange(ProjectChangeType.ADDED, file, key[0]))
+        elif previous_snapshot[file] != key:
+            changes.append(ProjectChange(ProjectChangeType.MODIFIED, file, key[0]))
+
+    return changes
+
+
+class DirectoryWatcher(Publisher):
+    """Publishes a list of ProjectChanges when project configs are added to,
+    removed from or modified in a directory.
+
+    Checking only stats the directories being watched and the project configs
+    in them. A directory is only listed again when its modification time
+    changes, which happens when a project is created or removed. Configs are
+    stat'ed on every check since editing one in place doesn't change the
+    modification time of its directory.
+
+    Each subscriber is sent the changes since the snapshot it last saw, and
+    only while it is active, so a list that was hidden gets a single list of
+    changes when it is shown again rather than every change made meanwhile.
+    """
+
+    def __init__(self, index, directory: str, recurse: bool = False):
+        super().__init__()
+        self.index = index
+        self.directory = directory
+        self.recurse = recurse
+        self._directories: Dict[str, WatchedDirectory] = {}
+        self._snapshot = self._scan()
+        self._seen_snapshots: Dict[Subscription, Dict[str, Tuple[int, int]]] = {}
+
+    @property
+    def has_subscribers(self):
+        with self._condition:
+            return len(self._subscriptions) > 0
+
+    def subscribe(self, callback, active_event=None) -> Subscription:
+        with self._condition:
+            subscription = super().subscribe(callback, active_event=active_event)
+            self._seen_snapshots[subscription] = self._snapshot
+
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._condition:
+            super().unsubscribe(subscription)
+            self._seen_snapshots.pop(subscription, None)
+
+    def _get_config_key(self, directory: str, is_root: bool):
+        if not self.recurse and is_root:
+            return None
+
+        stat = _stat(os.path.join(directory, PROJECT_CONFIG_FILENAME))
+        return None if stat is None else (stat.st_mtime_ns, stat.st_size)
+
+    def _read_directory(self, directory: str, mtime: int, is_root: bool):
+        config_key = self._get_config_key(directory, is_root)
+        subdirectories = []
+        if self.recurse or is_root:
+            subdirectories = [
+                path
+                for path, is_directory in self.index.list_directory(directory)
+                if is_directory
+            ]
+
+        return WatchedDirectory(mtime, config_key, subdirectories)
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        """Returns the (mtime, size) of each project config being watched."""
+        snapshot = {}
+        directories = {}
+        pending = [(self.directory, True)]
+
+        while pending:
+            directory, is_root = pending.pop()
+            stat = _stat(directory)
+            if stat is None:
+                continue
+
+            watched = self._directories.get(directory)
+            if watched is None or watched.mtime != stat.st_mtime_ns:
+                watched = self._read_directory(directory, stat.st_mtime_ns, is_root)
+            else:
+                watched.config_key = self._get_config_key(directory, is_root)
+
+            directories[directory] = watched
+            if watched.config_key is not None:
+                file = os.path.join(directory, PROJECT_CONFIG_FILENAME)
+                snapshot[file] = watched.config_key
+
+            pending.extend((path, False) for path in watched.subdirectories)
+
+        self._directories = directories
+        return snapshot
+
+    def check(self) -> List[ProjectChange]:
+        snapshot = self._scan()
+        changes = get_project_changes(self._snapshot, snapshot)
+        if changes:
+            self._snapshot = snapshot
+
+        for subscription in self.active_subscriptions:
+            with self._condition:
+                seen_snapshot = self._seen_snapshots.get(subscription)
+                if seen_snapshot is None or seen_snapshot is self._snapshot:
+                    continue
+                self._seen_snapshots[subscription] = self._snapshot
+
+            subscription_changes = get_project_changes(seen_snapshot, self._snapshot)
+            if subscription_changes:
+                self.publish(subscription_changes, [subscription])
+
+        return changes
+
+
+class ProjectIndex:
+    """Cache of project directory listings and parsed project configs.
+
+    Directory listings are keyed on the directory's modification time and
+    configs on the modification time and size of their file, so revalidating
+    the index only costs a stat per directory and project. Only directories
+    and configs that changed are read again.
+    """
+
+    def __init__(self, watch_interval: float = 1):
+        self.watch_interval = watch_interval
+        self._lock = threading.RLock()
+        self._listings: Dict[str, DirectoryListing] = {}
+        self._configs: Dict[str, CachedConfig] = {}
+        self._watchers: Dict[Tuple[str, bool], DirectoryWatcher] = {}
+        self._watch_condition = threading.Condition()
+        self._watch_thread = None
+
+    def list_directory(self, directory: str) -> List[Tuple[str, bool]]:
+        directory = str(directory)
+        stat = _stat(directory)
+
+        with self._lock:
+            if stat is None:
+                self._listings.pop(directory, None)
+                return []
+
+            listing = self._listings.get(directory)
+            if listing and listing.mtime == stat.st_mtime_ns:
+                return listing.entries
+
+            entries = []
+            try:
+                with os.scandir(directory) as iterator:
+                    for entry in iterator:
+                        entries.append((entry.path, entry.is_dir()))
+            except OSError as e:
+                logger.warning(f"Unable to list {directory}: {e}")
+
+            self._listings[directory] = DirectoryListing(stat.st_mtime_ns, entries)
+            return entries
+
+    def get_config(self, file: str) -> Optional[ProjectConfig]:
+        """Returns the parsed config in `file`, or None if it is missing or
+        invalid."""
+        file = str(file)
+        stat = _stat(file)
+
+        with self._lock:
+            if stat is None:
+                self._configs.pop(file, None)
+                return None
+
+            key = (stat.st_mtime_ns, stat.st_size)
+            cached = self._configs.get(file)
+            if cached and cached.key == key:
+                return cached.config
+
+            try:
+                logger.info(f"Trying to read {file}")
+                config = ProjectConfig.from_file(file)
+                logger.info(f"Found project {config.title}")
+            except InvalidConfigFile as e:
+                logger.error(f"Error parsing {file}: {e}")
+                config = None
+
+            self._configs[file] = CachedConfig(key, config)
+            return config
+
+    def get_project_files(self, directory: str) -> List[Tuple[str, int]]:
+        """Returns (file, mtime) tuples for the project configs found in the
+        subdirectories of `directory`, most recently modified first."""
+        files = []
+        for path, is_directory in self.list_directory(directory):
+            if not is_directory:
+                continue
+
+            file = os.path.join(path, PROJECT_CONFIG_FILENAME)
+            stat = _stat(file)
+            if stat is not None:
+                files.append((file, stat.st_mtime_ns))
+
+        return sorted(files, key=lambda file: file[1], reverse=True)
+
+    def get_projects(self, directory: str) -> List[ProjectConfig]:
+        configs = [
+            self.get_config(file) for file, _ in self.get_project_files(directory)
+        ]
+        return [config for config in configs if config is not None]
+
+    def contains_projects(self, directory: str, recurse: bool = False) -> bool:
+        for file, _ in self.get_project_files(directory):
+            if self.get_config(file):
+                return True
+
+        if not recurse:
+            return False
+
+        for path, is_directory in self.list_directory(directory):
+            if is_directory and self.contains_projects(path, recurse=True):
+                return True
+
+        return False
+
+    def get_entries_by_mtime(self, directory: str) -> List[str]:
+        entries = []
+        for path, _ in self.list_directory(directory):
+            stat = _stat(path)
+            if stat is not None:
+                entries.append((path, stat.st_mtime))
+
+        return [path for path, _ in sorted(entries, key=lambda entry: entry[1])]
+
+    def watch(
+        self, directory: str, callback, active_event=None, recurse: bool = False
+    ) -> Subscription:
+        """Calls `callback` with a list of ProjectChanges whenever projects in
+        `directory` change. Directories are checked while at least one of
+        their subscribers is active, and callbacks are only made while their
+        subscriber is active."""
+        key = (str(directory), recurse)
+
+        with self._watch_condition:
+            watcher = self._watchers.get(key)
+            if watcher is None:
+                watcher = DirectoryWatcher(self, str(directory), recurse=recurse)
+                self._watchers[key] = watcher
+
+            subscription = watcher.subscribe(callback, active_event=active_event)
+
+            if self._watch_thread is None:
+                self._watch_thread = threading.Thread(target=self._watch, daemon=True)
+                self._watch_thread.start()
+
+            self._watch_condition.notify_all()
+
+        return subscription
+
+    def _watch(self):
+        while True:
+            with self._watch_condition:
+                # forget directories nobody is watching anymore
+                for key, watcher in list(self._watchers.items()):
+                    if not watcher.has_subscribers:
+                        self._watchers.pop(key)
+
+                self._watch_condition.wait_for(lambda: len(self._watchers) > 0)
+                watchers = list(self._watchers.values())
+
+            sleep(self.watch_interval)
+
+            for watcher in watchers:
+                if watcher.active_subscriptions:
+                    watcher.check()
+
+
+# the projects menu is rebuilt often so share the index between all lists
+project_index = ProjectIndex()
@@ -0,0 +1,128 @@
+import logging
+import os
+import re
+import shutil
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# run projects at a lower priority than the miniscreen by default so a busy
+# project can't make the menus unresponsive
+DEFAULT_NICE = 10
+
+# the realtime class needs root, which projects don't run as
+IO_CLASSES = {"best-effort": "2", "idle": "3"}
+MEMORY_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def parse_cpu_limit(value: str) -> int:
+    """Parses a CPU quota such as '50%', as a percentage of one core."""
+    quota = int(value.strip().rstrip("%"))
+    if quota <= 0:
+        raise ValueError(f"Invalid CPU limit '{value}'")
+    return quota
+
+
+def parse_memory_limit(value: str) -> int:
+    """Parses a memory cap such as '256M' into bytes."""
+    match = re.fullmatch(r"(\d+)\s*([KMG]?)B?", value.strip().upper())
+    if not match or int(match.group(1)) == 0:
+        raise ValueError(f"Invalid memory limit '{value}'")
+    return int(match.group(1)) * MEMORY_UNITS[match.group(2)]
+
+
+def parse_nice(value: str) -> int:
+    # priority is set as root before switching user, so projects must not be
+    # able to raise it above the miniscreen's
+    nice = int(value)
+    if not 0 <= nice <= 19:
+        raise ValueError(f"Invalid nice value '{value}'")
+    return nice
+
+
+def parse_ionice(value: str) -> str:
+    if value not in IO_CLASSES:
+        raise ValueError(f"Invalid ionice class '{value}'")
+    return value
+
+
+@dataclass
+class ProjectLimits:
+    """Resource limits set by the optional cpu_limit, memory_limit, nice and
+    ionice keys of a project.cfg. Only nice has a default: projects that
+    don't set it run at DEFAULT_NICE, and can set a value from 0 to 19."""
+
+    cpu_limit: Optional[int] = None  # percentage of one core
+    memory_limit: Optional[int] = None  # bytes
+    nice: int = DEFAULT_NICE
+    ionice: Optional[str] = None
+
+    @classmethod
+    def from_config(cls, config) -> "ProjectLimits":
+        """Reads limits from the keys of a project.cfg section, raising a
+        ValueError if any of them are invalid."""
+        limits = cls()
+
+        # read values raw so that quotas can be written as percentages
+        cpu_limit = config.get("cpu_limit", raw=True)
+        memory_limit = config.get("memory_limit", raw=True)
+        nice = config.get("nice", raw=True)
+        ionice = config.get("ionice", raw=True)
+
+        if cpu_limit:
+            limits.cpu_limit = parse_cpu_limit(cpu_limit)
+        if memory_limit:
+            limits.memory_limit = parse_memory_limit(memory_limit)
+        if nice:
+            limits.nice = parse_nice(nice)
+        if ionice:
+            limits.ionice = parse_ionice(ionice)
+
+        return limits
+
+    def wrap_command(
+        self, args: List[str], user: Optional[str]
+    ) -> Tuple[List[str], bool]:
+        """Returns the command used to run a project as `user` with these
+        limits applied, and whether that command switches to `user` itself.
+
+        Every command added before the project execs the next one, so the
+        project is still a direct child of the miniscreen.
+        """
+        command = []
+        scope_switches_user = False
+
+        properties = []
+        if self.cpu_limit is not None:
+            properties.append(f"CPUQuota={self.cpu_limit}%")
+        if self.memory_limit is not None:
+            properties += [f"MemoryMax={self.memory_limit}", "MemorySwapMax=0"]
+
+        if properties:
+            # cgroups are managed by systemd so run the project in a transient
+            # scope, which has to be created as root
+            systemd_run = shutil.which("systemd-run")
+            if systemd_run:
+                command += [systemd_run, "--scope", "--quiet", "--collect"]
+                for property in properties:
+                    command += ["-p", property]
+                if user:
+                    command.append(f"--uid={user}")
+                    scope_switches_user = True
+            else:
+                logger.warning("systemd-run not found, CPU and memory not limited")
+
+        if self.ionice is not None:
+            ionice = shutil.which("ionice")
+            if ionice:
+                command += [ionice, "-c", IO_CLASSES[self.ionice], "--"]
+            else:
+                logger.warning("ionice not found, IO priority not changed")
+
+        return command + args, scope_switches_user
+
+    def apply(self):
+        """Sets the priority of the current process, called in the project
+        process before it is started."""
+        os.setpriority(os.PRIO_PROCESS, 0, self.nice)
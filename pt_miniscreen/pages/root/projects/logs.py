@@ -0,0 +1,392 @@
+import gzip
+import logging
+import os
+import re
+import selectors
+import shutil
+import threading
+from array import array
+from bisect import bisect_right
+from datetime import datetime
+from typing import IO, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+LOG_CHUNK_SIZE = 64 * 1024  # bytes
+MAX_LOG_SIZE = 1024 * 1024  # bytes
+LOG_BACKUP_COUNT = 3
+
+
+def get_timestamp() -> bytes:
+    return datetime.now().strftime("%H:%M:%S ").encode()
+
+
+def add_timestamps(data: bytes, timestamp: bytes) -> bytes:
+    """Prefixes every line in `data`, which must start at the beginning of a
+    line, with `timestamp`."""
+    stamped = timestamp + data.replace(b"\n", b"\n" + timestamp)
+    if data.endswith(b"\n"):
+        stamped = stamped[: -len(timestamp)]
+    return stamped
+
+
+def get_backup_number(path: str, backup_path: str) -> Optional[int]:
+    match = re.fullmatch(re.escape(path) + r"\.(\d+)(\.gz)?", backup_path)
+    return int(match.group(1)) if match else None
+
+
+def get_log_segments(path: str) -> List[str]:
+    """Returns the existing segments of a log, oldest first. Backups are
+    named `<path>.<n>`, or `<path>.<n>.gz` when compressed, with higher
+    numbers being older."""
+    directory = os.path.dirname(path) or "."
+    try:
+        filenames = os.listdir(directory)
+    except OSError:
+        return []
+
+    backups = {}
+    for filename in sorted(filenames):
+        backup_path = os.path.join(directory, filename)
+        number = get_backup_number(path, backup_path)
+
+        # a backup is briefly in both forms while it's compressed, sorting
+        # puts the complete compressed form last so it's the one used
+        if number is not None:
+            backups[number] = backup_path
+
+    segments = [backups[number] for number in sorted(backups, reverse=True)]
+    if os.path.exists(path):
+        segments.append(path)
+
+    return segments
+
+
+def remove_file(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class ProjectLog:
+    """Log file for a single run of a project.
+
+    Once the log is larger than `max_size` it becomes a backup segment and a
+    new log is started. Only `backup_count` backups are kept, so a run never
+    uses more than `(backup_count + 1) * max_size` of disk space, or less
+    when backups are compressed.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size=MAX_LOG_SIZE,
+        backup_count=LOG_BACKUP_COUNT,
+        compress=False,
+        timestamps=True,
+    ) -> None:
+        self.path = path
+        self.max_size = max_size
+        self.backup_count = backup_count
+        self.compress = compress
+        self.timestamps = timestamps
+        self._file: Optional[IO[bytes]] = None
+        self._size = 0
+        self._compression_thread: Optional[threading.Thread] = None
+
+    @property
+    def segments(self) -> List[str]:
+        return get_log_segments(self.path)
+
+    def get_backup_path(self, number: int, compressed=False):
+        return f"{self.path}.{number}" + (".gz" if compressed else "")
+
+    def clear(self):
+        self._wait_for_compression()
+        for path in self.segments:
+            remove_file(path)
+
+    def open(self):
+        self.clear()
+        self._file = open(self.path, "ab", buffering=0)
+        self._size = 0
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+        self._wait_for_compression()
+
+    def _wait_for_compression(self):
+        if self._compression_thread is not None:
+            self._compression_thread.join()
+            self._compression_thread = None
+
+    def _shift_backups(self):
+        for number in range(self.backup_count, 0, -1):
+            for compressed in (False, True):
+                backup_path = self.get_backup_path(number, compressed)
+                if not os.path.exists(backup_path):
+                    continue
+
+                if number == self.backup_count:
+                    os.remove(backup_path)
+                else:
+                    os.replace(
+                        backup_path, self.get_backup_path(number + 1, compressed)
+                    )
+
+    def _compress(self, path: str):
+        # compressed to a temporary file so readers never see a partial one
+        temporary_path = f"{path}.gz.tmp"
+        try:
+            with open(path, "rb") as source, gzip.open(temporary_path, "wb") as target:
+                shutil.copyfileobj(source, target)
+            os.replace(temporary_path, f"{path}.gz")
+            os.remove(path)
+        except OSError as e:
+            logger.warning(f"Unable to compress {path}: {e}")
+            remove_file(temporary_path)
+
+    def _rotate(self):
+        # waits for the previous backup to be compressed before shifting it
+        self.close()
+
+        backup_path = None
+        if self.backup_count > 0:
+            self._shift_backups()
+            backup_path = self.get_backup_path(1)
+            os.replace(self.path, backup_path)
+
+        self._file = open(self.path, "wb", buffering=0)
+        self._size = 0
+
+        # compressing takes a while on a Pi, doing it on another thread means
+        # the pump carries on reading the project's output meanwhile
+        if backup_path and self.compress:
+            self._compression_thread = threading.Thread(
+                target=self._compress, args=(backup_path,), daemon=True
+            )
+            self._compression_thread.start()
+
+    def append(self, data: bytes):
+        """Writes to the log once the run's output has been written."""
+        try:
+            self._file = open(self.path, "ab", buffering=0)
+            self._size = self._file.tell()
+            self.write(data)
+        except OSError as e:
+            logger.warning(f"Unable to write to {self.path}: {e}")
+        finally:
+            self.close()
+
+    def write(self, data: bytes):
+        if self._file is None:
+            return
+
+        if self.timestamps:
+            data = add_timestamps(data, get_timestamp())
+
+        if self._size > 0 and self._size + len(data) > self.max_size:
+            self._rotate()
+
+        self._file.write(data)
+        self._size += len(data)
+
+
+class LogPump:
+    """Copies the output of a process into a ProjectLog from a single thread.
+
+    Pipes are read in large chunks as soon as they have data. Only the last
+    incomplete line of each pipe is held back, so lines from stdout and
+    stderr aren't mixed together. Each chunk is written before the next one
+    is read, so a project that writes faster than its log can be written
+    blocks on its full pipe instead of growing a buffer in memory.
+    """
+
+    def __init__(self, log: ProjectLog, streams: List[IO[bytes]]) -> None:
+        self.log = log
+        self._selector = selectors.DefaultSelector()
+        self._partial_lines: Dict[int, bytes] = {}
+        for stream in streams:
+            self._selector.register(stream, selectors.EVENT_READ)
+            self._partial_lines[stream.fileno()] = b""
+
+        # used to wake up the pump when it is stopped. The lock is held while
+        # the pipe is closed so stop never writes to a closed fd, which may
+        # have been reused
+        self._stop_lock = threading.Lock()
+        self._stop_read_fd, self._stop_write_fd = os.pipe()
+        self._selector.register(self._stop_read_fd, selectors.EVENT_READ)
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @property
+    def is_running(self):
+        return self._thread.is_alive()
+
+    def start(self):
+        self._thread.start()
+
+    def join(self, timeout=None):
+        self._thread.join(timeout)
+
+    def stop(self):
+        """Stop pumping, used when a process exits but something it started
+        still holds its pipes open."""
+        if not self.is_running:
+            return
+
+        with self._stop_lock:
+            if self._stop_write_fd is None:
+                return
+
+            try:
+                os.write(self._stop_write_fd, b"\0")
+            except OSError:
+                pass
+
+    def _write(self, fd: int, data: bytes):
+        data = self._partial_lines[fd] + data
+
+        end_of_last_line = data.rfind(b"\n") + 1
+        if len(data) - end_of_last_line > LOG_CHUNK_SIZE:
+            # don't hold back very long lines forever
+            end_of_last_line = len(data)
+
+        self._partial_lines[fd] = data[end_of_last_line:]
+        if end_of_last_line:
+            self.log.write(data[:end_of_last_line])
+
+    def _flush(self, fd: int):
+        partial_line = self._partial_lines.pop(fd, b"")
+        if partial_line:
+            self.log.write(partial_line + b"\n")
+
+    def _run(self):
+        try:
+            while len(self._partial_lines) > 0:
+                for key, _ in self._selector.select():
+                    if key.fd == self._stop_read_fd:
+                        return
+
+                    data = os.read(key.fd, LOG_CHUNK_SIZE)
+                    if data:
+                        self._write(key.fd, data)
+                        continue
+
+                    # pipe closed
+                    self._flush(key.fd)
+                    self._selector.unregister(key.fileobj)
+                    key.fileobj.close()
+        except Exception as e:
+            logger.error(f"Error writing project logs: {e}")
+        finally:
+            for fd in list(self._partial_lines):
+                self._flush(fd)
+
+            # pipes are still open when the pump was stopped early
+            for key in list(self._selector.get_map().values()):
+                if key.fd != self._stop_read_fd:
+                    key.fileobj.close()
+            self._selector.close()
+
+            with self._stop_lock:
+                os.close(self._stop_read_fd)
+                os.close(self._stop_write_fd)
+                self._stop_read_fd = self._stop_write_fd = None
+
+            self.log.close()
+
+
+class LogReader:
+    """Reads lines from every segment of a log as if they were one file.
+
+    Opening a log reads each segment once, sequentially, to record where its
+    lines start, which is much quicker than seeking around on an SD card.
+    Lines are then read directly using those offsets. Compressed segments are
+    bounded by the log's `max_size` so they are kept decompressed in memory.
+
+    Lines are numbered from 1 to `len`, matching `linecache`.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._segments: List[str] = []
+        self._contents: Dict[int, bytes] = {}
+        self._line_offsets: List[array] = []
+        self._first_lines = array("Q")
+        self.len = 0
+
+        for segment in get_log_segments(path):
+            try:
+                self._index_segment(segment)
+            except Exception as e:
+                logger.warning(f"Unable to read log segment {segment}: {e}")
+
+    def _read_chunks(self, segment: str):
+        with open(segment, "rb") as file:
+            while True:
+                chunk = file.read(LOG_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+
+    def _index_segment(self, segment: str):
+        contents = None
+        if segment.endswith(".gz"):
+            with gzip.open(segment, "rb") as file:
+                contents = file.read()
+
+        offsets = array("Q", [0])
+        position = 0
+        chunks = self._read_chunks(segment) if contents is None else [contents]
+        for chunk in chunks:
+            start = chunk.find(b"\n")
+            while start != -1:
+                offsets.append(position + start + 1)
+                start = chunk.find(b"\n", start + 1)
+            position += len(chunk)
+
+        # include a final line without a newline
+        if offsets[-1] != position:
+            offsets.append(position)
+
+        if len(offsets) < 2:
+            return
+
+        if contents is not None:
+            self._contents[len(self._segments)] = contents
+
+        self._first_lines.append(self.len)
+        self._segments.append(segment)
+        self._line_offsets.append(offsets)
+        self.len += len(offsets) - 1
+
+    def line(self, line_number: int) -> str:
+        index = line_number - 1
+        if index < 0 or index >= self.len:
+            return ""
+
+        segment_index = bisect_right(self._first_lines, index) - 1
+        offsets = self._line_offsets[segment_index]
+        line_index = index - self._first_lines[segment_index]
+        start, end = offsets[line_index], offsets[line_index + 1]
+
+        try:
+            if segment_index in self._contents:
+                data = self._contents[segment_index][start:end]
+            else:
+                with open(self._segments[segment_index], "rb") as file:
+                    file.seek(start)
+                    data = file.read(end - start)
+        except OSError as e:
+            logger.warning(f"Unable to read line {line_number} of {self.path}: {e}")
+            return ""
+
+        return data.decode(errors="replace")
+
+    def range(self, start_line: int, end_line: int):
+        return [self.line(line_number) for line_number in range(start_line, end_line)]
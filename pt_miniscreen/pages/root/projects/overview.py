@@ -1,8 +1,9 @@
 import os
 import logging
+from collections.abc import Sequence
 from functools import partial
 from shutil import rmtree
-from typing import List, Union
+from typing import Dict, List, Tuple, Union
 from pathlib import Path
 from weakref import ref
 
@@ -14,11 +15,17 @@ from pt_miniscreen.components.confirmation_page import AppConfirmationPage
 from pt_miniscreen.components.scrollable_text_file import ScrollableTextFile
 from pt_miniscreen.pages.root.projects.project import Project
 from pt_miniscreen.pages.root.projects.config import ProjectConfig
+from pt_miniscreen.pages.root.projects.index import (
+    ProjectChange,
+    ProjectChangeType,
+    project_index,
+)
+from pt_miniscreen.pages.root.projects.logs import LogReader
 from pt_miniscreen.pages.root.projects.project_page import ProjectPage
 from pt_miniscreen.pages.root.projects.utils import (
     PACKAGE_DIRECTORY,
     EmptyProjectRow,
-    InvalidConfigFile,
+    InvalidProjectRow,
     Row,
     ProjectFolderInfo,
     directory_contains_projects,
@@ -33,6 +40,10 @@ class LogsPage(ScrollableTextFile):
     def __init__(self, project_config, **kwargs) -> None:
         super().__init__(path=project_config.logfile, **kwargs)
 
+    def open_file(self, path):
+        # read across rotated segments of the log
+        return LogReader(path)
+
 
 class OverviewProjectPage(EnterableSelectableList):
     animate_enterable_operation = False
@@ -139,7 +150,96 @@ class SupportsDeleteAll:
             )
 
 
-class FolderOverviewList(EnterableSelectableList, SupportsDeleteAll, UpdatableByChild):
+def _get_row_key(row) -> Tuple:
+    # rows are partials so compare what they show, the index returns the same
+    # config object for a project until its file changes
+    keywords = getattr(row, "keywords", {})
+    enterable_component = keywords.get("enterable_component")
+    component_keywords = getattr(enterable_component, "keywords", {})
+
+    folder_info = component_keywords.get("folder_info")
+    if isinstance(folder_info, list):
+        folder_info = tuple(folder.folder for folder in folder_info)
+    elif folder_info is not None:
+        folder_info = folder_info.folder
+
+    return (
+        getattr(row, "func", row),
+        keywords.get("title"),
+        folder_info,
+        component_keywords.get("project_config"),
+    )
+
+
+def _get_row_keys(rows) -> List:
+    if isinstance(rows, ProjectRows):
+        return rows.keys
+
+    return [_get_row_key(row) for row in rows]
+
+
+def get_previous_indices(previous_rows, rows) -> Dict[int, int]:
+    """Maps the index of each row in `rows` that is also in `previous_rows`
+    to its index there."""
+    previous_indices_by_key = {}
+    for index, key in enumerate(_get_row_keys(previous_rows)):
+        previous_indices_by_key.setdefault(key, index)
+
+    return {
+        index: previous_indices_by_key[key]
+        for index, key in enumerate(_get_row_keys(rows))
+        if key in previous_indices_by_key
+    }
+
+
+class WatchesProjects:
+    """Updates the rows of a project list when projects are added, removed or
+    modified in the folders it shows.
+
+    Rows that are unchanged are kept, along with the scroll position and the
+    selected row, so only the rows of projects that changed are created.
+    """
+
+    def watch_projects(self, folders: List[ProjectFolderInfo]) -> None:
+        self._project_subscriptions = [
+            project_index.watch(
+                folder.folder,
+                self.on_projects_changed,
+                active_event=self.active_event,
+                recurse=folder.recurse_search,
+            )
+            for folder in folders
+        ]
+
+    def cleanup(self):
+        for subscription in getattr(self, "_project_subscriptions", []):
+            subscription.cancel()
+
+        super().cleanup()
+
+    def get_changed_rows(self, changes) -> List:
+        return self.get_rows()
+
+    def on_projects_changed(self, changes) -> None:
+        previous_rows = self.state["Rows"]
+        rows = self.get_changed_rows(changes)
+        previous_indices = get_previous_indices(previous_rows, rows)
+        if len(rows) == len(previous_rows) and all(
+            previous_indices.get(index) == index for index in range(len(rows))
+        ):
+            return
+
+        logger.info(f"{self} updating rows after project changes: {changes}")
+        self.patch_rows(rows, previous_indices)
+
+        # don't select the 'Delete All' row
+        if self.can_be_deleted() and self.state["selected_index"] == 0:
+            self.select_next_row(animate_scroll=False)
+
+
+class FolderOverviewList(
+    WatchesProjects, EnterableSelectableList, SupportsDeleteAll, UpdatableByChild
+):
     def __init__(
         self,
         folder_info: Union[List[ProjectFolderInfo], ProjectFolderInfo],
@@ -160,6 +260,7 @@ class FolderOverviewList(EnterableSelectableList, SupportsDeleteAll, UpdatableBy
 
         super().__init__(Rows=self.get_rows(), **kwargs)
         self._set_selected_row()
+        self.watch_projects(self.folders)
 
     def _set_selected_row(self) -> None:
         if self.can_be_deleted():
@@ -188,7 +289,9 @@ class FolderOverviewList(EnterableSelectableList, SupportsDeleteAll, UpdatableBy
         return rows
 
 
-class ProjectOverviewList(EnterableSelectableList, SupportsDeleteAll, UpdatableByChild):
+class ProjectOverviewList(
+    WatchesProjects, EnterableSelectableList, SupportsDeleteAll, UpdatableByChild
+):
     def __init__(
         self,
         folder_info: ProjectFolderInfo,
@@ -197,8 +300,11 @@ class ProjectOverviewList(EnterableSelectableList, SupportsDeleteAll, UpdatableB
     ) -> None:
         self.folder_info = folder_info
         self.parent_ref = ref(parent)
-        super().__init__(Rows=self.get_rows(), **kwargs)
+
+        # folders can contain thousands of projects so only create visible rows
+        super().__init__(Rows=self.get_rows(), virtual=True, **kwargs)
         self._set_selected_row()
+        self.watch_projects([self.folder_info])
 
     def _set_selected_row(self) -> None:
         if self.can_be_deleted():
@@ -219,6 +325,17 @@ class ProjectOverviewList(EnterableSelectableList, SupportsDeleteAll, UpdatableB
         self.add_delete_row(rows, self.folder_info)
         return rows
 
+    def get_changed_rows(self, changes) -> List:
+        rows = self.state["Rows"]
+        if not isinstance(rows, ProjectRows):
+            return self.get_rows()
+
+        rows = rows.apply_changes(changes)
+        if len(rows.project_files) == 0:
+            return self.get_rows()
+
+        return rows
+
     def can_be_deleted(self) -> bool:
         return (
             len(self.state["Rows"]) > 0
@@ -233,7 +350,7 @@ def get_nested_directories(
     """Returns an array of 'ProjectFolderInfo' objects representing the
     directories inside 'folder_info', sorted by date."""
     folders = []
-    for folder in sorted(Path(folder_info.folder).iterdir(), key=os.path.getmtime):
+    for folder in map(Path, project_index.get_entries_by_mtime(folder_info.folder)):
         folders.append(
             ProjectFolderInfo.from_directory(
                 directory=folder.as_posix(), title=folder.stem
@@ -295,35 +412,98 @@ def rows_for_folders(
     return rows
 
 
-def get_project_rows(folder_info: ProjectFolderInfo, parent: UpdatableByChild) -> List:
-    """Returns a List with Rows representing the projects found in the provided
-    'folder_info'."""
-    rows: List[Union[partial[EmptyProjectRow], partial[Row]]] = []
+def get_project_row(file: str, parent: UpdatableByChild) -> partial:
+    project_config = project_index.get_config(file)
+    if project_config is None:
+        return partial(InvalidProjectRow, title=Path(file).parent.name)
 
-    files = Path(folder_info.folder).glob("*/project.cfg")
+    return partial(
+        Row,
+        title=project_config.title,
+        enterable_component=partial(
+            OverviewProjectPage,
+            project_config=project_config,
+            parent=parent,
+        ),
+    )
 
-    # Sort found files by date/time of last modification
-    for file in sorted(files, key=os.path.getmtime, reverse=True):
-        try:
-            logger.info(f"Trying to read {file}")
-            project_config = ProjectConfig.from_file(file)
-            logger.info(f"Found project {project_config.title}")
 
-            rows.append(
-                partial(
-                    Row,
-                    title=project_config.title,
-                    enterable_component=partial(
-                        OverviewProjectPage,
-                        project_config=project_config,
-                        parent=parent,
-                    ),
-                )
-            )
-        except InvalidConfigFile as e:
-            logger.error(f"Error parsing {file}: {e}")
+class ProjectRows(Sequence):
+    """Rows for the projects in a folder, sorted by date/time of last
+    modification.
 
-    if len(rows) == 0:
-        rows.append(partial(EmptyProjectRow))
+    Rows are only created when the list asks for them, so a project's config
+    is only parsed once its row scrolls into view. Rows that aren't projects,
+    such as 'Delete All', can be inserted before the projects.
+    """
 
-    return rows
+    def __init__(
+        self, project_files: List[Tuple[str, int]], parent: UpdatableByChild
+    ) -> None:
+        self.project_files = project_files
+        self.parent = parent
+        self.leading_rows: List[partial] = []
+
+    @property
+    def keys(self) -> List:
+        leading_keys = [_get_row_key(row) for row in self.leading_rows]
+        return leading_keys + [(file, mtime) for file, mtime in self.project_files]
+
+    def apply_changes(self, changes: List[ProjectChange]) -> "ProjectRows":
+        """Returns rows with `changes` applied, changed projects are moved to
+        where their new modification time puts them."""
+        changed_files = {change.file for change in changes}
+        project_files = [
+            project_file
+            for project_file in self.project_files
+            if project_file[0] not in changed_files
+        ]
+        project_files.extend(
+            (change.file, change.mtime)
+            for change in changes
+            if change.type != ProjectChangeType.REMOVED
+        )
+
+        # sorted the same way as the index sorts them
+        project_files.sort(key=lambda project_file: project_file[1], reverse=True)
+
+        rows = ProjectRows(project_files, self.parent)
+        rows.leading_rows = list(self.leading_rows)
+        return rows
+
+    def insert(self, index: int, row: partial) -> None:
+        if not 0 <= index <= len(self.leading_rows):
+            raise IndexError("rows can only be inserted before projects")
+
+        self.leading_rows.insert(index, row)
+
+    def __len__(self) -> int:
+        return len(self.leading_rows) + len(self.project_files)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("row index out of range")
+
+        if index < len(self.leading_rows):
+            return self.leading_rows[index]
+
+        file, _ = self.project_files[index - len(self.leading_rows)]
+        return get_project_row(file, self.parent)
+
+
+def get_project_rows(
+    folder_info: ProjectFolderInfo, parent: UpdatableByChild
+) -> Union[ProjectRows, List[partial]]:
+    """Returns a Sequence with Rows representing the projects found in the
+    provided 'folder_info'."""
+    project_files = project_index.get_project_files(folder_info.folder)
+    if len(project_files) == 0:
+        return [partial(EmptyProjectRow)]
+
+    return ProjectRows(project_files, parent)
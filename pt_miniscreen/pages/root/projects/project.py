@@ -1,13 +1,10 @@
 import atexit
 import logging
 import os
-from queue import Queue
 import shutil
-from pathlib import Path
 from shlex import split
 from subprocess import PIPE, Popen
-from time import sleep
-from threading import Timer, Thread
+from threading import Timer
 from typing import Optional
 
 from pitop.common.current_session_info import (
@@ -18,17 +15,39 @@ from pitop.common.switch_user import switch_user
 from pitop.common.ptdm import Message, PTDMSubscribeClient
 from pt_miniscreen.pages.root.projects.config import ProjectConfig
 from pt_miniscreen.pages.root.projects.enums import ProjectExitCondition
+from pt_miniscreen.pages.root.projects.logs import LogPump, ProjectLog
+from pt_miniscreen.services.processes import (
+    ProcessUsage,
+    SupervisedProcess,
+    process_supervisor,
+)
 
 
 logger = logging.getLogger(__name__)
 
+# time given to a project's children to close its output after it exits
+LOG_PUMP_TIMEOUT = 1
+
+
+def get_usage_summary(usage: ProcessUsage) -> str:
+    return (
+        f"Finished after {usage.duration:.1f}s, using {usage.cpu_time:.1f}s of CPU "
+        f"time and {usage.max_rss / 1024**2:.1f}MiB of memory at peak"
+    )
+
+
+def get_running_usage_summary(usage: ProcessUsage) -> str:
+    return f"CPU: {usage.cpu_time:.0f}s, RAM: {usage.max_rss / 1024**2:.0f}MiB"
+
 
 class Project:
     def __init__(self, config: ProjectConfig) -> None:
         self.config: ProjectConfig = config
         self.subscribe_client: Optional[PTDMSubscribeClient] = None
         self.process: Optional[Popen] = None
-        self.log_queue: Queue = Queue()
+        self.supervised: Optional[SupervisedProcess] = None
+        self.log = ProjectLog(config.logfile, compress=True)
+        self.log_pump: Optional[LogPump] = None
         atexit.register(self.cleanup)
 
     def _get_environment(self):
@@ -53,7 +72,7 @@ class Project:
     def stop(self) -> None:
         if self.process:
             logger.info(f"Stopping project '{self.config.title}'")
-            self.process.terminate()
+            process_supervisor.stop(self.config.path)
             self.process = None
 
     def cleanup(self) -> None:
@@ -71,7 +90,11 @@ class Project:
         if not self.process:
             return
 
-        exit_code = self.process.wait()
+        exit_code = self.supervised.wait()
+        self._stop_log_pump()
+        if self.supervised.usage:
+            summary = get_usage_summary(self.supervised.usage)
+            self.log.append(f"{summary}\n".encode())
         logger.info(
             f"Project '{self.config.title}' finished with exit code {exit_code}"
         )
@@ -79,41 +102,45 @@ class Project:
         if self.process and exit_code not in (0, -9):
             raise Exception(f"Project finished with exit code {exit_code}")
 
-    def write_logs(self):
-        file = Path(self.config.logfile)
-        if file.exists():
-            file.unlink()
+    def _start_log_pump(self):
+        self.log.open()
+        self.log_pump = LogPump(self.log, [self.process.stdout, self.process.stderr])
+        self.log_pump.start()
 
-        with open(self.config.logfile, "a") as f:
-            while self.process or not self.log_queue.empty():
-                try:
-                    line = self.log_queue.get_nowait()
-                    f.write(line)
-                except Exception:
-                    sleep(0.5)
+    def _stop_log_pump(self):
+        if self.log_pump is None:
+            return
+
+        self.log_pump.join(LOG_PUMP_TIMEOUT)
+        if self.log_pump.is_running:
+            # something the project started still holds its pipes open
+            self.log_pump.stop()
+            self.log_pump.join(LOG_PUMP_TIMEOUT)
 
     def run(self):
         logger.info(f"Starting project '{self.config.title}'")
         user = get_user_using_first_display()
+        limits = self.config.limits
+        command, command_switches_user = limits.wrap_command(
+            split(self.config.start), user
+        )
 
-        self.process = Popen(
-            split(self.config.start),
+        def setup_process():
+            limits.apply()
+            if not command_switches_user:
+                switch_user(user)
+
+        self.supervised = process_supervisor.start(
+            self.config.path,
+            command,
             stdout=PIPE,
             stderr=PIPE,
             env=self._get_environment(),
             cwd=self.config.path,
-            preexec_fn=lambda: switch_user(user),
-            text=True,
+            preexec_fn=setup_process,
         )
-
-        def queue_logs(stream):
-            for line in iter(stream.readline, ""):
-                self.log_queue.put(line)
-            stream.close()
-
-        Thread(target=queue_logs, args=[self.process.stdout], daemon=True).start()
-        Thread(target=queue_logs, args=[self.process.stderr], daemon=True).start()
-        Thread(target=self.write_logs, daemon=True).start()
+        self.process = self.supervised.process
+        self._start_log_pump()
 
         self._handle_exit_condition()
 
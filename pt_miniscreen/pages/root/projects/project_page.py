@@ -4,21 +4,38 @@ from time import sleep
 from threading import Thread
 
 from pt_miniscreen.pages.root.projects.enums import ProjectExitCondition, ProjectState
-from pt_miniscreen.pages.root.projects.project import Project
-
-from pt_miniscreen.components.mixins import BlocksMiniscreenButtons, Poppable
+from pt_miniscreen.pages.root.projects.project import (
+    Project,
+    get_running_usage_summary,
+)
+
+from pt_miniscreen.components.mixins import (
+    BlocksMiniscreenButtons,
+    Poppable,
+    UserControllable,
+)
 from pt_miniscreen.core.component import Component
 from pt_miniscreen.core.components.text import Text
 from pt_miniscreen.pages.root.projects.config import ProjectConfig
+from pt_miniscreen.services.processes import (
+    ProcessAlreadyRunning,
+    process_supervisor,
+)
 
 
 logger = logging.getLogger(__name__)
 
+# how often the usage of a running project is read and shown
+USAGE_INTERVAL = 5
+
 
-class ProjectPage(Component, Poppable, BlocksMiniscreenButtons):
+class ProjectPage(Component, Poppable, BlocksMiniscreenButtons, UserControllable):
     def __init__(self, project_config: ProjectConfig, **kwargs):
         self.project_config = project_config
-        super().__init__(**kwargs, initial_state={"project_state": ProjectState.IDLE})
+        super().__init__(
+            **kwargs,
+            initial_state={"project_state": ProjectState.IDLE, "usage": None},
+        )
 
         self.text = self.create_child(
             Text,
@@ -27,6 +44,8 @@ class ProjectPage(Component, Poppable, BlocksMiniscreenButtons):
             align="center",
             vertical_align="center",
         )
+        self.watch_state(("project_state", "usage"), self._on_project_state_change)
+        self.create_interval(self._update_usage, USAGE_INTERVAL)
 
         self.run(on_stop=self.pop)
 
@@ -34,9 +53,16 @@ class ProjectPage(Component, Poppable, BlocksMiniscreenButtons):
     def block_buttons(self):
         return True
 
-    def on_state_change(self, previous_state):
-        if self.state["project_state"] != previous_state["project_state"]:
-            self.text.state.update({"text": self.displayed_text})
+    def _on_project_state_change(self, previous_state):
+        self.text.state.update({"text": self.displayed_text})
+
+    def _update_usage(self):
+        # a project that runs away is visible before it finishes
+        if self.is_running:
+            usage = process_supervisor.sample_usage(self.project_config.path)
+            if usage:
+                logger.debug(f"'{self.project_config.title}' usage: {usage}")
+            self.state.update({"usage": usage})
 
     def set_user_controls_miniscreen(self, user_using_miniscreen):
         if user_using_miniscreen and self.is_running:
@@ -48,8 +74,13 @@ class ProjectPage(Component, Poppable, BlocksMiniscreenButtons):
         project_state = self.state.get("project_state")
         if project_state == ProjectState.ERROR:
             text = f"There was an error while running '{self.project_config.title}'..."
+        elif project_state == ProjectState.ALREADY_RUNNING:
+            text = f"'{self.project_config.title}' is already running"
         elif project_state == ProjectState.RUNNING_WITH_INSTRUCTIONS_IN_SCREEN:
             text = f"'{self.project_config.title}' is running..."
+            usage = self.state.get("usage")
+            if usage:
+                text += f"\n{get_running_usage_summary(usage)}"
         elif project_state == ProjectState.STOPPING:
             text = f"Stopping '{self.project_config.title}'..."
         elif project_state == ProjectState.STARTING:
@@ -101,6 +132,9 @@ class ProjectPage(Component, Poppable, BlocksMiniscreenButtons):
                 )
                 project.wait()
                 self.state.update({"project_state": ProjectState.STOPPING})
+        except ProcessAlreadyRunning as e:
+            logger.warning(f"Not running project: {e}")
+            self.state.update({"project_state": ProjectState.ALREADY_RUNNING})
         except Exception as e:
             logger.error(f"Error running project: {e}")
             self.state.update({"project_state": ProjectState.ERROR})
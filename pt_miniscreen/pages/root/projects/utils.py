@@ -1,4 +1,3 @@
-from pathlib import Path
 from dataclasses import dataclass
 from typing import Callable
 import logging
@@ -29,16 +28,9 @@ class InvalidConfigFile(Exception):
 
 
 def directory_contains_projects(directory: str, recurse: bool = False) -> bool:
-    from pt_miniscreen.pages.root.projects.config import ProjectConfig
+    from pt_miniscreen.pages.root.projects.index import project_index
 
-    search_pattern = "**/project.cfg" if recurse else "*/project.cfg"
-    for file in Path(directory).glob(search_pattern):
-        try:
-            ProjectConfig.from_file(file)
-            return True
-        except InvalidConfigFile:
-            pass
-    return False
+    return project_index.contains_projects(directory, recurse=recurse)
 
 
 @dataclass
@@ -137,3 +129,18 @@ class EmptyProjectRow(Component):
 
     def render(self, image):
         return self.text.render(image)
+
+
+class InvalidProjectRow(Component):
+    def __init__(self, title, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.text = self.create_child(
+            MarqueeText,
+            text=f"Invalid project: {title}",
+            font_size=10,
+            align="center",
+            vertical_align="center",
+        )
+
+    def render(self, image):
+        return self.text.render(image)
@@ -1,97 +1,350 @@
 import logging
-from random import randrange
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
 
+import numpy as np
 import PIL.Image
-import PIL.ImageDraw
+from numpy.random import default_rng
+from pitop.battery import Battery
 
 from pt_miniscreen.core import Component
+from pt_miniscreen.core.components.text import Text
+from pt_miniscreen.core.utils import apply_layers, layer
+from pt_miniscreen.settings import read_settings
 
 logger = logging.getLogger(__name__)
 
+SCREENSAVER_MODES = ("starfield", "glance")
+SLEEP_MODES = ("static", "off")
+
+# how often the starfield checks whether to change its frame rate, reading the
+# battery state is slow so this shouldn't be too often
+ADAPT_INTERVAL = 10
+
+_battery = None
+
+
+def get_battery():
+    # battery lives to the end of the process so only create one
+    global _battery
+    if _battery is None:
+        _battery = Battery()
+    return _battery
+
+
+@dataclass
+class ScreensaverSettings:
+    mode: str = "starfield"
+    frame_interval: float = 0.1  # fastest, used when idle and plugged in
+    max_frame_interval: float = 0.5  # slowest, used when busy or low on battery
+    adaptive: bool = True
+    low_battery: int = 20  # percent
+    glance_interval: float = 60
+    sleep_timeout: float = 0  # seconds after starting, 0 to never sleep
+    sleep_mode: str = "static"
+
+    @classmethod
+    def from_config(cls, config) -> "ScreensaverSettings":
+        """Reads settings from the [Screensaver] section of the settings
+        file, raising a ValueError if any of them are invalid."""
+        defaults = cls()
+        section = "Screensaver"
+
+        settings = cls(
+            mode=config.get(section, "Mode", fallback=defaults.mode),
+            frame_interval=config.getfloat(
+                section, "FrameInterval", fallback=defaults.frame_interval
+            ),
+            max_frame_interval=config.getfloat(
+                section, "MaxFrameInterval", fallback=defaults.max_frame_interval
+            ),
+            adaptive=config.getboolean(
+                section, "AdaptiveFrameRate", fallback=defaults.adaptive
+            ),
+            low_battery=config.getint(
+                section, "LowBattery", fallback=defaults.low_battery
+            ),
+            glance_interval=config.getfloat(
+                section, "GlanceInterval", fallback=defaults.glance_interval
+            ),
+            sleep_timeout=config.getfloat(
+                section, "SleepTimeout", fallback=defaults.sleep_timeout
+            ),
+            sleep_mode=config.get(section, "SleepMode", fallback=defaults.sleep_mode),
+        )
+
+        if settings.mode not in SCREENSAVER_MODES:
+            raise ValueError(f"Invalid screensaver mode '{settings.mode}'")
+        if settings.sleep_mode not in SLEEP_MODES:
+            raise ValueError(f"Invalid screensaver sleep mode '{settings.sleep_mode}'")
+        if settings.frame_interval <= 0 or settings.glance_interval <= 0:
+            raise ValueError("Screensaver intervals must be positive")
+        if settings.max_frame_interval < settings.frame_interval:
+            raise ValueError("MaxFrameInterval must not be less than FrameInterval")
+        if settings.sleep_timeout < 0:
+            raise ValueError("SleepTimeout must not be negative")
+
+        return settings
+
+
+def get_screensaver_settings() -> ScreensaverSettings:
+    try:
+        return ScreensaverSettings.from_config(read_settings())
+    except ValueError as e:
+        logger.warning(f"Invalid screensaver settings, using defaults: {e}")
+        return ScreensaverSettings()
+
+
+def get_power_state() -> Tuple[float, Optional[int]]:
+    """Returns the load average per CPU and the battery level, which is None
+    if the device is plugged in or the level is unknown."""
+    load = os.getloadavg()[0] / (os.cpu_count() or 1)
+
+    try:
+        battery = get_battery()
+        if battery.is_charging or battery.is_full:
+            return load, None
+        return load, battery.capacity
+    except Exception as e:
+        logger.debug(f"Unable to read battery state: {e}")
+        return load, None
+
+
+def get_adaptive_frame_interval(
+    settings: ScreensaverSettings, load: float, battery_level: Optional[int]
+) -> float:
+    on_battery = battery_level is not None
+    if on_battery and battery_level <= settings.low_battery:
+        return settings.max_frame_interval
+
+    # slow down as load goes from using half of the CPU to all of it, and
+    # run at half speed or slower on battery
+    slowdown = min(max((load - 0.5) * 2, 0), 1)
+    if on_battery:
+        slowdown = max(slowdown, 0.5)
+
+    interval_range = settings.max_frame_interval - settings.frame_interval
+    return round(settings.frame_interval + interval_range * slowdown, 2)
+
 
 # Adapted from https://github.com/rm-hull/luma.examples/blob/master/examples/starfield.py
 
 
+class StarField:
+    """Stores the position of every star in arrays so they can be moved and
+    drawn together rather than one at a time."""
+
+    MAX_DEPTH = 32
+    MAX_STAR_SIZE = 4
+
+    # we only want to create stars that are visible on screen
+    # 128x64 screen, divide by 4 for coordinate system, get away with less
+    MAX_X = 25
+    MAX_Y = 14
+
+    # offsets of the pixels in the largest star and the size a star has to be
+    # for each one to be drawn
+    _pixel_dy, _pixel_dx = np.divmod(np.arange(MAX_STAR_SIZE**2), MAX_STAR_SIZE)
+    _pixel_extent = np.maximum(_pixel_dx, _pixel_dy)
+
+    def __init__(self, count, rng=None):
+        self._rng = rng if rng is not None else default_rng()
+        self.x, self.y = self._random_xy(count)
+        self.z = self._rng.integers(1, self.MAX_DEPTH, count).astype(float)
+
+    def __len__(self):
+        return len(self.z)
+
+    def _random_xy(self, count):
+        return (
+            self._rng.integers(-self.MAX_X, self.MAX_X, count).astype(float),
+            self._rng.integers(-self.MAX_Y, self.MAX_Y, count).astype(float),
+        )
+
+    def move(self, delta_z):
+        self.z -= delta_z
+
+        # stars that have moved 'past the display' are repositioned far away
+        # from the screen with random X and Y coordinates
+        passed = self.z <= 0
+        count = int(np.count_nonzero(passed))
+        if count:
+            self.x[passed], self.y[passed] = self._random_xy(count)
+            self.z[passed] = self.MAX_DEPTH
+
+    def rasterise(self, size) -> PIL.Image.Image:
+        """Returns a 1-bit image of the stars, drawn as they would be by
+        ImageDraw.rectangle."""
+        width, height = size
+
+        # convert 3D coordinates to 2D using perspective projection
+        k = height / self.z
+        x = np.trunc(self.x * k + width // 2).astype(int)
+        y = np.trunc(self.y * k + height // 2).astype(int)
+
+        # distant stars are smaller than closer stars
+        extent = ((1 - self.z / self.MAX_DEPTH) * self.MAX_STAR_SIZE).astype(int)
+
+        visible = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+        x, y, extent = x[visible], y[visible], extent[visible]
+
+        # offset every star by each pixel of the largest star, then keep the
+        # pixels that are part of each star and on screen
+        star_x = x[:, np.newaxis] + self._pixel_dx
+        star_y = y[:, np.newaxis] + self._pixel_dy
+        drawn = (
+            (extent[:, np.newaxis] >= self._pixel_extent)
+            & (star_x < width)
+            & (star_y < height)
+        )
+
+        pixels = np.zeros((height, width), dtype=bool)
+        pixels[star_y[drawn], star_x[drawn]] = True
+
+        return PIL.Image.frombytes("1", size, np.packbits(pixels, axis=1).tobytes())
+
+
 class StarfieldScreensaver(Component):
     SCREENSAVER_MAX_NO_OF_STARS = 50
-    SCREENSAVER_MAX_DEPTH = 32
+    SCREENSAVER_MAX_DEPTH = StarField.MAX_DEPTH
+    SPEED = 3.8  # depth moved per second
 
-    def __init__(self, **kwargs):
-        self.stars = [Star() for _ in range(self.SCREENSAVER_MAX_NO_OF_STARS)]
+    def __init__(
+        self, settings: Optional[ScreensaverSettings] = None, max_stars=None, **kwargs
+    ):
+        self.settings = settings or ScreensaverSettings()
+        self.stars = StarField(max_stars or self.SCREENSAVER_MAX_NO_OF_STARS)
+        self.frame_interval = self.settings.frame_interval
         self.animation_interval = None
+        self.adapt_interval = None
 
-        super().__init__(
-            **kwargs,
-            initial_state={"positions": [star.position for star in self.stars]}
-        )
+        super().__init__(**kwargs, initial_state={"frame": 0})
 
     def start_animating(self):
+        self.frame_interval = self.settings.frame_interval
+        if self.settings.adaptive:
+            self.adapt_interval = self.create_interval(
+                self.adapt_frame_rate, timeout=ADAPT_INTERVAL
+            )
+            self.frame_interval = get_adaptive_frame_interval(
+                self.settings, *get_power_state()
+            )
+
+        self._start_frames()
+
+    def stop_animating(self):
+        self._stop_frames()
+        if self.adapt_interval:
+            self.remove_interval(self.adapt_interval)
+            self.adapt_interval = None
+
+    def _start_frames(self):
         self.animation_interval = self.create_interval(
-            self.update_positions, timeout=0.1
+            self.update_positions, timeout=self.frame_interval
         )
 
-    def stop_animating(self):
+    def _stop_frames(self):
         if self.animation_interval:
             self.remove_interval(self.animation_interval)
+            self.animation_interval = None
+
+    def adapt_frame_rate(self):
+        frame_interval = get_adaptive_frame_interval(self.settings, *get_power_state())
+        if frame_interval == self.frame_interval or not self.animation_interval:
+            return
+
+        logger.debug(f"Screensaver frame interval changed to {frame_interval}s")
+        self.frame_interval = frame_interval
+        self._stop_frames()
+        self._start_frames()
 
     def update_positions(self):
-        self.state.update({"positions": [star.move() for star in self.stars]})
+        self.stars.move(self.SPEED * self.frame_interval)
+        self.state.update({"frame": self.state["frame"] + 1})
 
     def render(self, image):
-        origin_x = image.width // 2
-        origin_y = image.height // 2
+        image.paste("white", mask=self.stars.rasterise(image.size))
+        return image
 
-        draw = PIL.ImageDraw.Draw(image)
 
-        for star in self.stars:
-            # Convert 3D coordinates to 2D using perspective projection
-            k = image.height / star.z
-            x = int(star.x * k + origin_x)
-            y = int(star.y * k + origin_y)
+def get_time_text():
+    return datetime.now().strftime("%H:%M")
 
-            # Draw star if visible
-            if 0 <= x < image.width and 0 <= y < image.height:
-                # Distant stars are smaller than closer stars
-                size = (1 - star.z / star.MAX_DEPTH) * 4
-                draw.rectangle((x, y, x + size, y + size), fill="white")
 
-        return image
+def get_battery_text():
+    try:
+        battery = get_battery()
+        if battery.capacity is None:
+            return ""
+        charging = " charging" if battery.is_charging else ""
+        return f"{battery.capacity}%{charging}"
+    except Exception:
+        return ""
 
 
-class Star:
-    MAX_DEPTH = 32
-    DELTA_Z = 0.38
+class GlanceScreensaver(Component):
+    """Shows the time and battery level, which only change occasionally so
+    the display is updated rarely."""
+
+    TIME_FONT_SIZE = 24
+    BATTERY_FONT_SIZE = 12
+
+    def __init__(self, settings: Optional[ScreensaverSettings] = None, **kwargs):
+        self.settings = settings or ScreensaverSettings()
+        self.update_interval = None
+
+        super().__init__(**kwargs)
+
+        self.time_text = self.create_child(
+            Text,
+            text=get_time_text(),
+            font_size=self.TIME_FONT_SIZE,
+            align="center",
+            vertical_align="center",
+            bold=True,
+        )
+        self.battery_text = self.create_child(
+            Text,
+            text=get_battery_text(),
+            font_size=self.BATTERY_FONT_SIZE,
+            align="center",
+            vertical_align="center",
+        )
+
+    def start_animating(self):
+        self.update()
+        self.update_interval = self.create_interval(
+            self.update, timeout=self.settings.glance_interval
+        )
+
+    def stop_animating(self):
+        if self.update_interval:
+            self.remove_interval(self.update_interval)
+            self.update_interval = None
+
+    def update(self):
+        self.time_text.state.update({"text": get_time_text()})
+        self.battery_text.state.update({"text": get_battery_text()})
+
+    def render(self, image):
+        time_height = self.TIME_FONT_SIZE + 12
+        return apply_layers(
+            image,
+            [
+                layer(
+                    self.time_text.render,
+                    size=(image.width, time_height),
+                    pos=(0, 4),
+                ),
+                layer(
+                    self.battery_text.render,
+                    size=(image.width, image.height - time_height - 8),
+                    pos=(0, time_height + 4),
+                ),
+            ],
+        )
 
-    # we only want to create stars that are visible on screen
-    # 128x64 screen, divide by 4 for coordinate system, get away with less
-    MAX_X = 25
-    MAX_Y = 14
 
-    def __init__(self):
-        self.x = randrange(-self.MAX_X, self.MAX_X)
-        self.y = randrange(-self.MAX_Y, self.MAX_Y)
-        self.z = randrange(1, self.MAX_DEPTH)
-
-    @property
-    def position(self):
-        return (self.x, self.y, self.z)
-
-    @position.setter
-    def position(self, value):
-        self.x, self.y, self.z = value
-
-    def move(self):
-        x = self.x
-        y = self.y
-        z = self.z - self.DELTA_Z
-
-        # Star has moved 'past the display'
-        if z <= 0:
-            # Reposition far away from the screen (Z=max_depth)
-            # with random X and Y coordinates
-            x = randrange(-self.MAX_X, self.MAX_X)
-            y = randrange(-self.MAX_Y, self.MAX_Y)
-            z = self.MAX_DEPTH
-
-        self.position = (x, y, z)
-        return (x, y, z)
+SCREENSAVERS = {"starfield": StarfieldScreensaver, "glance": GlanceScreensaver}
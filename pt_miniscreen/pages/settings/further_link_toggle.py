@@ -1,7 +1,6 @@
-from pitop.common.sys_info import get_pt_further_link_enabled_state
-
 from pt_miniscreen.actions import change_further_link_enabled_state
 from pt_miniscreen.components.action_page import ActionPage
+from pt_miniscreen.services.systemd import get_pt_further_link_enabled_state, systemd
 
 
 class FurtherLinkTogglePage(ActionPage):
@@ -10,5 +9,6 @@ class FurtherLinkTogglePage(ActionPage):
             text="Further Link",
             action=change_further_link_enabled_state,
             get_enabled_state=get_pt_further_link_enabled_state,
+            state_publisher=systemd,
             **kwargs,
         )
@@ -1,7 +1,6 @@
-from pitop.common.sys_info import get_ssh_enabled_state
-
 from pt_miniscreen.actions import change_ssh_enabled_state
 from pt_miniscreen.components.action_page import ActionPage
+from pt_miniscreen.services.systemd import get_ssh_enabled_state, systemd
 
 
 class SSHTogglePage(ActionPage):
@@ -10,5 +9,6 @@ class SSHTogglePage(ActionPage):
             text="SSH",
             action=change_ssh_enabled_state,
             get_enabled_state=get_ssh_enabled_state,
+            state_publisher=systemd,
             **kwargs,
         )
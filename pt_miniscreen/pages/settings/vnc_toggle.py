@@ -1,7 +1,6 @@
-from pitop.common.sys_info import get_vnc_enabled_state
-
 from pt_miniscreen.actions import change_vnc_enabled_state
 from pt_miniscreen.components.action_page import ActionPage
+from pt_miniscreen.services.systemd import get_vnc_enabled_state, systemd
 
 
 class VNCTogglePage(ActionPage):
@@ -10,5 +9,6 @@ class VNCTogglePage(ActionPage):
             text="VNC",
             action=change_vnc_enabled_state,
             get_enabled_state=get_vnc_enabled_state,
+            state_publisher=systemd,
             **kwargs,
         )
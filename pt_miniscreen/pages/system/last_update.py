@@ -8,6 +8,8 @@ from pitop.common.common_ids import FirmwareDeviceID
 from pitop.common.sys_info import get_pi_top_ip
 from pt_miniscreen.components.info_page import InfoPage
 from pt_miniscreen.core.components.marquee_text import MarqueeText
+from pt_miniscreen.services.packages import DPKG_STATUS_FILE
+from pt_miniscreen.services.updates import APT_LISTS_DIRECTORY, CachedCheck
 
 
 def get_ip_url():
@@ -47,6 +49,15 @@ def system_updates_available():
     return "No system updates available"
 
 
+def _get_firmware_folders():
+    try:
+        from pt_fw_updater.utils import default_firmware_folder
+    except ImportError:
+        return []
+
+    return [default_firmware_folder(device.name) for device in FirmwareDeviceName]
+
+
 def _has_fw_updates():
     try:
         from pt_fw_updater.utils import (
@@ -79,6 +90,20 @@ def firmware_updates_available():
     return "Firmware is up to date"
 
 
+# checks are slow so share cached results between pages and only run them
+# again when they are out of date or the files they depend on change
+system_update_status = CachedCheck(
+    system_updates_available,
+    watched_paths=(APT_LISTS_DIRECTORY, DPKG_STATUS_FILE),
+    initial_value="Loading...",
+)
+firmware_update_status = CachedCheck(
+    firmware_updates_available,
+    watched_paths=_get_firmware_folders,
+    initial_value="",
+)
+
+
 class LastUpdatePage(InfoPage):
     def __init__(self, **kwargs):
         Row = partial(MarqueeText, font_size=10, vertical_align="center")
@@ -88,7 +113,39 @@ class LastUpdatePage(InfoPage):
             title="System Updates",
             Rows=[
                 partial(Row, text="", get_text=latest_update_date),
-                partial(Row, text="Loading...", get_text=system_updates_available),
-                partial(Row, text="", get_text=firmware_updates_available),
+                partial(
+                    Row,
+                    text=system_update_status.value,
+                    get_text=system_update_status.get,
+                ),
+                partial(
+                    Row,
+                    text=firmware_update_status.value,
+                    get_text=firmware_update_status.get,
+                ),
             ],
         )
+
+        # show results as soon as checks finish rather than on the next poll
+        self._update_status_subscriptions = [
+            system_update_status.subscribe(
+                self._on_system_update_status, active_event=self.active_event
+            ),
+            firmware_update_status.subscribe(
+                self._on_firmware_update_status, active_event=self.active_event
+            ),
+        ]
+
+        # subscribe before checking so results of fast checks aren't missed
+        system_update_status.check_if_stale()
+        firmware_update_status.check_if_stale()
+
+    def cleanup(self):
+        for subscription in getattr(self, "_update_status_subscriptions", []):
+            subscription.cancel()
+
+    def _on_system_update_status(self, text):
+        self.list.rows[1].state.update({"text": text})
+
+    def _on_firmware_update_status(self, text):
+        self.list.rows[2].state.update({"text": text})
@@ -1,6 +1,3 @@
-from typing import Callable
-
-import psutil
 from pitop.common.formatting import bytes2human
 
 from pt_miniscreen.components.progress_bar import ProgressBar
@@ -8,6 +5,7 @@ from pt_miniscreen.core.component import Component
 from pt_miniscreen.core.components.marquee_text import MarqueeText
 from pt_miniscreen.core.components.text import Text
 from pt_miniscreen.core.utils import apply_layers, layer
+from pt_miniscreen.services.metrics import MemoryUsage, metrics_sampler
 
 X_MARGIN = 4
 SUB_TITLE_WIDTH = 40
@@ -18,50 +16,57 @@ MARGIN_Y = 5
 SPACING_Y = 3
 
 
+def get_usage_string(memory_usage: MemoryUsage) -> str:
+    try:
+        return f"{bytes2human(memory_usage.used)}/{bytes2human(memory_usage.total)}"
+    except Exception:
+        return ""
+
+
 class MemoryPage(Component):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-        def get_usage_string(func: Callable) -> str:
-            try:
-                memory_object = func()
-                return f"{bytes2human(memory_object.used)}/{bytes2human(memory_object.total)}"
-            except Exception:
-                return ""
-
-        def get_usage_percentage(func: Callable) -> float:
-            try:
-                return func().percent
-            except Exception:
-                return 0.0
+        snapshot = metrics_sampler.get_snapshot()
 
         self.ram_title = self.create_child(Text, text="RAM", font_size=TITLE_FONT_SIZE)
         self.ram_progress_bar = self.create_child(
-            ProgressBar,
-            progress=lambda: get_usage_percentage(func=psutil.virtual_memory),
+            ProgressBar, progress=snapshot.memory.percent
         )
         self.ram_text = self.create_child(
             MarqueeText,
             vertical_align="bottom",
             font_size=TEXT_FONT_SIZE,
-            text=get_usage_string(func=psutil.virtual_memory),
-            get_text=lambda: get_usage_string(func=psutil.virtual_memory),
+            text=get_usage_string(snapshot.memory),
         )
 
         self.swap_title = self.create_child(
             Text, text="SWAP", font_size=TITLE_FONT_SIZE
         )
         self.swap_progress_bar = self.create_child(
-            ProgressBar, progress=lambda: get_usage_percentage(func=psutil.swap_memory)
+            ProgressBar, progress=snapshot.swap.percent
         )
         self.swap_text = self.create_child(
             MarqueeText,
             vertical_align="bottom",
             font_size=TEXT_FONT_SIZE,
-            text=get_usage_string(func=psutil.swap_memory),
-            get_text=lambda: get_usage_string(func=psutil.swap_memory),
+            text=get_usage_string(snapshot.swap),
         )
 
+        self._metrics_subscription = metrics_sampler.subscribe(
+            self.update_metrics, active_event=self.active_event
+        )
+
+    def cleanup(self):
+        if hasattr(self, "_metrics_subscription"):
+            self._metrics_subscription.cancel()
+
+    def update_metrics(self, snapshot):
+        self.ram_progress_bar.state.update({"progress": snapshot.memory.percent})
+        self.ram_text.state.update({"text": get_usage_string(snapshot.memory)})
+        self.swap_progress_bar.state.update({"progress": snapshot.swap.percent})
+        self.swap_text.state.update({"text": get_usage_string(snapshot.swap)})
+
     def render(self, image):
         return apply_layers(
             image,
@@ -6,6 +6,7 @@ from pitop.common.common_ids import FirmwareDeviceID
 from pitop.common.firmware_device import FirmwareDevice
 
 from pt_miniscreen.components.info_page import InfoPage
+from pt_miniscreen.core import batch
 from pt_miniscreen.core.components.marquee_text import MarqueeText
 
 
@@ -45,9 +46,10 @@ class PitopHardwarePage(InfoPage):
                 )
                 PitopHardwarePage.serial = f"Serial: {get_pt_serial()}"
 
-                self.list.rows[0].state.update({"text": PitopHardwarePage.firmware})
-                self.list.rows[1].state.update({"text": PitopHardwarePage.hardware})
-                self.list.rows[2].state.update({"text": PitopHardwarePage.serial})
+                with batch():
+                    self.list.rows[0].state.update({"text": PitopHardwarePage.firmware})
+                    self.list.rows[1].state.update({"text": PitopHardwarePage.hardware})
+                    self.list.rows[2].state.update({"text": PitopHardwarePage.serial})
             except Exception:
                 pass
 
@@ -1,68 +1,30 @@
 import logging
 from functools import partial
-from os import environ
-from pathlib import Path
-from re import match, search
-from shlex import split
-from subprocess import run
 from threading import Thread
 
 from pitop.common.pt_os import get_pitopOS_info
 
 from pt_miniscreen.components.info_page import InfoPage
+from pt_miniscreen.core import batch
 from pt_miniscreen.core.components.marquee_text import MarqueeText
+from pt_miniscreen.services.software import software_inventory
 
 logger = logging.getLogger(__name__)
 
 
-def get_package_version(pkg_name):
-    def __get_env():
-        env = environ.copy()
-        # Print output of commands in english
-        env["LANG"] = "en_US.UTF-8"
-        return env
-
-    try:
-        resp = run(
-            split(f"apt-cache policy {pkg_name}"),
-            check=False,
-            capture_output=True,
-            timeout=5,
-            env=__get_env(),
-        )
-        output = str(resp.stdout, "utf8")
-        match = search("Installed: (.*)", output)
-        return match.group(1) if match else ""
-
-    except Exception as e:
-        logger.warning(f"get_package_version {pkg_name} failed: {e}")
-        return ""
-
+PACKAGES = ["python3-pitop", "pi-topd"]
 
-def get_apt_repositories():
-    def find_repo_in_file(file):
-        for line in file:
-            match_obj = match(
-                r"^(.*)pi-top[.]com\/(?P<repository>[a-z-]*)\/debian(.*)$", line
-            )
-            if match_obj and match_obj.group("repository"):
-                return match_obj.group("repository")
 
-    repos = []
-    sources_dir = Path("/etc/apt/sources.list.d")
+def get_package_versions(package_names):
+    return software_inventory.get_package_versions(package_names)
 
-    if not sources_dir.is_dir():
-        return repos
 
-    for filename in sources_dir.iterdir():
-        with open(filename) as file:
-            repo = find_repo_in_file(file)
-            if repo:
-                repos.append(repo)
-    return repos
+def get_apt_repositories():
+    return software_inventory.get_repositories()
 
 
 class SoftwarePage(InfoPage):
+    # the last values read are shown straight away when the page is reopened
     sdk = ""
     pitopd = ""
     repos = ""
@@ -83,18 +45,24 @@ class SoftwarePage(InfoPage):
 
         def update_info():
             try:
-                SoftwarePage.sdk = f"SDK: {get_package_version('python3-pitop')}"
-                SoftwarePage.pitopd = f"pi-topd: {get_package_version('pi-topd')}"
+                # the inventory caches versions and repositories so refreshing
+                # only costs a stat of the files they come from
+                versions = get_package_versions(PACKAGES)
+                SoftwarePage.sdk = f"SDK: {versions['python3-pitop']}"
+                SoftwarePage.pitopd = f"pi-topd: {versions['pi-topd']}"
                 SoftwarePage.repos = f"Repos: {', '.join(get_apt_repositories())}"
                 os_info = get_pitopOS_info()
 
                 if os_info:
                     SoftwarePage.os = f"pi-topOS {os_info.build_os_version}-{os_info.build_run_number}"
-                    self.title.state.update({"text": SoftwarePage.os})
 
-                self.list.rows[0].state.update({"text": SoftwarePage.repos})
-                self.list.rows[1].state.update({"text": SoftwarePage.sdk})
-                self.list.rows[2].state.update({"text": SoftwarePage.pitopd})
+                with batch():
+                    if os_info:
+                        self.title.state.update({"text": SoftwarePage.os})
+
+                    self.list.rows[0].state.update({"text": SoftwarePage.repos})
+                    self.list.rows[1].state.update({"text": SoftwarePage.sdk})
+                    self.list.rows[2].state.update({"text": SoftwarePage.pitopd})
 
             except Exception:
                 pass
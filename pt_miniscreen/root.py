@@ -1,9 +1,15 @@
 import logging
-from configparser import ConfigParser
 from os import path
 from pathlib import Path
 from threading import Thread
 
+from pt_miniscreen.bootsplash import (
+    BOOTSPLASH_FRAMES_PATH,
+    bake_frames,
+    get_bootsplash_image_path,
+    load_bootsplash_frames,
+)
+from pt_miniscreen.components.bootsplash import BootsplashAnimation
 from pt_miniscreen.components.enterable_page_list import (
     EnterablePageList,
 )
@@ -19,15 +25,16 @@ from pt_miniscreen.components.mixins import (
     Navigable,
     HasGutterIcons,
     Poppable,
+    UserControllable,
 )
 from pt_miniscreen.core.utils import apply_layers, layer
 from pt_miniscreen.pages.root.network_menu import NetworkMenuPage
 from pt_miniscreen.pages.root.overview import getOverviewPage
-from pt_miniscreen.pages.root.projects import (
-    ProjectsMenuPage,
-    ProjectPage,
+from pt_miniscreen.pages.root.projects.menu_page import ProjectsMenuPage
+from pt_miniscreen.pages.root.screensaver import (
+    SCREENSAVERS,
+    get_screensaver_settings,
 )
-from pt_miniscreen.pages.root.screensaver import StarfieldScreensaver
 from pt_miniscreen.pages.root.settings_menu import SettingsMenuPage
 from pt_miniscreen.pages.root.system_menu import SystemMenuPage
 from pt_miniscreen.utils import ButtonEvents, get_image_file_path
@@ -35,17 +42,6 @@ from pt_miniscreen.utils import ButtonEvents, get_image_file_path
 logger = logging.getLogger(__name__)
 
 
-def get_bootsplash_image_path():
-    try:
-        config = ConfigParser()
-        config.read("/etc/pt-miniscreen/settings.ini")
-        return config.get("Bootsplash", "Path")
-    except Exception:
-        pass
-
-    return get_image_file_path("startup/pi-top_startup.gif")
-
-
 class RootPageList(EnterablePageList):
     def __init__(self, **kwargs):
         super().__init__(
@@ -57,6 +53,9 @@ class RootPageList(EnterablePageList):
                 SettingsMenuPage,
             ],
             use_snapshot_when_scrolling=False,
+            # build pages when they are first shown rather than on startup
+            virtual=True,
+            max_warm_rows=2,
             **kwargs,
         )
 
@@ -66,7 +65,7 @@ class RootComponent(Component):
     right_gutter_width = 10
     gutter_icon_padding = (3, 7)
 
-    def __init__(self, **kwargs):
+    def __init__(self, screensaver_settings=None, **kwargs):
         super().__init__(
             **kwargs,
             initial_state={
@@ -81,12 +80,16 @@ class RootComponent(Component):
             upper_icon_padding=self.gutter_icon_padding,
             lower_icon_padding=self.gutter_icon_padding,
         )
-        self.screensaver = self.create_child(StarfieldScreensaver)
-        self.bootsplash = self.create_child(
-            Image, loop=False, image_path=get_bootsplash_image_path()
+        self.screensaver_settings = screensaver_settings or get_screensaver_settings()
+        self.screensaver = self.create_child(
+            SCREENSAVERS[self.screensaver_settings.mode],
+            settings=self.screensaver_settings,
         )
+        self.watch_state("show_screensaver", self._on_show_screensaver_change)
+        self.bootsplash = None
 
         if self.state["show_bootsplash"]:
+            self.bootsplash = self._create_bootsplash()
             Thread(target=self._wait_for_bootsplash_finish, daemon=True).start()
 
         self._set_gutter_icons()
@@ -103,7 +106,7 @@ class RootComponent(Component):
 
     @property
     def is_project_page(self):
-        return isinstance(self.active_component, ProjectPage)
+        return isinstance(self.active_component, UserControllable)
 
     def project_uses_miniscreen(self, user_using_miniscreen):
         if self.is_project_page:
@@ -119,6 +122,16 @@ class RootComponent(Component):
         active_index = self.stack.active_index
         return False if active_index is None else active_index > 0
 
+    def _create_bootsplash(self):
+        image_path = get_bootsplash_image_path()
+
+        # prefer frames baked on install over decoding the image while booting
+        frames = load_bootsplash_frames(image_path)
+        if frames:
+            return self.create_child(BootsplashAnimation, frames=frames)
+
+        return self.create_child(Image, loop=False, image_path=image_path)
+
     def _wait_for_bootsplash_finish(self):
         # wait for bootsplash animation to finish
         self.bootsplash.stop_animating_event.wait(10)
@@ -132,6 +145,14 @@ class RootComponent(Component):
         # start showing main app
         self.state.update({"show_bootsplash": False})
 
+        # bake frames now that the system is less busy so the next boot can
+        # use them, which is needed when the configured image has changed
+        if not isinstance(self.bootsplash, BootsplashAnimation):
+            try:
+                bake_frames(get_bootsplash_image_path(), BOOTSPLASH_FRAMES_PATH)
+            except Exception as e:
+                logger.warning(f"Unable to bake bootsplash frames: {e}")
+
     def _set_gutter_icons(self):
         if isinstance(self.active_component, HasGutterIcons):
 
@@ -147,9 +168,14 @@ class RootComponent(Component):
                 }
             )
 
+    @property
+    def is_navigable(self):
+        return isinstance(self.active_component, Navigable)
+
     def handle_button(
         self,
         button_event: ButtonEvents,
+        distance: int = 1,
     ):
         try:
             if (
@@ -188,11 +214,11 @@ class RootComponent(Component):
 
             if isinstance(self.active_component, Navigable):
                 if button_event == ButtonEvents.UP_RELEASE:
-                    self.active_component.go_previous()
+                    self.active_component.go_previous(distance=distance)
                     return
 
                 if button_event == ButtonEvents.DOWN_RELEASE:
-                    self.active_component.go_next()
+                    self.active_component.go_next(distance=distance)
                     return
 
                 if button_event == ButtonEvents.CANCEL_RELEASE:
@@ -225,18 +251,19 @@ class RootComponent(Component):
     def stop_screensaver(self):
         self.state.update({"show_screensaver": False})
 
+    def sleep_screensaver(self):
+        # leave the last frame on the display without updating it
+        if self.is_screensaver_running:
+            self.screensaver.stop_animating()
+
     @property
     def is_screensaver_running(self):
         return self.state["show_screensaver"]
 
-    def on_state_change(self, previous_state):
-        show_screensaver = self.state["show_screensaver"]
-        prev_show_screensaver = previous_state["show_screensaver"]
-
-        if show_screensaver and not prev_show_screensaver:
+    def _on_show_screensaver_change(self, previous_state):
+        if self.state["show_screensaver"]:
             self.screensaver.start_animating()
-
-        if not show_screensaver and prev_show_screensaver:
+        else:
             self.screensaver.stop_animating()
 
     def render(self, image):
@@ -0,0 +1,205 @@
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from time import monotonic, sleep
+from typing import Dict, List, Tuple
+
+from .subscription import Publisher
+
+logger = logging.getLogger(__name__)
+
+MEMINFO_PATH = "/proc/meminfo"
+STAT_PATH = "/proc/stat"
+
+
+@dataclass
+class MemoryUsage:
+    total: int = 0
+    used: int = 0
+    percent: float = 0.0
+
+
+@dataclass
+class MetricsSnapshot:
+    memory: MemoryUsage = field(default_factory=MemoryUsage)
+    swap: MemoryUsage = field(default_factory=MemoryUsage)
+    cpu_percentages: List[float] = field(default_factory=list)
+    cpu_history: List[float] = field(default_factory=list)
+
+
+def read_meminfo(path: str = MEMINFO_PATH) -> Dict[str, int]:
+    """Returns the contents of /proc/meminfo as a dictionary of byte
+    values."""
+    meminfo = {}
+
+    try:
+        with open(path) as file:
+            for line in file:
+                key, value = line.split(":", 1)
+                fields = value.split()
+                multiplier = 1024 if fields[1:] == ["kB"] else 1
+                meminfo[key] = int(fields[0]) * multiplier
+    except Exception as e:
+        logger.warning(f"Unable to read {path}: {e}")
+
+    return meminfo
+
+
+def get_memory_usage(meminfo: Dict[str, int]) -> MemoryUsage:
+    # calculate usage the same way as psutil.virtual_memory
+    total = meminfo.get("MemTotal", 0)
+    free = meminfo.get("MemFree", 0)
+    cached = meminfo.get("Cached", 0) + meminfo.get("SReclaimable", 0)
+    available = meminfo.get("MemAvailable", free + cached)
+
+    used = total - free - cached - meminfo.get("Buffers", 0)
+    if used < 0:
+        used = total - free
+
+    percent = (total - available) * 100 / total if total else 0.0
+    return MemoryUsage(total=total, used=used, percent=percent)
+
+
+def get_swap_usage(meminfo: Dict[str, int]) -> MemoryUsage:
+    total = meminfo.get("SwapTotal", 0)
+    used = total - meminfo.get("SwapFree", 0)
+    percent = used * 100 / total if total else 0.0
+    return MemoryUsage(total=total, used=used, percent=percent)
+
+
+def read_cpu_times(path: str = STAT_PATH) -> List[Tuple[int, int]]:
+    """Returns a (busy, total) tuple of time counters for each core listed in
+    /proc/stat."""
+    cpu_times = []
+
+    try:
+        with open(path) as file:
+            for line in file:
+                name, *values = line.split()
+                if not name.startswith("cpu"):
+                    # per-core lines come first so there's no need to continue
+                    break
+
+                # skip the aggregate "cpu" line
+                if name == "cpu":
+                    continue
+
+                # user nice system idle iowait irq softirq steal, guest time is
+                # already included in user and nice so it is not added here
+                times = [int(value) for value in values[:8]]
+                idle = times[3] + times[4]
+                total = sum(times)
+                cpu_times.append((total - idle, total))
+    except Exception as e:
+        logger.warning(f"Unable to read {path}: {e}")
+
+    return cpu_times
+
+
+class CPUUsage:
+    """Calculates per-core utilisation from the difference between successive
+    /proc/stat samples, so measuring usage never has to sleep.
+
+    The average utilisation of each sample is kept in a short history which
+    can be used to show recent load.
+    """
+
+    def __init__(self, history_length=30):
+        self.percentages: List[float] = []
+        self.history = deque(maxlen=history_length)
+        self._previous_times: List[Tuple[int, int]] = []
+
+    def update(self, cpu_times: List[Tuple[int, int]]) -> List[float]:
+        # the first sample is compared against boot so usage is available
+        # immediately rather than after a second sample
+        previous_times = self._previous_times
+        if len(previous_times) != len(cpu_times):
+            previous_times = [(0, 0)] * len(cpu_times)
+
+        percentages = []
+        for (busy, total), (previous_busy, previous_total) in zip(
+            cpu_times, previous_times
+        ):
+            total_delta = total - previous_total
+            busy_delta = busy - previous_busy
+            percent = busy_delta * 100 / total_delta if total_delta > 0 else 0.0
+            percentages.append(min(max(percent, 0.0), 100.0))
+
+        self._previous_times = cpu_times
+        self.percentages = percentages
+        if percentages:
+            self.history.append(sum(percentages) / len(percentages))
+
+        return percentages
+
+
+class MetricsSampler(Publisher):
+    """Samples system metrics once per interval and publishes a
+    MetricsSnapshot to every active subscriber.
+
+    Pages showing memory and CPU usage share a sampler so that each metric
+    is only read once per interval no matter how many components display
+    it. The sampler thread sleeps while there are no subscribers and skips
+    sampling while none of them are active.
+    """
+
+    def __init__(self, interval=1):
+        super().__init__()
+        self.interval = interval
+        self._snapshot_lock = threading.Lock()
+        self._snapshot = None
+        self._snapshot_time = None
+        self._thread = None
+        self.cpu_usage = CPUUsage()
+
+    def sample(self) -> MetricsSnapshot:
+        meminfo = read_meminfo()
+        cpu_times = read_cpu_times()
+
+        with self._snapshot_lock:
+            snapshot = MetricsSnapshot(
+                memory=get_memory_usage(meminfo),
+                swap=get_swap_usage(meminfo),
+                cpu_percentages=self.cpu_usage.update(cpu_times),
+                cpu_history=list(self.cpu_usage.history),
+            )
+            self._snapshot = snapshot
+            self._snapshot_time = monotonic()
+
+        return snapshot
+
+    def get_snapshot(self) -> MetricsSnapshot:
+        """Returns the latest snapshot, sampling again if it is older than
+        the interval."""
+        with self._snapshot_lock:
+            snapshot = self._snapshot
+            snapshot_time = self._snapshot_time
+
+        if snapshot is None or monotonic() - snapshot_time >= self.interval:
+            return self.sample()
+
+        return snapshot
+
+    def subscribe(self, callback, active_event=None):
+        subscription = super().subscribe(callback, active_event=active_event)
+
+        with self._condition:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+        return subscription
+
+    def _run(self):
+        while True:
+            self.wait_for_subscribers()
+            sleep(self.interval)
+
+            subscriptions = self.active_subscriptions
+            if subscriptions:
+                self.publish(self.sample(), subscriptions)
+
+
+# pages share a single sampler so metrics are only read once per interval
+metrics_sampler = MetricsSampler()
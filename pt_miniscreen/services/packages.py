@@ -0,0 +1,73 @@
+import logging
+import threading
+from os import stat
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DPKG_STATUS_FILE = "/var/lib/dpkg/status"
+
+
+def read_installed_packages(path: str = DPKG_STATUS_FILE) -> Dict[str, str]:
+    """Returns a dictionary of installed package names to versions from the
+    dpkg status file."""
+    packages = {}
+    name = version = status = None
+
+    def add_package():
+        if name and status and status.endswith(" installed"):
+            packages[name] = version
+
+    try:
+        with open(path, encoding="utf-8", errors="replace") as file:
+            for line in file:
+                if line.startswith("Package: "):
+                    name = line[9:].strip()
+                elif line.startswith("Status: "):
+                    status = line[8:].strip()
+                elif line.startswith("Version: "):
+                    version = line[9:].strip()
+                elif line == "\n":
+                    add_package()
+                    name = version = status = None
+            add_package()
+    except Exception as e:
+        logger.warning(f"Unable to read {path}: {e}")
+
+    return packages
+
+
+class PackageIndex:
+    """Index of installed packages read from the dpkg status file.
+
+    The status file is only parsed again when its modification time changes,
+    so lookups are cheap enough to do while building pages.
+    """
+
+    def __init__(self, status_file: str = DPKG_STATUS_FILE):
+        self.status_file = status_file
+        self._lock = threading.Lock()
+        self._packages: Dict[str, str] = {}
+        self._mtime = None
+
+    def _get_packages(self) -> Dict[str, str]:
+        try:
+            mtime = stat(self.status_file).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        with self._lock:
+            if mtime is None or mtime != self._mtime:
+                self._packages = read_installed_packages(self.status_file)
+                self._mtime = mtime
+
+            return self._packages
+
+    def is_installed(self, package_name: str) -> bool:
+        return package_name in self._get_packages()
+
+    def get_version(self, package_name: str) -> Optional[str]:
+        return self._get_packages().get(package_name)
+
+
+package_index = PackageIndex()
@@ -0,0 +1,187 @@
+import logging
+import os
+import signal
+import threading
+from dataclasses import dataclass, field
+from subprocess import Popen
+from time import monotonic
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROC_PATH = "/proc"
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+class ProcessAlreadyRunning(RuntimeError):
+    pass
+
+
+@dataclass
+class ProcessUsage:
+    cpu_time: float = 0.0  # user and system time in seconds
+    max_rss: int = 0  # bytes
+    duration: float = 0.0  # seconds
+
+
+@dataclass
+class SupervisedProcess:
+    key: str
+    process: Popen
+    started: float = field(default_factory=monotonic)
+    exit_code: Optional[int] = None
+    usage: Optional[ProcessUsage] = None
+    sampled_usage: Optional[ProcessUsage] = None
+    finished: threading.Event = field(default_factory=threading.Event)
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    def wait(self, timeout=None) -> Optional[int]:
+        self.finished.wait(timeout)
+        return self.exit_code
+
+
+def read_process_group_usage(
+    pgid: int, proc_path: str = PROC_PATH
+) -> Tuple[float, int]:
+    """Returns the CPU time in seconds used by the processes in group `pgid`,
+    including children they have waited for, and their total resident memory
+    in bytes."""
+    cpu_time = 0.0
+    rss = 0
+
+    try:
+        entries = [
+            entry.name for entry in os.scandir(proc_path) if entry.name.isdigit()
+        ]
+    except OSError as e:
+        logger.warning(f"Unable to read {proc_path}: {e}")
+        return cpu_time, rss
+
+    for pid in entries:
+        try:
+            with open(f"{proc_path}/{pid}/stat") as file:
+                # the command name is in brackets and can contain spaces
+                fields = file.read().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            # the process exited while the group was being read
+            continue
+
+        if int(fields[2]) != pgid:
+            continue
+
+        # utime, stime, cutime and cstime are in clock ticks
+        cpu_time += sum(int(value) for value in fields[11:15]) / CLOCK_TICKS
+        rss += int(fields[21]) * PAGE_SIZE
+
+    return cpu_time, rss
+
+
+class ProcessSupervisor:
+    """Starts processes in their own process group and keeps track of them
+    by key until they exit.
+
+    Checking whether a process is running is a dictionary lookup and stopping
+    one signals its whole group, so anything it started is stopped with it.
+    Once a process exits anything left in its group is killed, since it could
+    no longer be stopped after the process stops being tracked.
+    Each process is reaped with `wait4`, which also reports the CPU time and
+    peak memory used by the process and the children it waited for. While a
+    process runs `sample_usage` reads the usage of its group from /proc.
+    """
+
+    def __init__(self):
+        self._processes: Dict[str, SupervisedProcess] = {}
+        self._lock = threading.Lock()
+        self.last_runs: Dict[str, SupervisedProcess] = {}
+
+    def is_running(self, key: str) -> bool:
+        return key in self._processes
+
+    def get(self, key: str) -> Optional[SupervisedProcess]:
+        return self._processes.get(key)
+
+    def sample_usage(self, key: str) -> Optional[ProcessUsage]:
+        """Returns the usage of a running process and its group so far, read
+        from /proc. Memory is the highest total seen by any sample."""
+        supervised = self.get(key)
+        if supervised is None:
+            return None
+
+        cpu_time, rss = read_process_group_usage(supervised.pid)
+        previous_usage = supervised.sampled_usage
+        supervised.sampled_usage = ProcessUsage(
+            cpu_time=cpu_time,
+            max_rss=max(rss, previous_usage.max_rss if previous_usage else 0),
+            duration=monotonic() - supervised.started,
+        )
+        return supervised.sampled_usage
+
+    def start(self, key: str, args, **kwargs) -> SupervisedProcess:
+        with self._lock:
+            if key in self._processes:
+                raise ProcessAlreadyRunning(f"{key} is already running")
+
+            supervised = SupervisedProcess(
+                key=key, process=Popen(args, start_new_session=True, **kwargs)
+            )
+            self._processes[key] = supervised
+
+        threading.Thread(target=self._reap, args=(supervised,), daemon=True).start()
+        return supervised
+
+    def stop(self, key: str, sig=signal.SIGTERM) -> bool:
+        supervised = self.get(key)
+        if supervised is None:
+            return False
+
+        try:
+            # the group id of a new session is the pid of its leader
+            os.killpg(supervised.pid, sig)
+        except ProcessLookupError:
+            return False
+
+        return True
+
+    def _reap(self, supervised: SupervisedProcess):
+        try:
+            _, status, rusage = os.wait4(supervised.pid, 0)
+            supervised.exit_code = os.waitstatus_to_exitcode(status)
+            supervised.usage = ProcessUsage(
+                cpu_time=rusage.ru_utime + rusage.ru_stime,
+                max_rss=rusage.ru_maxrss * 1024,
+                duration=monotonic() - supervised.started,
+            )
+            # let Popen know the process has already been waited for
+            supervised.process.returncode = supervised.exit_code
+        except ChildProcessError:
+            supervised.exit_code = supervised.process.poll()
+        except Exception as e:
+            logger.error(f"Error waiting for {supervised.key}: {e}")
+
+        if supervised.usage:
+            logger.info(
+                f"{supervised.key} exited with code {supervised.exit_code} after "
+                f"{supervised.usage.duration:.1f}s, using "
+                f"{supervised.usage.cpu_time:.1f}s of CPU time and "
+                f"{supervised.usage.max_rss // 1024}KiB of memory at peak"
+            )
+
+        try:
+            # the group outlives its leader while anything it started runs
+            os.killpg(supervised.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+        with self._lock:
+            self._processes.pop(supervised.key, None)
+            self.last_runs[supervised.key] = supervised
+
+        supervised.finished.set()
+
+
+# projects started from anywhere in the app share a supervisor
+process_supervisor = ProcessSupervisor()
@@ -0,0 +1,92 @@
+import logging
+import threading
+from os import scandir, stat
+from re import MULTILINE, compile
+from typing import Dict, Iterable, List, Optional
+
+from .packages import PackageIndex, package_index
+
+logger = logging.getLogger(__name__)
+
+APT_SOURCES_DIRECTORY = "/etc/apt/sources.list.d"
+PI_TOP_REPOSITORY_REGEX = compile(
+    r"pi-top[.]com\/(?P<repository>[a-z-]+)\/debian", MULTILINE
+)
+
+
+def find_pi_top_repository(sources: str) -> Optional[str]:
+    match = PI_TOP_REPOSITORY_REGEX.search(sources)
+    return match.group("repository") if match else None
+
+
+def read_apt_repositories(sources_dir: str = APT_SOURCES_DIRECTORY) -> List[str]:
+    """Returns the pi-top repositories configured in the apt sources
+    directory, at most one per sources file."""
+    repos = []
+
+    try:
+        filenames = sorted(entry.path for entry in scandir(sources_dir))
+    except OSError:
+        return repos
+
+    for filename in filenames:
+        try:
+            with open(filename) as file:
+                repo = find_pi_top_repository(file.read())
+        except Exception as e:
+            logger.warning(f"Unable to read {filename}: {e}")
+            continue
+
+        if repo:
+            repos.append(repo)
+
+    return repos
+
+
+class SoftwareInventory:
+    """Installed package versions and configured pi-top repositories.
+
+    Package versions come from a PackageIndex so any number of packages can be
+    looked up with a single pass over the dpkg status file. Repositories are
+    only read again when a file in the sources directory changes.
+    """
+
+    def __init__(
+        self,
+        packages: PackageIndex = package_index,
+        sources_dir: str = APT_SOURCES_DIRECTORY,
+    ):
+        self.packages = packages
+        self.sources_dir = sources_dir
+        self._lock = threading.Lock()
+        self._repositories: List[str] = []
+        self._sources_fingerprint = None
+
+    def get_package_versions(self, package_names: Iterable[str]) -> Dict[str, str]:
+        """Returns the installed version of each package, or an empty string
+        for packages that aren't installed."""
+        return {name: self.packages.get_version(name) or "" for name in package_names}
+
+    def _get_sources_fingerprint(self):
+        try:
+            return tuple(
+                sorted(
+                    (entry.name, entry.stat().st_mtime_ns)
+                    for entry in scandir(self.sources_dir)
+                )
+            ) + (stat(self.sources_dir).st_mtime_ns,)
+        except OSError:
+            return None
+
+    def get_repositories(self) -> List[str]:
+        fingerprint = self._get_sources_fingerprint()
+
+        with self._lock:
+            if fingerprint is None or fingerprint != self._sources_fingerprint:
+                self._repositories = read_apt_repositories(self.sources_dir)
+                self._sources_fingerprint = fingerprint
+
+            return list(self._repositories)
+
+
+software_inventory = SoftwareInventory()
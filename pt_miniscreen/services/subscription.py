@@ -0,0 +1,88 @@
+import logging
+import threading
+from weakref import WeakMethod, ref
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    def __init__(self, publisher, callback, active_event=None):
+        self._get_publisher = ref(publisher)
+        self.get_active_event = ref(active_event) if active_event else lambda: None
+
+        # Use a WeakMethod to store the callback so that the publisher does not
+        # produce a circular reference with the Component that created it which
+        # would result in memory leaks.
+        self._get_callback = WeakMethod(callback)
+
+    @property
+    def callback(self):
+        return self._get_callback()
+
+    @property
+    def active(self):
+        active_event = self.get_active_event()
+        return not isinstance(active_event, threading.Event) or active_event.is_set()
+
+    def cancel(self):
+        publisher = self._get_publisher()
+        if publisher is not None:
+            publisher.unsubscribe(self)
+
+
+class Publisher:
+    """Keeps track of subscribed callbacks and passes published values to
+    them.
+
+    Subscribers can pass an `active_event`, usually the `active_event` of
+    the component subscribing, so that publishers can avoid doing work while
+    nothing that uses the result is being rendered.
+    """
+
+    def __init__(self):
+        self._subscriptions = []
+        self._condition = threading.Condition()
+
+    @property
+    def subscriptions(self):
+        with self._condition:
+            return list(self._subscriptions)
+
+    @property
+    def active_subscriptions(self):
+        with self._condition:
+            return [s for s in self._subscriptions if s.active]
+
+    def subscribe(self, callback, active_event=None) -> Subscription:
+        subscription = Subscription(self, callback, active_event=active_event)
+
+        with self._condition:
+            self._subscriptions.append(subscription)
+            self._condition.notify_all()
+
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._condition:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def wait_for_subscribers(self):
+        with self._condition:
+            self._condition.wait_for(lambda: len(self._subscriptions) > 0)
+
+    def publish(self, value, subscriptions=None):
+        if subscriptions is None:
+            subscriptions = self.active_subscriptions
+
+        for subscription in subscriptions:
+            callback = subscription.callback
+            if callback is None:
+                # owner has been garbage collected
+                self.unsubscribe(subscription)
+                continue
+
+            try:
+                callback(value)
+            except Exception as e:
+                logger.error(f"Error publishing to {callback}: {e}")
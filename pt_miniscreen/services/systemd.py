@@ -0,0 +1,218 @@
+import logging
+import threading
+from os import scandir, stat
+from shlex import split
+from subprocess import run
+from time import sleep
+from typing import Dict, Iterable, List
+
+from .subscription import Publisher
+
+logger = logging.getLogger(__name__)
+
+SSH_SERVICE = "ssh"
+VNC_SERVICE = "vncserver-x11-serviced.service"
+WEB_VNC_SERVICE = "pt-web-vnc-desktop.service"
+FURTHER_LINK_SERVICE = "further-link.service"
+
+SYSTEMD_CONFIG_DIRECTORY = "/etc/systemd/system"
+
+
+def enabled_state_from_unit_file_state(unit_file_state: str) -> str:
+    # match the values returned by pitop's get_systemd_enabled_state
+    if "enabled" in unit_file_state:
+        return "Enabled"
+    if "disabled" in unit_file_state:
+        return "Disabled"
+    if "masked" in unit_file_state:
+        return "Masked"
+    return "Unknown"
+
+
+def parse_unit_file_states(output: str, units: List[str]) -> Dict[str, str]:
+    """Parses the output of `systemctl show --property=UnitFileState` for
+    `units`, which systemctl prints in the order they were requested."""
+    blocks = output.strip().split("\n\n") if output.strip() else []
+    states = {}
+
+    for unit, block in zip(units, blocks):
+        unit_file_state = ""
+        for line in block.splitlines():
+            if line.startswith("UnitFileState="):
+                unit_file_state = line.split("=", 1)[1]
+        states[unit] = enabled_state_from_unit_file_state(unit_file_state)
+
+    return states
+
+
+def get_unit_config_fingerprint(directory: str = SYSTEMD_CONFIG_DIRECTORY):
+    """Returns the modification times of the systemd config directory and its
+    .wants/.requires directories, which change whenever a unit is enabled,
+    disabled or masked."""
+    try:
+        fingerprint = [("", stat(directory).st_mtime_ns)]
+        for entry in scandir(directory):
+            if entry.name.endswith((".wants", ".requires")) and entry.is_dir():
+                fingerprint.append((entry.name, entry.stat().st_mtime_ns))
+    except OSError:
+        return None
+
+    return tuple(sorted(fingerprint))
+
+
+class SystemdClient(Publisher):
+    """Reads the enabled state of systemd services and caches the result.
+
+    The states of every known service are fetched with a single `systemctl
+    show` call. Subscribers are sent a dictionary of the services whose state
+    changed whenever the states are refreshed.
+
+    Cached states are reused until the systemd config directories change, so
+    reading them normally only costs a few stat calls and systemctl is only
+    called again when a unit has been enabled, disabled or masked. While a
+    subscriber is active the directories are watched so that changes made
+    elsewhere, such as enabling SSH from the desktop, are pushed to it. The
+    standard library has no inotify API so they are checked once per
+    `watch_interval`, which is skipped while every subscriber is inactive.
+
+    Changes are published to inactive subscribers as well. Once a change has
+    been read the config is no longer stale, so a page that was inactive when
+    it happened, like a warm settings page, would otherwise never see it.
+    """
+
+    def __init__(
+        self,
+        units: Iterable[str] = (),
+        watch_interval: float = 1,
+        config_directory: str = SYSTEMD_CONFIG_DIRECTORY,
+    ):
+        super().__init__()
+        self.watch_interval = watch_interval
+        self.config_directory = config_directory
+        self._units: List[str] = list(units)
+        self._states: Dict[str, str] = {}
+        self._refreshed = False
+        self._fingerprint = None
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def _systemctl(self, command: str, timeout=10) -> str:
+        response = run(
+            split(command), check=False, capture_output=True, timeout=timeout
+        )
+        return str(response.stdout, "utf8")
+
+    def _refresh(self) -> Dict[str, str]:
+        # must be called with the lock held, returns services that changed
+        units = list(self._units)
+        fingerprint = get_unit_config_fingerprint(self.config_directory)
+        try:
+            output = self._systemctl(
+                f"systemctl show --property=UnitFileState {' '.join(units)}"
+            )
+            states = parse_unit_file_states(output, units)
+        except Exception as e:
+            logger.warning(f"Unable to read state of {units}: {e}")
+            states = {unit: "Unknown" for unit in units}
+
+        changes = {
+            unit: state
+            for unit, state in states.items()
+            if self._states.get(unit) != state
+        }
+        self._states.update(states)
+        self._refreshed = True
+        self._fingerprint = fingerprint
+        return changes
+
+    def _is_stale(self) -> bool:
+        return (
+            not self._refreshed
+            or get_unit_config_fingerprint(self.config_directory) != self._fingerprint
+        )
+
+    def refresh(self) -> None:
+        with self._lock:
+            changes = self._refresh()
+
+        if changes:
+            self._publish_changes(changes)
+
+    def _publish_changes(self, changes: Dict[str, str]) -> None:
+        self.publish(changes, self.subscriptions)
+
+    def get_enabled_state(self, unit: str) -> str:
+        changes = {}
+
+        # pages ask for their state at the same time, holding the lock while
+        # refreshing means only the first of them calls systemctl
+        with self._lock:
+            if unit not in self._units:
+                self._units.append(unit)
+
+            if unit not in self._states or self._is_stale():
+                changes = self._refresh()
+
+            state = self._states.get(unit, "Unknown")
+
+        if changes:
+            self._publish_changes(changes)
+
+        return state
+
+    def refresh_if_stale(self) -> None:
+        with self._lock:
+            changes = self._refresh() if self._is_stale() else {}
+
+        if changes:
+            self._publish_changes(changes)
+
+    def subscribe(self, callback, active_event=None):
+        subscription = super().subscribe(callback, active_event=active_event)
+
+        with self._condition:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._watch, daemon=True)
+                self._thread.start()
+
+        return subscription
+
+    def _watch(self):
+        while True:
+            self.wait_for_subscribers()
+            sleep(self.watch_interval)
+
+            # only stat the config directories while a page shows the result
+            if self.active_subscriptions:
+                self.refresh_if_stale()
+
+    def enable_and_start(self, unit: str):
+        self._systemctl(f"sudo systemctl enable --now {unit}", timeout=30)
+        self.refresh()
+
+    def disable_and_stop(self, unit: str):
+        self._systemctl(f"sudo systemctl disable --now {unit}", timeout=30)
+        self.refresh()
+
+
+# settings pages share a client so opening the settings menu only needs a
+# single systemctl call to read the state of every service
+systemd = SystemdClient(
+    units=(SSH_SERVICE, VNC_SERVICE, WEB_VNC_SERVICE, FURTHER_LINK_SERVICE)
+)
+
+
+def get_systemd_enabled_state(unit: str) -> str:
+    return systemd.get_enabled_state(unit)
+
+
+def get_ssh_enabled_state() -> str:
+    return systemd.get_enabled_state(SSH_SERVICE)
+
+
+def get_vnc_enabled_state() -> str:
+    return systemd.get_enabled_state(VNC_SERVICE)
+
+
+def get_pt_further_link_enabled_state() -> str:
+    return systemd.get_enabled_state(FURTHER_LINK_SERVICE)
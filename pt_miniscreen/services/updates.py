@@ -0,0 +1,103 @@
+import logging
+import threading
+from os import stat
+from time import monotonic
+from typing import Callable, Iterable, Union
+
+from .subscription import Publisher
+
+logger = logging.getLogger(__name__)
+
+APT_LISTS_DIRECTORY = "/var/lib/apt/lists"
+UPDATE_CHECK_MAX_AGE = 15 * 60  # seconds
+
+
+def get_mtime(path: str):
+    try:
+        return stat(path).st_mtime_ns
+    except Exception:
+        return None
+
+
+class CachedCheck(Publisher):
+    """Runs a slow check in a background thread and caches the result.
+
+    The check is only run again once the cached result is older than
+    `max_age` or when one of the watched paths has been modified since the
+    last check, so reading the value is always instant. Subscribers are sent
+    the new value as soon as a check finishes.
+    """
+
+    def __init__(
+        self,
+        check: Callable,
+        watched_paths: Union[Iterable[str], Callable] = (),
+        max_age: float = UPDATE_CHECK_MAX_AGE,
+        initial_value=None,
+    ):
+        super().__init__()
+        self.max_age = max_age
+        self._check = check
+        self._watched_paths = watched_paths
+        self._value = initial_value
+        self._checked_time = None
+        self._fingerprint = None
+        self._checking = False
+        self._lock = threading.Lock()
+
+    @property
+    def value(self):
+        return self._value
+
+    @property
+    def watched_paths(self):
+        if callable(self._watched_paths):
+            return self._watched_paths()
+        return self._watched_paths
+
+    def _get_fingerprint(self):
+        return tuple(get_mtime(path) for path in self.watched_paths)
+
+    @property
+    def is_stale(self) -> bool:
+        if self._checked_time is None:
+            return True
+
+        if monotonic() - self._checked_time >= self.max_age:
+            return True
+
+        return self._get_fingerprint() != self._fingerprint
+
+    def get(self):
+        """Returns the cached value and starts a check in the background if it
+        is stale."""
+        self.check_if_stale()
+        return self._value
+
+    def check_if_stale(self) -> None:
+        with self._lock:
+            if self._checking or not self.is_stale:
+                return
+
+            self._checking = True
+
+        threading.Thread(target=self._run_check, daemon=True).start()
+
+    def _run_check(self):
+        # take fingerprint before checking so changes made during the check
+        # cause it to run again
+        fingerprint = self._get_fingerprint()
+        value = self._value
+
+        try:
+            value = self._check()
+        except Exception as e:
+            logger.warning(f"Error running {self._check}: {e}")
+
+        with self._lock:
+            self._value = value
+            self._fingerprint = fingerprint
+            self._checked_time = monotonic()
+            self._checking = False
+
+        self.publish(value)
@@ -0,0 +1,17 @@
+import logging
+from configparser import ConfigParser
+
+logger = logging.getLogger(__name__)
+
+SETTINGS_PATH = "/etc/pt-miniscreen/settings.ini"
+
+
+def read_settings(path: str = SETTINGS_PATH) -> ConfigParser:
+    """Reads the settings file, which is empty if it doesn't exist."""
+    config = ConfigParser()
+    try:
+        config.read(path)
+    except Exception as e:
+        logger.warning(f"Unable to read settings from {path}: {e}")
+
+    return config
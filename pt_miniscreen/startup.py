@@ -0,0 +1,146 @@
+import logging
+import os
+import sys
+from contextlib import contextmanager
+from importlib.abc import Loader, MetaPathFinder
+from time import monotonic
+from typing import Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def get_process_age() -> float:
+    """Returns the number of seconds since this process was started, so the
+    timeline includes the time taken to start the interpreter."""
+    try:
+        with open("/proc/self/stat") as file:
+            # the command name can contain spaces so split after it
+            fields = file.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as file:
+            uptime = float(file.read().split()[0])
+
+        start_time = int(fields[19]) / os.sysconf("SC_CLK_TCK")
+        return max(uptime - start_time, 0.0)
+    except Exception:
+        return 0.0
+
+
+class TimedLoader(Loader):
+    def __init__(self, loader, name, on_loaded):
+        self._loader = loader
+        self._name = name
+        self._on_loaded = on_loaded
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        start_time = monotonic()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._on_loaded(self._name, monotonic() - start_time)
+
+
+class ImportTimer(MetaPathFinder):
+    """Times how long each module takes to import, including the modules it
+    imports, in the same way as `python -X importtime`."""
+
+    def __init__(self, on_loaded):
+        self._on_loaded = on_loaded
+
+    def install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        # find the spec using the other finders and wrap its loader
+        for finder in sys.meta_path:
+            find_spec = getattr(finder, "find_spec", None)
+            if finder is self or find_spec is None:
+                continue
+
+            spec = find_spec(fullname, path, target)
+            if spec is None:
+                continue
+
+            if hasattr(spec.loader, "exec_module"):
+                spec.loader = TimedLoader(spec.loader, fullname, self._on_loaded)
+
+            return spec
+
+        return None
+
+
+class StartupTimeline:
+    """Records when each stage of startup happened and how long imports took.
+
+    Stages are always recorded as they are cheap. Timing every import is only
+    done once `time_imports` is called, which should happen as early as
+    possible.
+    """
+
+    def __init__(self):
+        self.start_time = monotonic() - get_process_age()
+        self.events: List[Tuple[str, float]] = []
+        self.import_times: Dict[str, float] = {}
+        self._import_timer = ImportTimer(self._record_import)
+
+    def elapsed(self) -> float:
+        return monotonic() - self.start_time
+
+    def mark(self, name: str):
+        elapsed = self.elapsed()
+        self.events.append((name, elapsed))
+        logger.debug(f"Startup: {name} after {elapsed:.3f}s")
+
+    def _record_import(self, name: str, duration: float):
+        self.import_times[name] = duration
+
+    def time_imports(self):
+        self._import_timer.install()
+
+    def stop_timing_imports(self):
+        self._import_timer.uninstall()
+
+    @contextmanager
+    def time_import(self, name: str):
+        """Times a deferred import, which happens after startup."""
+        start_time = monotonic()
+        try:
+            yield
+        finally:
+            if name not in self.import_times:
+                self._record_import(name, monotonic() - start_time)
+
+    def report(self, num_imports=20) -> str:
+        lines = ["Startup timeline:"]
+        for name, elapsed in self.events:
+            lines.append(f"  {elapsed * 1000:8.1f}ms  {name}")
+
+        slowest_imports = sorted(
+            self.import_times.items(), key=lambda item: item[1], reverse=True
+        )[:num_imports]
+        if slowest_imports:
+            lines.append("Slowest imports (including their own imports):")
+            for name, duration in slowest_imports:
+                lines.append(f"  {duration * 1000:8.1f}ms  {name}")
+
+        return "\n".join(lines)
+
+    def to_dict(self):
+        return {
+            "events": {name: elapsed for name, elapsed in self.events},
+            "imports": dict(self.import_times),
+        }
+
+
+# times are measured from when the process started, not when this is imported
+timeline = StartupTimeline()
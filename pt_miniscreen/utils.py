@@ -1,5 +1,6 @@
 import PIL.Image
 import PIL.ImageDraw
+import importlib
 import linecache
 from enum import Enum, auto
 from os import path
@@ -8,6 +9,7 @@ from functools import partial
 from pt_miniscreen.core.components.text import create_wrapped_text
 
 from pt_miniscreen.core.utils import get_font
+from pt_miniscreen.startup import timeline
 
 VIEWPORT_HEIGHT = 64
 VIEWPORT_WIDTH = 128
@@ -30,6 +32,25 @@ def isclass(obj, cls) -> bool:
     )
 
 
+class LazyComponent:
+    """Stands in for a component class, importing it from `module` the first
+    time it is created. Pages listed in menus use this so that their modules
+    and dependencies are only loaded when they are first shown."""
+
+    def __init__(self, module: str, name: str) -> None:
+        self.module = module
+        self.name = name
+
+    def load(self):
+        with timeline.time_import(self.module):
+            module = importlib.import_module(self.module)
+
+        return getattr(module, self.name)
+
+    def __call__(self, **kwargs):
+        return self.load()(**kwargs)
+
+
 class ButtonEvents(Enum):
     UP_PRESS = auto()
     UP_RELEASE = auto()
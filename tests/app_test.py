@@ -1,4 +1,7 @@
 import logging
+from time import sleep
+
+import pytest
 
 from conftest import setup_app
 
@@ -20,7 +23,68 @@ def test_broken_pipe_error(mocker):
     mocker.patch.object(app, "_display", side_effect=BrokenPipeError())
     app.display()
 
-    # app root and timers are None because app has been stopped so process can end
+    # app root and idle check are None because app has been stopped so process can end
     assert app.root is None
-    assert app.dimming_timer is None
-    assert app.screensaver_timer is None
+    assert app.idle_check is None
+
+
+@pytest.fixture
+def idle_app(mocker):
+    setup_app(mocker, screensaver_timeout=0.2)
+
+    from pt_miniscreen.app import App
+
+    app = App()
+    app.start()
+
+    yield app
+
+    app.stop()
+
+
+def test_idle_states(idle_app):
+    from pt_miniscreen.app import IdleState
+
+    assert idle_app.idle_state == IdleState.ACTIVE
+
+    sleep(0.3)
+    assert idle_app.idle_state == IdleState.DIMMED
+    assert idle_app.miniscreen._contrast == 0
+    assert not idle_app.root.is_screensaver_running
+
+    sleep(0.2)
+    assert idle_app.idle_state == IdleState.SCREENSAVER
+    assert idle_app.root.is_screensaver_running
+
+    # screensaver doesn't sleep by default
+    assert idle_app.idle_check is None
+
+    # pressing a button wakes the app and restarts the idle timer
+    idle_app.miniscreen.select_button.release()
+    sleep(0.1)
+    assert idle_app.idle_state == IdleState.ACTIVE
+    assert idle_app.miniscreen._contrast == 255
+    assert not idle_app.root.is_screensaver_running
+    assert idle_app.idle_check is not None
+
+
+def test_button_presses_delay_dimming(idle_app, mocker):
+    from pt_miniscreen.app import IdleState
+    from pt_miniscreen.core.scheduler import scheduler
+
+    call_at = mocker.spy(scheduler, "call_at")
+
+    # presses while active only update the last input time
+    for _ in range(10):
+        idle_app.miniscreen.down_button.press()
+        sleep(0.01)
+
+    assert call_at.call_count == 0
+
+    # dimming is delayed until the timeout has passed since the last press
+    sleep(0.15)
+    assert idle_app.idle_state == IdleState.ACTIVE
+    assert call_at.call_count == 1
+
+    sleep(0.15)
+    assert idle_app.idle_state == IdleState.DIMMED
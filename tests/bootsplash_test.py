@@ -0,0 +1,150 @@
+import os
+from functools import partial
+from time import sleep
+
+import pytest
+from PIL import Image
+
+from pt_miniscreen.utils import get_image_file_path
+
+
+BOOTSPLASH_IMAGE_PATH = get_image_file_path("startup/pi-top_startup.gif")
+
+
+@pytest.fixture
+def frames_path(tmp_path):
+    return str(tmp_path / "bootsplash.frames")
+
+
+@pytest.fixture
+def create_bootsplash(create_component):
+    from pt_miniscreen.components.bootsplash import BootsplashAnimation
+
+    return partial(create_component, BootsplashAnimation)
+
+
+def create_gif(path, durations):
+    frames = [
+        Image.new("L", (128, 64), color=255 if index % 2 else 0)
+        for index in range(len(durations))
+    ]
+    frames[0].save(path, save_all=True, append_images=frames[1:], duration=durations)
+    return str(path)
+
+
+def test_baked_frames_match_decoded_frames(frames_path):
+    from pt_miniscreen.bootsplash import BootsplashFrames, bake_frames
+
+    bake_frames(BOOTSPLASH_IMAGE_PATH, frames_path)
+    frames = BootsplashFrames(frames_path)
+
+    with Image.open(BOOTSPLASH_IMAGE_PATH) as source:
+        assert len(frames) == source.n_frames
+        assert frames.size == (128, 64)
+        assert frames.frame_size == 1024
+
+        for index in range(source.n_frames):
+            source.seek(index)
+            expected = Image.new("1", (128, 64))
+            expected.paste(source.copy(), (0, 0))
+
+            assert frames.frame(index).tobytes() == expected.tobytes()
+            assert frames.duration(index) == source.info["duration"] / 1000
+
+    # the file is a small header followed by the packed frames
+    assert os.path.getsize(frames_path) < len(frames) * 1024 + 512
+
+    frames.close()
+
+
+def test_frames_keep_their_durations(tmp_path, frames_path):
+    from pt_miniscreen.bootsplash import BootsplashFrames, bake_frames
+
+    source_path = create_gif(tmp_path / "source.gif", [100, 250, 50])
+    bake_frames(source_path, frames_path)
+
+    frames = BootsplashFrames(frames_path)
+    assert [frames.duration(index) for index in range(len(frames))] == [
+        0.1,
+        0.25,
+        0.05,
+    ]
+    assert frames.frame(0).getpixel((0, 0)) == 0
+    assert frames.frame(1).getpixel((0, 0)) == 255
+    frames.close()
+
+
+def test_load_only_returns_frames_baked_from_source(tmp_path, frames_path):
+    from pt_miniscreen.bootsplash import bake_frames, load_bootsplash_frames
+
+    source_path = create_gif(tmp_path / "source.gif", [100, 100])
+
+    # frames have not been baked yet
+    assert load_bootsplash_frames(source_path, frames_path) is None
+
+    bake_frames(source_path, frames_path)
+    frames = load_bootsplash_frames(source_path, frames_path)
+    assert frames is not None
+    assert len(frames) == 2
+    frames.close()
+
+    # frames were baked from a different image
+    assert load_bootsplash_frames(BOOTSPLASH_IMAGE_PATH, frames_path) is None
+
+    # source has changed since frames were baked
+    stat = os.stat(source_path)
+    os.utime(source_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert load_bootsplash_frames(source_path, frames_path) is None
+
+
+def test_load_ignores_invalid_files(tmp_path, frames_path):
+    from pt_miniscreen.bootsplash import bake_frames, load_bootsplash_frames
+
+    source_path = create_gif(tmp_path / "source.gif", [100, 100])
+
+    with open(frames_path, "wb") as file:
+        file.write(b"not frames")
+    assert load_bootsplash_frames(source_path, frames_path) is None
+
+    bake_frames(source_path, frames_path)
+    os.truncate(frames_path, os.path.getsize(frames_path) - 1)
+    assert load_bootsplash_frames(source_path, frames_path) is None
+
+
+def test_animation_plays_frames_once(tmp_path, frames_path, create_bootsplash):
+    from pt_miniscreen.bootsplash import BootsplashFrames, bake_frames
+
+    source_path = create_gif(tmp_path / "source.gif", [200, 200, 200])
+    bake_frames(source_path, frames_path)
+    component = create_bootsplash(frames=BootsplashFrames(frames_path))
+
+    assert component.state["frame"] == 0
+    assert component.render(Image.new("1", (128, 64))).getpixel((0, 0)) == 0
+
+    sleep(0.3)
+    assert component.state["frame"] == 1
+    assert component.render(Image.new("1", (128, 64))).getpixel((0, 0)) == 255
+
+    assert component.stop_animating_event.wait(1)
+    assert component.state["frame"] == 2
+
+    component._cleanup()
+
+
+def test_animation_skips_late_frames(tmp_path, frames_path, create_bootsplash):
+    from pt_miniscreen.bootsplash import BootsplashFrames, bake_frames
+
+    source_path = create_gif(tmp_path / "source.gif", [100, 100, 100, 100])
+    bake_frames(source_path, frames_path)
+    component = create_bootsplash(frames=BootsplashFrames(frames_path))
+
+    # pausing the animation makes frames late, they are skipped on resume
+    component._set_active(False)
+    sleep(0.25)
+    component._set_active(True)
+
+    sleep(0.02)
+    assert component.state["frame"] >= 2
+    assert component.stop_animating_event.wait(1)
+
+    component._cleanup()
@@ -176,6 +176,146 @@ def test_on_state_change(mocker, parent):
     component.on_state_change.assert_called_with({"foo": "BAR"})
 
 
+def test_on_state_change_changed_keys(mocker, parent):
+    from pt_miniscreen.core import Component
+
+    component = parent.create_child(Component, initial_state={"foo": "bar", "count": 0})
+    mocker.patch.object(component, "on_state_change")
+
+    # only keys with new values are included
+    component.state.update({"foo": "bar", "count": 1, "new": "state"})
+    previous_state = component.on_state_change.call_args[0][0]
+    assert previous_state.changed_keys == {"count", "new"}
+
+    # previous state has the values from before the update
+    assert previous_state["count"] == 0
+    assert previous_state["foo"] == "bar"
+    assert "new" not in previous_state
+
+    # keys the update set keep their previous values after later updates
+    component.state.update({"foo": "BAR", "count": 2})
+    assert previous_state["foo"] == "bar"
+    assert previous_state["count"] == 0
+
+
+def test_state_update_checks_identity_first(parent):
+    from pt_miniscreen.core import Component
+
+    class Rows(list):
+        compared = False
+
+        def __eq__(self, other):
+            Rows.compared = True
+            return list.__eq__(self, other)
+
+    rows = Rows([1, 2, 3])
+    component = parent.create_child(Component, initial_state={"Rows": rows})
+
+    component.state.update({"Rows": rows})
+    assert not Rows.compared
+
+
+def test_state_update_with_mutated_value_does_not_rerender(mocker, parent):
+    from pt_miniscreen.core import Component
+
+    class Rows(Component):
+        def render(self, image):
+            for row in self.state["rows"]:
+                image.putpixel((row, 0), 1)
+            return image
+
+    rows = [0]
+    component = parent.create_child(Rows, initial_state={"rows": rows})
+    component.render(Image.new("1", (128, 64)))
+    mocker.patch.object(component, "on_state_change")
+
+    # the same object is never a change, even after it is mutated
+    rows.append(1)
+    component.state.update({"rows": rows})
+    component.on_state_change.assert_not_called()
+    parent.on_rerender_spy.assert_not_called()
+
+    # the state holds the mutated object, so changes need a new one
+    component.state.update({"rows": rows + [2]})
+    component.on_state_change.assert_called_once()
+    parent.on_rerender_spy.assert_called_once()
+
+
+def test_watch_state(parent):
+    from pt_miniscreen.core import Component
+
+    class Watcher(Component):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs, initial_state={"foo": "bar", "count": 0})
+            self.changes = []
+            self.watch_state("foo", self.on_foo_change)
+            self.watch_state(("foo", "count"), self.on_foo_or_count_change)
+
+        def on_foo_change(self, previous_state):
+            self.changes.append(("foo", previous_state["foo"]))
+
+        def on_foo_or_count_change(self, previous_state):
+            self.changes.append(("foo_or_count", set(previous_state.changed_keys)))
+
+    component = parent.create_child(Watcher)
+
+    # callbacks aren't called when watched keys don't change
+    component.state.update({"foo": "bar", "other": True})
+    assert component.changes == []
+
+    # callbacks are called when any of their keys change
+    component.state.update({"count": 1})
+    assert component.changes == [("foo_or_count", {"count"})]
+    component.changes.clear()
+
+    component.state.update({"foo": "BAR"})
+    assert component.changes == [("foo", "bar"), ("foo_or_count", {"foo"})]
+
+
+def test_batched_updates(mocker, parent, SpotComponent):
+    from pt_miniscreen.core import Component, batch
+
+    class Spots(Component):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.spot_one = self.create_child(SpotComponent)
+            self.spot_two = self.create_child(SpotComponent)
+
+        def render(self, image):
+            return self.spot_two.render(self.spot_one.render(image))
+
+    component = parent.create_child(Spots)
+    component.render(Image.new("1", (128, 64)))
+    render = mocker.spy(component, "_original_render")
+
+    # updates in a batch are reconciled once it closes
+    with batch():
+        component.spot_one.move_spot_right()
+        component.spot_two.move_spot_down()
+        component.spot_one.move_spot_down()
+        parent.on_rerender_spy.assert_not_called()
+
+    # parent is rerendered once for all of the updates
+    assert render.call_count == 1
+    parent.on_rerender_spy.assert_called_once()
+
+    # batches can be nested and are reconciled when the outermost closes
+    parent.on_rerender_spy.reset_mock()
+    with batch():
+        with batch():
+            component.spot_one.move_spot_right()
+        parent.on_rerender_spy.assert_not_called()
+        component.spot_two.move_spot_right()
+
+    parent.on_rerender_spy.assert_called_once()
+
+    # updates outside a batch are reconciled straight away
+    parent.on_rerender_spy.reset_mock()
+    component.spot_one.move_spot_right()
+    component.spot_two.move_spot_right()
+    assert parent.on_rerender_spy.call_count == 2
+
+
 def test_rerendering(parent, SpotComponent):
     component = parent.create_child(SpotComponent)
 
@@ -283,6 +423,54 @@ def test_intervals(parent, SpotComponent, render):
     assert output == create_spot_image((3, 2))
 
 
+def test_frame_callbacks(parent, SpotComponent, render):
+    from pt_miniscreen.core.clock import FrameCallback, frame_clock
+
+    class FrameSpot(SpotComponent):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.elapsed_times = []
+
+        def on_frame(self, elapsed):
+            self.elapsed_times.append(elapsed)
+
+    component = parent.create_child(FrameSpot)
+
+    # render so component becomes active
+    render(parent)
+
+    # returns a FrameCallback instance
+    frame_callback = component.create_frame_callback(component.on_frame)
+    assert isinstance(frame_callback, FrameCallback)
+
+    # callback is called every frame with the time elapsed since the last frame
+    sleep(0.5)
+    num_frames = len(component.elapsed_times)
+    assert num_frames > 0.5 / frame_clock.frame_time / 2
+    assert all(elapsed > 0 for elapsed in component.elapsed_times)
+    assert sum(component.elapsed_times) < 0.6
+
+    # callback is not called while component is paused
+    component._set_active(False)
+    sleep(0.1)
+    num_frames = len(component.elapsed_times)
+    sleep(0.3)
+    assert len(component.elapsed_times) == num_frames
+
+    # time spent paused is not included in elapsed time
+    component._set_active(True)
+    sleep(0.3)
+    assert max(component.elapsed_times) < 0.2
+
+    # calling `remove_frame_callback` stops the callback being called
+    component.remove_frame_callback(frame_callback)
+    sleep(0.1)
+    num_frames = len(component.elapsed_times)
+    sleep(0.3)
+    assert len(component.elapsed_times) == num_frames
+    assert frame_callback not in frame_clock._callbacks
+
+
 def test_pausing(parent, SpotComponent):
     from pt_miniscreen.core.component import Component
 
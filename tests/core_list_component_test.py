@@ -1,6 +1,5 @@
 import gc
 from functools import partial
-from math import ceil
 from time import sleep
 from weakref import ref
 
@@ -473,54 +472,50 @@ def test_scrolling_before_render(create_list, create_rows, render, snapshot):
     snapshot.assert_match(render(component), "scroll-up-before-initial-render.png")
 
 
-def test_scrolling_during_transition(create_list, create_rows, render, snapshot):
+def test_scrolling_during_transition(
+    manual_frame_clock, create_list, create_rows, render, snapshot
+):
     component = create_list(Rows=create_rows(5), num_visible_rows=3)
 
     # check initial render correct
     snapshot.assert_match(render(component), "position-1.png")
 
-    # scrolling down while transitioning down does nothing
+    # scrolling down while transitioning down scrolls further
     component.scroll_down()
-    sleep(0.05)
+    manual_frame_clock.tick(0.05)
     component.scroll_down()
-    sleep(0.25)
-    snapshot.assert_match(render(component), "position-2.png")
+    manual_frame_clock.tick(0.25)
+    snapshot.assert_match(render(component), "position-3.png")
 
-    # scrolling up while transitioning down nothing
-    component.scroll_down()
-    sleep(0.05)
+    # scrolling down while transitioning up finishes scrolling up first
     component.scroll_up()
-    sleep(0.25)
+    manual_frame_clock.tick(0.05)
+    component.scroll_down()
+    manual_frame_clock.tick(0.25)
     snapshot.assert_match(render(component), "position-3.png")
 
-    # scrolling up while transitioning up nothing
+    # scrolling again before a row has been scrolled jumps to the end
     component.scroll_up()
-    sleep(0.05)
     component.scroll_up()
-    sleep(0.25)
-    snapshot.assert_match(render(component), "position-2.png")
+    assert component.state["active_transition"] is None
+    snapshot.assert_match(render(component), "position-1.png")
 
-    # scrolling down while transitioning up nothing
-    component.scroll_up()
-    sleep(0.05)
+    # scrolling up while transitioning down finishes scrolling down first
     component.scroll_down()
-    sleep(0.25)
+    manual_frame_clock.tick(0.05)
+    component.scroll_up()
+    manual_frame_clock.tick(0.25)
     snapshot.assert_match(render(component), "position-1.png")
 
+    # scrolling past the end while transitioning does nothing
+    component.scroll_up()
+    assert component.state["active_transition"] is None
+    snapshot.assert_match(render(component), "position-1.png")
 
-def test_scrolling_animation(mocker, create_list, create_rows, render, snapshot):
-    def slow_transition(distance, duration):
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-
-    mocker.patch(
-        "pt_miniscreen.core.components.list.transition", side_effect=slow_transition
-    )
 
+def test_scrolling_animation(
+    manual_frame_clock, create_list, create_rows, render, snapshot
+):
     component = create_list(Rows=create_rows(3), num_visible_rows=2)
 
     # render component so scrolling is animated
@@ -528,38 +523,26 @@ def test_scrolling_animation(mocker, create_list, create_rows, render, snapshot)
 
     # scrolling down is animated correctly
     component.scroll_down()
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "scroll-down-1.png")
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "scroll-down-2.png")
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "scroll-down-3.png")
 
     # scrolling up is animated correctly
     component.scroll_up()
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "scroll-up-1.png")
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "scroll-up-2.png")
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "scroll-up-3.png")
 
 
 def test_virtual_list_scrolling_animation(
-    mocker, create_list, create_rows, render, snapshot
+    manual_frame_clock, create_list, create_rows, render, snapshot
 ):
-    def slow_transition(distance, duration):
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-
-    mocker.patch(
-        "pt_miniscreen.core.components.list.transition", side_effect=slow_transition
-    )
-
     component = create_list(Rows=create_rows(3), num_visible_rows=2, virtual=True)
 
     # render component so scrolling is animated
@@ -567,20 +550,20 @@ def test_virtual_list_scrolling_animation(
 
     # scrolling down is animated correctly
     component.scroll_down()
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "scroll-down-1.png")
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "scroll-down-2.png")
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "scroll-down-3.png")
 
     # scrolling up is animated correctly
     component.scroll_up()
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "scroll-up-1.png")
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "scroll-up-2.png")
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "scroll-up-3.png")
 
 
@@ -997,3 +980,85 @@ def test_row_cleanup_after_scrolling(create_list, create_rows, get_test_image_pa
     # rows that are scrolled out of view are cleaned up at the next garbage collection
     gc.collect()
     assert row() is None
+
+
+def test_virtual_list_keeps_warm_rows(create_list, render, NumberedRow):
+    created = []
+    cleaned_up = []
+
+    class CountedRow(NumberedRow):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            created.append(self.state["text"])
+
+        def cleanup(self):
+            cleaned_up.append(self.state["text"])
+
+    Rows = [partial(CountedRow, text=f"{i + 1}") for i in range(5)]
+    component = create_list(
+        Rows=Rows, num_visible_rows=1, virtual=True, max_warm_rows=1
+    )
+    render(component)
+
+    # rows scrolled out of view are kept up to the budget
+    component.scroll_down(animate=False)
+    assert created == ["1", "2"]
+    assert cleaned_up == []
+    assert [row.state["text"] for row in component.rows] == ["2"]
+
+    # warm rows are reused rather than created again
+    component.scroll_up(animate=False)
+    assert created == ["1", "2"]
+    assert [row.state["text"] for row in component.rows] == ["1"]
+
+    # least recently used rows are removed once over budget
+    component.scroll_down(animate=False)
+    component.scroll_down(animate=False)
+    assert created == ["1", "2", "3"]
+    assert cleaned_up == ["1"]
+
+    # warm rows are paused
+    render(component)
+    warm_rows = [row for row in component._children if row not in component.rows]
+    assert [row.state["text"] for row in warm_rows] == ["2"]
+    assert not warm_rows[0].active_event.is_set()
+
+
+@pytest.mark.parametrize("virtual", [False, True])
+def test_patch_rows_keeps_unchanged_rows(create_list, render, NumberedRow, virtual):
+    created = []
+    cleaned_up = []
+
+    class CountedRow(NumberedRow):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            created.append(self.state["text"])
+
+        def cleanup(self):
+            cleaned_up.append(self.state["text"])
+
+    Rows = [partial(CountedRow, text=text) for text in "abcde"]
+    component = create_list(
+        Rows=Rows, num_visible_rows=2, virtual=virtual, max_warm_rows=2
+    )
+    render(component)
+    component.scroll_down(distance=2, animate=False)
+    created.clear()
+
+    # remove "a", change "d" and add "f" before "c"
+    patched_rows = [
+        Rows[1],
+        partial(CountedRow, text="f"),
+        Rows[2],
+        partial(CountedRow, text="D"),
+        Rows[4],
+    ]
+    component.patch_rows(patched_rows, {0: 1, 2: 2, 4: 4})
+
+    # the top row is still at the top and only new rows are created
+    assert component.state["top_row_index"] == 2
+    assert [row.state["text"] for row in component.visible_rows] == ["c", "D"]
+    assert "a" in cleaned_up
+    assert "c" not in created
+    assert "D" in created
+    assert "d" in cleaned_up
@@ -1,5 +1,4 @@
 from functools import partial
-from math import ceil
 from time import sleep
 
 import pytest
@@ -85,19 +84,9 @@ def test_row_gap(create_page_list, create_pages, CheckeredPage, render, snapshot
     )
 
 
-def test_scrolling_animation(mocker, create_page_list, create_pages, render, snapshot):
-    def slow_transition(distance, duration):
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-
-    mocker.patch(
-        "pt_miniscreen.core.components.list.transition", side_effect=slow_transition
-    )
-
+def test_scrolling_animation(
+    manual_frame_clock, create_page_list, create_pages, render, snapshot
+):
     component = create_page_list(Pages=create_pages(3))
 
     # render component so scrolling is animated
@@ -105,20 +94,20 @@ def test_scrolling_animation(mocker, create_page_list, create_pages, render, sna
 
     # scrolling down is animated correctly
     component.scroll_down()
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "scroll-down-1.png")
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "scroll-down-2.png")
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "scroll-down-3.png")
 
     # scrolling up is animated correctly
     component.scroll_up()
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "scroll-up-1.png")
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "scroll-up-2.png")
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "scroll-up-3.png")
 
 
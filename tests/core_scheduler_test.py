@@ -0,0 +1,74 @@
+import threading
+from time import monotonic, sleep
+
+import pytest
+
+
+@pytest.fixture
+def scheduler():
+    from pt_miniscreen.core.scheduler import Scheduler
+
+    return Scheduler()
+
+
+def test_calls_are_made_in_order_of_when_they_are_due(scheduler):
+    calls = []
+    done = threading.Event()
+
+    scheduler.call_later(0.2, lambda: (calls.append("last"), done.set()))
+    scheduler.call_later(0.1, lambda: calls.append("second"))
+    scheduler.call_later(0.05, lambda: calls.append("first"))
+
+    assert done.wait(1)
+    assert calls == ["first", "second", "last"]
+
+
+def test_calls_are_made_when_due(scheduler):
+    called_at = []
+    done = threading.Event()
+
+    start = monotonic()
+    scheduler.call_at(start + 0.1, lambda: (called_at.append(monotonic()), done.set()))
+
+    assert done.wait(1)
+    assert 0.1 <= called_at[0] - start < 0.2
+
+
+def test_cancelled_calls_are_not_made(scheduler):
+    calls = []
+
+    call = scheduler.call_later(0.05, lambda: calls.append("cancelled"))
+    scheduler.call_later(0.05, lambda: calls.append("made"))
+    assert scheduler.pending == 2
+
+    call.cancel()
+    assert scheduler.pending == 1
+
+    sleep(0.15)
+    assert calls == ["made"]
+    assert scheduler.pending == 0
+
+
+def test_errors_do_not_stop_other_calls(scheduler):
+    done = threading.Event()
+
+    def raise_error():
+        raise Exception("error")
+
+    scheduler.call_later(0, raise_error)
+    scheduler.call_later(0.01, done.set)
+
+    assert done.wait(1)
+
+
+def test_uses_a_single_thread(scheduler):
+    threads = set()
+    done = threading.Event()
+
+    for delay in range(10):
+        scheduler.call_later(delay / 100, lambda: threads.add(threading.get_ident()))
+    scheduler.call_later(0.1, done.set)
+
+    assert done.wait(1)
+    assert len(threads) == 1
+    assert threading.get_ident() not in threads
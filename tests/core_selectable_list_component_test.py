@@ -473,3 +473,28 @@ def test_cleanup(parent, create_numbered_rows, render):
 
     # rows should be cleaned up
     assert row() is None
+
+
+@pytest.mark.parametrize("virtual", [False, True])
+def test_patch_rows_keeps_selection(
+    create_selectable_list, render, NumberedRow, virtual
+):
+    Rows = [partial(NumberedRow, text=text) for text in "abcde"]
+    component = create_selectable_list(Rows=Rows, num_visible_rows=2, virtual=virtual)
+    render(component)
+    component.select_row(2, animate_scroll=False)
+    selected_row = component.selected_row
+
+    # the selected row moves up when a row before it is removed
+    component.patch_rows(Rows[1:], {0: 1, 1: 2, 2: 3, 3: 4})
+    assert component.state["selected_index"] == 1
+    assert component.selected_row is selected_row
+
+    # only the selected row is inverted
+    inverted_rows = [row for row in component.rows if row.render.__name__ == "<lambda>"]
+    assert inverted_rows == [selected_row]
+
+    # the closest row is selected when the selected row is removed
+    component.patch_rows([Rows[1], Rows[3], Rows[4]], {0: 0, 1: 2, 2: 3})
+    assert component.state["selected_index"] == 1
+    assert component.selected_row.state["text"] == "d"
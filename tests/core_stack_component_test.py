@@ -2,7 +2,6 @@ import gc
 import logging
 import sys
 from functools import partial
-from math import ceil
 from time import sleep
 from weakref import ref
 
@@ -155,57 +154,58 @@ def test_transitions_before_render(
 
 
 def test_transitions_during_transition(
-    create_stack, render, ImagePage, CheckeredPage, snapshot
+    manual_frame_clock, create_stack, render, ImagePage, CheckeredPage, snapshot
 ):
     component = create_stack(initial_stack=[ImagePage])
 
     # check initial render correct
     snapshot.assert_match(render(component), "image-page.png")
 
-    # pushing while pushing does nothing
+    # pushing while pushing finishes the first push
     component.push(CheckeredPage)
-    sleep(0.05)
+    manual_frame_clock.tick(0.05)
     component.push(ImagePage)
-    sleep(0.25)
-    snapshot.assert_match(render(component), "checkered-page.png")
+    manual_frame_clock.tick(0.25)
+    assert len(component.stack) == 3
+    snapshot.assert_match(render(component), "image-page.png")
 
-    # popping while pushing does nothing
-    component.push(ImagePage)
-    sleep(0.05)
+    # popping while pushing finishes the push
+    component.push(CheckeredPage)
+    manual_frame_clock.tick(0.05)
     component.pop()
-    sleep(0.25)
+    manual_frame_clock.tick(0.25)
+    assert len(component.stack) == 3
     snapshot.assert_match(render(component), "image-page.png")
 
-    # popping while popping does nothing
+    # popping while popping pops both
     component.pop()
-    sleep(0.05)
+    manual_frame_clock.tick(0.05)
     component.pop()
-    sleep(0.25)
-    snapshot.assert_match(render(component), "checkered-page.png")
+    manual_frame_clock.tick(0.25)
+    assert len(component.stack) == 1
+    snapshot.assert_match(render(component), "image-page.png")
 
-    # pushing while popping does nothing
+    # pushing while popping finishes the pop
+    component.push(CheckeredPage)
+    manual_frame_clock.tick(0.25)
     component.pop()
-    sleep(0.05)
+    manual_frame_clock.tick(0.05)
     component.push(CheckeredPage)
-    sleep(0.25)
-    snapshot.assert_match(render(component), "image-page.png")
+    manual_frame_clock.tick(0.25)
+    assert len(component.stack) == 2
+    snapshot.assert_match(render(component), "checkered-page.png")
+
+    # popping more than is left on the stack does nothing
+    component.pop()
+    manual_frame_clock.tick(0.05)
+    component.pop(elements=2)
+    manual_frame_clock.tick(0.25)
+    assert len(component.stack) == 1
 
 
 def test_transition_animations(
-    mocker, create_stack, render, ImagePage, CheckeredPage, snapshot
+    manual_frame_clock, create_stack, render, ImagePage, CheckeredPage, snapshot
 ):
-    def slow_transition(distance, duration):
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-        sleep(duration / 3)
-        yield ceil(distance / 3)
-
-    mocker.patch(
-        "pt_miniscreen.core.components.stack.transition", side_effect=slow_transition
-    )
-
     component = create_stack()
 
     # render component so transitions are animated
@@ -213,38 +213,38 @@ def test_transition_animations(
 
     # pushing first component is animated correctly
     component.push(ImagePage)
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "push-first-1.png")
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "push-first-2.png")
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "push-first-3.png")
 
     # pushing a second component is animated correctly
     component.push(CheckeredPage)
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "push-1.png")
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "push-2.png")
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "push-3.png")
 
     # popping is animated correctly
     component.pop()
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "pop-1.png")
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "pop-2.png")
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "pop-3.png")
 
     # popping last component is animated correctly
     component.pop()
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "pop-last-1.png")
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "pop-last-2.png")
-    sleep(0.1)
+    manual_frame_clock.tick(0.25 / 3)
     snapshot.assert_match(render(component), "pop-last-3.png")
 
 
@@ -0,0 +1,99 @@
+import pytest
+
+
+@pytest.fixture
+def steps():
+    return []
+
+
+@pytest.fixture
+def finished():
+    return []
+
+
+@pytest.fixture
+def create_transition(manual_frame_clock, steps, finished):
+    from pt_miniscreen.core.transition import Transition
+
+    def create_transition(distance=90, duration=0.3):
+        return Transition(
+            distance=distance,
+            duration=duration,
+            on_step=steps.append,
+            on_finish=lambda: finished.append(True),
+        )
+
+    return create_transition
+
+
+def test_travels_distance_over_duration(
+    manual_frame_clock, create_transition, steps, finished
+):
+    transition = create_transition()
+
+    for _ in range(3):
+        manual_frame_clock.tick(0.1)
+
+    assert steps == [30, 60, 90]
+    assert finished == [True]
+
+    # finished transitions stop receiving frames
+    manual_frame_clock.tick(0.1)
+    assert steps == [30, 60, 90]
+    assert transition.finished
+
+
+def test_moves_in_whole_pixels(manual_frame_clock, create_transition, steps):
+    transition = create_transition(distance=10)
+
+    manual_frame_clock.tick(0.1)
+    manual_frame_clock.tick(0.1)
+    assert steps == [4, 7]
+    assert transition.remaining == 3
+
+
+def test_extending_covers_the_rest_in_a_new_duration(
+    manual_frame_clock, create_transition, steps, finished
+):
+    transition = create_transition()
+    manual_frame_clock.tick(0.1)
+
+    transition.extend(90)
+    assert transition.remaining == 150
+
+    for _ in range(3):
+        manual_frame_clock.tick(0.1)
+
+    assert steps == [30, 80, 130, 180]
+    assert finished == [True]
+
+
+def test_finish_jumps_to_the_end(
+    manual_frame_clock, create_transition, steps, finished
+):
+    transition = create_transition()
+    manual_frame_clock.tick(0.1)
+
+    transition.finish()
+    assert steps == [30, 90]
+    assert finished == [True]
+
+    # finishing again does nothing
+    transition.finish()
+    manual_frame_clock.tick(0.1)
+    assert steps == [30, 90]
+    assert finished == [True]
+
+
+def test_cancel_stops_without_finishing(
+    manual_frame_clock, create_transition, steps, finished
+):
+    transition = create_transition()
+    manual_frame_clock.tick(0.1)
+
+    transition.cancel()
+    manual_frame_clock.tick(0.1)
+    transition.finish()
+
+    assert steps == [30]
+    assert finished == []
@@ -0,0 +1,179 @@
+import threading
+from time import sleep
+
+import pytest
+
+from pt_miniscreen.utils import ButtonEvents
+
+
+@pytest.fixture
+def handled():
+    return []
+
+
+@pytest.fixture
+def busy():
+    # events queue up behind the one being handled while this is set
+    return threading.Event()
+
+
+@pytest.fixture
+def handle(handled, busy):
+    def handle(event, distance):
+        handled.append((event, distance))
+        while busy.is_set():
+            sleep(0.01)
+
+    return handle
+
+
+@pytest.fixture
+def dispatcher(handle):
+    from pt_miniscreen.input import InputDispatcher
+
+    dispatcher = InputDispatcher(handle, can_combine_navigation=lambda: True)
+
+    yield dispatcher
+
+    dispatcher.stop()
+
+
+def test_events_are_handled_in_order(dispatcher, handled):
+    dispatcher.put(ButtonEvents.SELECT_RELEASE)
+    dispatcher.put(ButtonEvents.DOWN_RELEASE)
+    dispatcher.put(ButtonEvents.CANCEL_RELEASE)
+    sleep(0.1)
+
+    assert handled == [
+        (ButtonEvents.SELECT_RELEASE, 1),
+        (ButtonEvents.DOWN_RELEASE, 1),
+        (ButtonEvents.CANCEL_RELEASE, 1),
+    ]
+
+
+def test_navigation_queued_while_handling_is_combined(dispatcher, handled, busy):
+    busy.set()
+    dispatcher.put(ButtonEvents.SELECT_RELEASE)
+    for _ in range(3):
+        dispatcher.put(ButtonEvents.DOWN_PRESS)
+        dispatcher.put(ButtonEvents.DOWN_RELEASE)
+    dispatcher.put(ButtonEvents.UP_RELEASE)
+    dispatcher.put(ButtonEvents.SELECT_RELEASE)
+    sleep(0.1)
+
+    # events wait for the one being handled
+    assert handled == [(ButtonEvents.SELECT_RELEASE, 1)]
+
+    busy.clear()
+    sleep(0.1)
+
+    # presses queued with the releases are dropped
+    assert handled == [
+        (ButtonEvents.SELECT_RELEASE, 1),
+        (ButtonEvents.DOWN_PRESS, 1),
+        (ButtonEvents.DOWN_RELEASE, 2),
+        (ButtonEvents.SELECT_RELEASE, 1),
+    ]
+
+
+def test_navigation_that_cancels_out_is_dropped(dispatcher, handled, busy):
+    busy.set()
+    dispatcher.put(ButtonEvents.SELECT_RELEASE)
+    dispatcher.put(ButtonEvents.DOWN_RELEASE)
+    dispatcher.put(ButtonEvents.UP_RELEASE)
+    dispatcher.put(ButtonEvents.UP_RELEASE)
+    dispatcher.put(ButtonEvents.DOWN_RELEASE)
+    busy.clear()
+    sleep(0.1)
+
+    assert handled == [(ButtonEvents.SELECT_RELEASE, 1)]
+
+
+def test_navigation_is_not_combined_when_not_navigable(handle, handled, busy):
+    from pt_miniscreen.input import InputDispatcher
+
+    dispatcher = InputDispatcher(handle, can_combine_navigation=lambda: False)
+
+    busy.set()
+    dispatcher.put(ButtonEvents.SELECT_RELEASE)
+    dispatcher.put(ButtonEvents.DOWN_RELEASE)
+    dispatcher.put(ButtonEvents.DOWN_RELEASE)
+    busy.clear()
+    sleep(0.1)
+    dispatcher.stop()
+
+    assert handled == [
+        (ButtonEvents.SELECT_RELEASE, 1),
+        (ButtonEvents.DOWN_RELEASE, 1),
+        (ButtonEvents.DOWN_RELEASE, 1),
+    ]
+
+
+def test_errors_do_not_stop_handling(handled):
+    from pt_miniscreen.input import InputDispatcher
+
+    def handle(event, distance):
+        if event == ButtonEvents.SELECT_RELEASE:
+            raise Exception("error")
+        handled.append(event)
+
+    dispatcher = InputDispatcher(handle)
+    dispatcher.put(ButtonEvents.SELECT_RELEASE)
+    dispatcher.put(ButtonEvents.CANCEL_RELEASE)
+    sleep(0.1)
+    dispatcher.stop()
+
+    assert handled == [ButtonEvents.CANCEL_RELEASE]
+
+
+def test_latency_is_recorded_when_frame_is_displayed(dispatcher, handled):
+    dispatcher.put(ButtonEvents.SELECT_RELEASE)
+    sleep(0.05)
+    assert dispatcher.latency.count == 0
+
+    dispatcher.frame_displayed()
+    assert dispatcher.latency.count == 1
+    assert 0.05 <= dispatcher.latency.max < 0.1
+
+    # events are only recorded once
+    dispatcher.frame_displayed()
+    assert dispatcher.latency.count == 1
+
+
+def test_latency_histogram():
+    from pt_miniscreen.input import LatencyHistogram
+
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) == 0
+    assert histogram.mean == 0
+
+    for latency in (0.001, 0.003, 0.015, 0.015, 0.3):
+        histogram.record(latency)
+
+    assert histogram.count == 5
+    assert histogram.mean == pytest.approx(0.0668)
+    assert histogram.max == 0.3
+    assert histogram.percentile(40) == 0.005
+    assert histogram.percentile(50) == 0.02
+    assert histogram.percentile(95) == 0.5
+    assert histogram.summary() == (
+        "5 events, mean 66.8ms, p50 <=20ms, p95 <=500ms, max 300.0ms"
+    )
+
+
+def test_app_passes_combined_navigation_to_root(app, mocker):
+    # the first press is still being handled when the others are made
+    handle_button = mocker.patch.object(
+        app.root, "handle_button", side_effect=lambda *args: sleep(0.1)
+    )
+
+    for _ in range(3):
+        app.miniscreen.down_button.release()
+        sleep(0.01)
+
+    sleep(0.3)
+
+    assert handle_button.call_args_list == [
+        mocker.call(ButtonEvents.DOWN_RELEASE, 1),
+        mocker.call(ButtonEvents.DOWN_RELEASE, 2),
+    ]
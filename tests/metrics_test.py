@@ -0,0 +1,159 @@
+from threading import Event
+from time import sleep
+from unittest.mock import Mock
+
+import pytest
+
+MEMINFO = """MemTotal:        3884328 kB
+MemFree:          966132 kB
+MemAvailable:    2753888 kB
+Buffers:          120356 kB
+Cached:          1662296 kB
+SReclaimable:      75340 kB
+SwapTotal:        102396 kB
+SwapFree:          51198 kB
+HugePages_Total:       0
+"""
+
+STAT = """cpu  300 0 100 600 0 0 0 0 0 0
+cpu0 100 0 50 350 0 0 0 0 0 0
+cpu1 200 0 50 250 0 0 0 0 0 0
+intr 237962 0 0 0
+"""
+
+
+@pytest.fixture
+def meminfo_path(tmp_path):
+    path = tmp_path / "meminfo"
+    path.write_text(MEMINFO)
+    return str(path)
+
+
+@pytest.fixture
+def sampler(mocker):
+    from pt_miniscreen.services.metrics import MetricsSampler
+
+    mocker.patch(
+        "pt_miniscreen.services.metrics.CPUUsage.update", return_value=[10.0, 20.0]
+    )
+    return MetricsSampler(interval=0.1)
+
+
+def test_read_meminfo(meminfo_path):
+    from pt_miniscreen.services.metrics import read_meminfo
+
+    meminfo = read_meminfo(meminfo_path)
+    assert meminfo["MemTotal"] == 3884328 * 1024
+    assert meminfo["HugePages_Total"] == 0
+
+    # missing files produce an empty dictionary
+    assert read_meminfo("/does/not/exist") == {}
+
+
+def test_memory_usage(meminfo_path):
+    from pt_miniscreen.services.metrics import (
+        get_memory_usage,
+        get_swap_usage,
+        read_meminfo,
+    )
+
+    meminfo = read_meminfo(meminfo_path)
+
+    memory = get_memory_usage(meminfo)
+    assert memory.total == 3884328 * 1024
+    assert memory.used == (3884328 - 966132 - 1662296 - 75340 - 120356) * 1024
+    assert memory.percent == pytest.approx(29.1, abs=0.1)
+
+    swap = get_swap_usage(meminfo)
+    assert swap.used == 51198 * 1024
+    assert swap.percent == pytest.approx(50.0)
+
+    # empty meminfo does not raise
+    assert get_memory_usage({}).percent == 0.0
+    assert get_swap_usage({}).percent == 0.0
+
+
+def test_read_cpu_times(tmp_path):
+    from pt_miniscreen.services.metrics import read_cpu_times
+
+    path = tmp_path / "stat"
+    path.write_text(STAT)
+
+    # aggregate line is skipped and idle time is not counted as busy
+    assert read_cpu_times(str(path)) == [(150, 500), (250, 500)]
+
+    # missing files produce an empty list
+    assert read_cpu_times("/does/not/exist") == []
+
+
+def test_cpu_usage_from_deltas():
+    from pt_miniscreen.services.metrics import CPUUsage
+
+    cpu_usage = CPUUsage(history_length=2)
+
+    # first sample is compared against boot
+    assert cpu_usage.update([(150, 500), (250, 500)]) == [30.0, 50.0]
+
+    # following samples only use the time since the previous sample
+    assert cpu_usage.update([(250, 600), (260, 600)]) == [100.0, 10.0]
+    assert cpu_usage.update([(250, 700), (310, 700)]) == [0.0, 50.0]
+
+    # history keeps the average of the most recent samples
+    assert list(cpu_usage.history) == [55.0, 25.0]
+
+    # counters that don't change produce zero usage rather than an error
+    assert cpu_usage.update([(250, 700), (310, 700)]) == [0.0, 0.0]
+
+
+def test_sampler_publishes_to_active_subscribers(sampler):
+    active_event = Event()
+    active_event.set()
+    paused_event = Event()
+
+    class Subscriber:
+        def __init__(self):
+            self.on_snapshot = Mock()
+
+        def callback(self, snapshot):
+            self.on_snapshot(snapshot)
+
+    active = Subscriber()
+    paused = Subscriber()
+    sampler.subscribe(active.callback, active_event=active_event)
+    sampler.subscribe(paused.callback, active_event=paused_event)
+
+    sleep(0.35)
+    assert active.on_snapshot.call_count >= 2
+    assert active.on_snapshot.call_args.args[0].cpu_percentages == [10.0, 20.0]
+    paused.on_snapshot.assert_not_called()
+
+
+def test_sampler_stops_publishing_when_unsubscribed(sampler, mocker):
+    sample = mocker.spy(sampler, "sample")
+
+    class Subscriber:
+        def callback(self, snapshot):
+            pass
+
+    subscriber = Subscriber()
+    subscription = sampler.subscribe(subscriber.callback)
+    sleep(0.25)
+    assert sample.call_count > 0
+
+    subscription.cancel()
+    sleep(0.15)
+    call_count = sample.call_count
+    sleep(0.3)
+    assert sample.call_count == call_count
+
+
+def test_sampler_reuses_recent_snapshot(sampler, mocker):
+    sample = mocker.spy(sampler, "sample")
+
+    snapshot = sampler.get_snapshot()
+    assert sampler.get_snapshot() is snapshot
+    assert sample.call_count == 1
+
+    sleep(0.15)
+    assert sampler.get_snapshot() is not snapshot
+    assert sample.call_count == 2
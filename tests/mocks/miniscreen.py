@@ -16,6 +16,13 @@ class Button:
 
 class Device:
     display_image = b""
+    is_hidden = False
+
+    def hide(self):
+        self.is_hidden = True
+
+    def show(self):
+        self.is_hidden = False
 
     def display(self, image):
         img_byte_arr = io.BytesIO()
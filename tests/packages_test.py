@@ -0,0 +1,55 @@
+import os
+
+DPKG_STATUS = """Package: further-link
+Status: install ok installed
+Priority: optional
+Version: 1.2.3
+Description: Further link
+ multiline description
+
+Package: removed-package
+Status: deinstall ok config-files
+Version: 0.1.0
+
+Package: python3-pitop
+Status: install ok installed
+Version: 0.30.0
+"""
+
+
+def test_read_installed_packages(tmp_path):
+    from pt_miniscreen.services.packages import read_installed_packages
+
+    status_file = tmp_path / "status"
+    status_file.write_text(DPKG_STATUS)
+
+    assert read_installed_packages(str(status_file)) == {
+        "further-link": "1.2.3",
+        "python3-pitop": "0.30.0",
+    }
+
+    # missing status file means nothing is installed
+    assert read_installed_packages(str(tmp_path / "missing")) == {}
+
+
+def test_package_index_reloads_when_status_changes(tmp_path, mocker):
+    from pt_miniscreen.services import packages
+    from pt_miniscreen.services.packages import PackageIndex
+
+    status_file = tmp_path / "status"
+    status_file.write_text(DPKG_STATUS)
+    read_spy = mocker.spy(packages, "read_installed_packages")
+    index = PackageIndex(str(status_file))
+
+    assert index.is_installed("further-link")
+    assert not index.is_installed("removed-package")
+    assert index.get_version("python3-pitop") == "0.30.0"
+    assert read_spy.call_count == 1
+
+    status_file.write_text(DPKG_STATUS.replace("further-link", "other-package"))
+    stat = status_file.stat()
+    os.utime(status_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert not index.is_installed("further-link")
+    assert index.is_installed("other-package")
+    assert read_spy.call_count == 2
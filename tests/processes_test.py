@@ -0,0 +1,134 @@
+import os
+import sys
+from time import sleep
+
+import pytest
+
+
+@pytest.fixture
+def supervisor():
+    from pt_miniscreen.services.processes import ProcessSupervisor
+
+    return ProcessSupervisor()
+
+
+def python(script):
+    return [sys.executable, "-c", script]
+
+
+def assert_stopped(pid):
+    # orphaned processes are reaped by init once they are killed
+    for _ in range(50):
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return
+        sleep(0.1)
+
+    with open(f"/proc/{pid}/stat") as file:
+        assert file.read().split()[2] == "Z"
+
+
+def test_running_processes_are_tracked(supervisor):
+    supervised = supervisor.start("project", python("import time; time.sleep(10)"))
+    assert supervisor.is_running("project")
+    assert supervisor.get("project") is supervised
+    assert os.getpgid(supervised.pid) == supervised.pid
+
+    with pytest.raises(RuntimeError):
+        supervisor.start("project", python("pass"))
+
+    assert supervisor.stop("project")
+    assert supervised.wait(5) == -15
+    assert not supervisor.is_running("project")
+    assert supervisor.last_runs["project"] is supervised
+
+
+def test_stopping_a_process_stops_its_children(supervisor, tmp_path):
+    pid_file = tmp_path / "pid"
+    script = "\n".join(
+        [
+            "import os, subprocess, sys, time",
+            "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(10)'])",
+            # write the pid atomically so it isn't read half written
+            f"open({str(pid_file)!r} + '.tmp', 'w').write(str(child.pid))",
+            f"os.replace({str(pid_file)!r} + '.tmp', {str(pid_file)!r})",
+            "child.wait()",
+        ]
+    )
+    supervised = supervisor.start("project", python(script))
+    for _ in range(50):
+        if pid_file.exists():
+            break
+        supervised.wait(0.1)
+
+    child_pid = int(pid_file.read_text())
+    supervisor.stop("project")
+    supervised.wait(5)
+
+    assert_stopped(child_pid)
+
+
+def test_processes_left_in_the_group_are_killed_when_it_exits(supervisor, tmp_path):
+    from pt_miniscreen.services.processes import ProcessAlreadyRunning
+
+    pid_file = tmp_path / "pid"
+    script = "\n".join(
+        [
+            "import os, subprocess, sys",
+            "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(10)'])",
+            f"open({str(pid_file)!r} + '.tmp', 'w').write(str(child.pid))",
+            f"os.replace({str(pid_file)!r} + '.tmp', {str(pid_file)!r})",
+        ]
+    )
+    supervised = supervisor.start("project", python(script))
+    with pytest.raises(ProcessAlreadyRunning):
+        supervisor.start("project", python("pass"))
+
+    assert supervised.wait(5) == 0
+    assert not supervisor.is_running("project")
+
+    child_pid = int(pid_file.read_text())
+    assert_stopped(child_pid)
+
+
+def test_usage_is_recorded_for_each_run(supervisor):
+    script = "data = bytearray(32 * 1024 * 1024)\nwhile sum(range(10**6)) < 0: pass"
+    supervised = supervisor.start("project", python(script))
+
+    assert supervised.wait(10) == 0
+    assert supervised.process.poll() == 0
+    assert supervised.usage.cpu_time > 0
+    assert supervised.usage.max_rss > 32 * 1024 * 1024
+    assert supervised.usage.duration > 0
+
+
+def test_usage_is_sampled_while_running(supervisor):
+    script = "\n".join(
+        [
+            "import time",
+            "data = bytearray(32 * 1024 * 1024)",
+            "end = time.monotonic() + 0.5",
+            "while time.monotonic() < end: pass",
+            "time.sleep(10)",
+        ]
+    )
+    supervised = supervisor.start("project", python(script))
+    sleep(1)
+
+    usage = supervisor.sample_usage("project")
+    assert usage.cpu_time > 0.2
+    assert usage.max_rss > 32 * 1024 * 1024
+    assert usage.duration >= 1
+
+    # memory is the peak seen so far
+    supervised.sampled_usage.max_rss = 1024**3
+    assert supervisor.sample_usage("project").max_rss == 1024**3
+
+    supervisor.stop("project")
+    supervised.wait(5)
+    assert supervisor.sample_usage("project") is None
+
+
+def test_stopping_unknown_process_does_nothing(supervisor):
+    assert not supervisor.stop("project")
@@ -0,0 +1,252 @@
+import os
+from shutil import rmtree
+from threading import Event
+from time import sleep
+
+import pytest
+
+
+def write_project(directory, title, mtime=None):
+    directory.mkdir(parents=True, exist_ok=True)
+    file = directory / "project.cfg"
+    file.write_text(f"[project]\ntitle={title}\nstart=start.sh\n")
+    if mtime is not None:
+        os.utime(file, (mtime, mtime))
+    return file
+
+
+def touch(path, offset=1):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + offset * 10**9))
+
+
+@pytest.fixture
+def index():
+    from pt_miniscreen.pages.root.projects.index import ProjectIndex
+
+    return ProjectIndex()
+
+
+def test_projects_are_sorted_by_modification_time(index, tmp_path):
+    write_project(tmp_path / "old", "Old", mtime=1000)
+    write_project(tmp_path / "new", "New", mtime=3000)
+    write_project(tmp_path / "middle", "Middle", mtime=2000)
+    (tmp_path / "invalid").mkdir()
+    (tmp_path / "invalid" / "project.cfg").write_text("[project]\n")
+
+    titles = [config.title for config in index.get_projects(tmp_path)]
+    assert titles == ["New", "Middle", "Old"]
+
+
+def test_configs_are_only_parsed_when_changed(index, tmp_path, mocker):
+    from pt_miniscreen.pages.root.projects.config import ProjectConfig
+
+    file = write_project(tmp_path / "project", "Project")
+    from_file_spy = mocker.spy(ProjectConfig, "from_file")
+
+    assert index.get_projects(tmp_path)[0].title == "Project"
+    assert index.get_projects(tmp_path)[0].title == "Project"
+    assert from_file_spy.call_count == 1
+
+    write_project(tmp_path / "project", "Renamed")
+    touch(file)
+    assert index.get_projects(tmp_path)[0].title == "Renamed"
+    assert from_file_spy.call_count == 2
+
+    # new projects are found once the directory changes
+    write_project(tmp_path / "other", "Other")
+    touch(tmp_path)
+    assert len(index.get_projects(tmp_path)) == 2
+    assert from_file_spy.call_count == 3
+
+
+def test_contains_projects(index, tmp_path):
+    write_project(tmp_path / "user" / "project", "Nested")
+
+    assert not index.contains_projects(tmp_path)
+    assert index.contains_projects(tmp_path, recurse=True)
+    assert index.contains_projects(tmp_path / "user")
+    assert not index.contains_projects(tmp_path / "missing", recurse=True)
+
+
+def test_watch_publishes_project_changes(tmp_path):
+    from pt_miniscreen.pages.root.projects.index import (
+        ProjectChangeType,
+        ProjectIndex,
+    )
+
+    class Subscriber:
+        def __init__(self):
+            self.changes = []
+
+        def on_change(self, changes):
+            self.changes.extend((change.type, change.file) for change in changes)
+
+    index = ProjectIndex(watch_interval=0.1)
+    subscriber = Subscriber()
+    file = write_project(tmp_path / "project", "Project")
+    subscription = index.watch(tmp_path, subscriber.on_change)
+
+    sleep(0.3)
+    assert subscriber.changes == []
+
+    added_file = write_project(tmp_path / "added", "Added")
+    touch(tmp_path)
+    sleep(0.3)
+    assert subscriber.changes == [(ProjectChangeType.ADDED, str(added_file))]
+
+    # configs replaced when they are written change their directory
+    subscriber.changes.clear()
+    touch(file)
+    touch(file.parent)
+    sleep(0.3)
+    assert subscriber.changes == [(ProjectChangeType.MODIFIED, str(file))]
+
+    # configs edited in place don't
+    subscriber.changes.clear()
+    directory_mtime = file.parent.stat().st_mtime_ns
+    with open(file, "a") as config:
+        config.write("exit_condition=HOLD_CANCEL\n")
+    touch(file)
+    assert file.parent.stat().st_mtime_ns == directory_mtime
+    sleep(0.3)
+    assert subscriber.changes == [(ProjectChangeType.MODIFIED, str(file))]
+
+    subscriber.changes.clear()
+    rmtree(tmp_path / "added")
+    touch(tmp_path)
+    sleep(0.3)
+    assert subscriber.changes == [(ProjectChangeType.REMOVED, str(added_file))]
+
+    # nothing is published once unsubscribed
+    subscriber.changes.clear()
+    subscription.cancel()
+    touch(file)
+    touch(file.parent)
+    sleep(0.3)
+    assert subscriber.changes == []
+
+
+def test_watch_only_reads_directories_that_changed(tmp_path, mocker):
+    from pt_miniscreen.pages.root.projects import index as index_module
+
+    class Subscriber:
+        def on_change(self, changes):
+            pass
+
+    for i in range(3):
+        write_project(tmp_path / "user" / f"project_{i}", f"Project {i}")
+
+    index = index_module.ProjectIndex(watch_interval=0.1)
+    subscriber = Subscriber()
+    index.watch(tmp_path, subscriber.on_change, recurse=True)
+
+    stat_spy = mocker.spy(index_module, "_stat")
+    list_directory_spy = mocker.spy(index, "list_directory")
+    sleep(0.35)
+
+    # directories and configs are only stat'ed while nothing changes
+    stat_spy.assert_called()
+    assert [c for c in stat_spy.call_args_list if c.args[0].endswith(".cfg")]
+    list_directory_spy.assert_not_called()
+
+    touch(tmp_path / "user" / "project_1")
+    sleep(0.2)
+    list_directory_spy.assert_called_once_with(str(tmp_path / "user" / "project_1"))
+
+
+def test_inactive_subscribers_get_changes_when_active(tmp_path):
+    from pt_miniscreen.pages.root.projects.index import (
+        ProjectChangeType,
+        ProjectIndex,
+    )
+
+    class Subscriber:
+        def __init__(self):
+            self.changes = []
+
+        def on_change(self, changes):
+            self.changes.append(sorted((c.type.name, c.file) for c in changes))
+
+    index = ProjectIndex(watch_interval=0.1)
+    active_subscriber = Subscriber()
+    inactive_subscriber = Subscriber()
+    active_event = Event()
+    removed_file = write_project(tmp_path / "removed", "Removed")
+    index.watch(tmp_path, active_subscriber.on_change)
+    index.watch(tmp_path, inactive_subscriber.on_change, active_event=active_event)
+
+    added_file = write_project(tmp_path / "added", "Added")
+    touch(tmp_path)
+    sleep(0.3)
+    rmtree(tmp_path / "removed")
+    touch(tmp_path)
+    sleep(0.3)
+
+    assert len(active_subscriber.changes) == 2
+    assert inactive_subscriber.changes == []
+
+    # changes made while inactive are sent together
+    active_event.set()
+    sleep(0.3)
+    assert inactive_subscriber.changes == [
+        [
+            (ProjectChangeType.ADDED.name, str(added_file)),
+            (ProjectChangeType.REMOVED.name, str(removed_file)),
+        ]
+    ]
+
+
+def test_project_rows_apply_changes(tmp_path):
+    from pt_miniscreen.pages.root.projects.index import (
+        ProjectChange,
+        ProjectChangeType,
+    )
+    from pt_miniscreen.pages.root.projects.overview import ProjectRows
+
+    rows = ProjectRows([("c", 3000), ("b", 2000), ("a", 1000)], parent=None)
+    rows.insert(0, "delete all row")
+
+    rows = rows.apply_changes(
+        [
+            ProjectChange(ProjectChangeType.REMOVED, "b"),
+            ProjectChange(ProjectChangeType.ADDED, "d", 2500),
+            ProjectChange(ProjectChangeType.MODIFIED, "a", 4000),
+        ]
+    )
+
+    assert rows.project_files == [("a", 4000), ("c", 3000), ("d", 2500)]
+    assert rows[0] == "delete all row"
+
+
+def test_project_rows_are_created_lazily(tmp_path, mocker):
+    from pt_miniscreen.pages.root.projects.config import ProjectConfig
+    from pt_miniscreen.pages.root.projects.overview import ProjectRows
+    from pt_miniscreen.pages.root.projects.index import project_index
+    from pt_miniscreen.pages.root.projects.utils import InvalidProjectRow, Row
+
+    for i in range(200):
+        write_project(tmp_path / f"project_{i}", f"Project {i}", mtime=1000 + i)
+    (tmp_path / "invalid").mkdir()
+    (tmp_path / "invalid" / "project.cfg").write_text("[project]\n")
+    os.utime(tmp_path / "invalid" / "project.cfg", (5000, 5000))
+
+    from_file_spy = mocker.spy(ProjectConfig, "from_file")
+    rows = ProjectRows(project_index.get_project_files(tmp_path), parent=None)
+    rows.insert(0, "delete all row")
+
+    # count and order come from the index without parsing any configs
+    assert len(rows) == 202
+    assert from_file_spy.call_count == 0
+
+    assert rows[0] == "delete all row"
+    assert rows[1].func == InvalidProjectRow
+    visible_rows = rows[2:5]
+    assert [row.func for row in visible_rows] == [Row, Row, Row]
+    assert [row.keywords["title"] for row in visible_rows] == [
+        "Project 199",
+        "Project 198",
+        "Project 197",
+    ]
+    assert rows[-1].keywords["title"] == "Project 0"
+    assert from_file_spy.call_count == 5
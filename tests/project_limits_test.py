@@ -0,0 +1,103 @@
+import pytest
+
+
+def write_config(tmp_path, **keys):
+    lines = ["[project]", "title=my project", "start=python3 project.py"]
+    lines += [f"{key}={value}" for key, value in keys.items()]
+    file = tmp_path / "project.cfg"
+    file.write_text("\n".join(lines) + "\n")
+    return str(file)
+
+
+def test_limits_are_optional(tmp_path):
+    from pt_miniscreen.pages.root.projects.config import ProjectConfig
+    from pt_miniscreen.pages.root.projects.limits import DEFAULT_NICE
+
+    limits = ProjectConfig.from_file(write_config(tmp_path)).limits
+    assert limits.cpu_limit is None
+    assert limits.memory_limit is None
+    assert limits.nice == DEFAULT_NICE
+    assert limits.ionice is None
+
+
+def test_limits_are_read_from_config(tmp_path):
+    from pt_miniscreen.pages.root.projects.config import ProjectConfig
+
+    file = write_config(
+        tmp_path, cpu_limit="50%", memory_limit="256M", nice="5", ionice="idle"
+    )
+    limits = ProjectConfig.from_file(file).limits
+    assert limits.cpu_limit == 50
+    assert limits.memory_limit == 256 * 1024 * 1024
+    assert limits.nice == 5
+    assert limits.ionice == "idle"
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [
+        {"cpu_limit": "0%"},
+        {"memory_limit": "lots"},
+        {"nice": "20"},
+        {"nice": "-20"},
+        {"nice": "-1"},
+        {"ionice": "realtime"},
+    ],
+)
+def test_invalid_limits_make_config_invalid(tmp_path, keys):
+    from pt_miniscreen.pages.root.projects.config import ProjectConfig
+    from pt_miniscreen.pages.root.projects.utils import InvalidConfigFile
+
+    with pytest.raises(InvalidConfigFile):
+        ProjectConfig.from_file(write_config(tmp_path, **keys))
+
+
+def test_command_is_run_in_scope_when_limited(mocker):
+    from pt_miniscreen.pages.root.projects.limits import ProjectLimits
+
+    mocker.patch(
+        "pt_miniscreen.pages.root.projects.limits.shutil.which",
+        side_effect=lambda command: f"/usr/bin/{command}",
+    )
+
+    limits = ProjectLimits(cpu_limit=50, memory_limit=1024, ionice="idle")
+    command, switches_user = limits.wrap_command(["python3", "project.py"], "pi")
+    assert command == [
+        "/usr/bin/systemd-run",
+        "--scope",
+        "--quiet",
+        "--collect",
+        "-p",
+        "CPUQuota=50%",
+        "-p",
+        "MemoryMax=1024",
+        "-p",
+        "MemorySwapMax=0",
+        "--uid=pi",
+        "/usr/bin/ionice",
+        "-c",
+        "3",
+        "--",
+        "python3",
+        "project.py",
+    ]
+    assert switches_user
+
+
+def test_command_is_unchanged_without_limits():
+    from pt_miniscreen.pages.root.projects.limits import ProjectLimits
+
+    command, switches_user = ProjectLimits().wrap_command(["python3"], "pi")
+    assert command == ["python3"]
+    assert not switches_user
+
+
+def test_limits_are_skipped_when_tools_are_missing(mocker):
+    from pt_miniscreen.pages.root.projects.limits import ProjectLimits
+
+    mocker.patch(
+        "pt_miniscreen.pages.root.projects.limits.shutil.which", return_value=None
+    )
+
+    limits = ProjectLimits(cpu_limit=50, ionice="idle")
+    assert limits.wrap_command(["python3"], "pi") == (["python3"], False)
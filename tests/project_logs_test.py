@@ -0,0 +1,261 @@
+import sys
+from subprocess import PIPE, Popen
+
+import pytest
+
+
+@pytest.fixture
+def timestamp(mocker):
+    return mocker.patch(
+        "pt_miniscreen.pages.root.projects.logs.get_timestamp",
+        return_value=b"[t] ",
+    )
+
+
+def run_and_pump(log, script):
+    from pt_miniscreen.pages.root.projects.logs import LogPump
+
+    process = Popen([sys.executable, "-c", script], stdout=PIPE, stderr=PIPE)
+    log.open()
+    pump = LogPump(log, [process.stdout, process.stderr])
+    pump.start()
+    process.wait()
+    pump.join(5)
+    assert not pump.is_running
+    return pump
+
+
+def test_add_timestamps():
+    from pt_miniscreen.pages.root.projects.logs import add_timestamps
+
+    assert add_timestamps(b"a\nb\n", b"> ") == b"> a\n> b\n"
+    assert add_timestamps(b"a\nb", b"> ") == b"> a\n> b"
+
+
+def test_lines_are_timestamped(tmp_path, timestamp):
+    from pt_miniscreen.pages.root.projects.logs import ProjectLog
+
+    log = ProjectLog(str(tmp_path / "log.txt"))
+    log.open()
+    log.write(b"first\nsecond\n")
+    log.close()
+
+    assert (tmp_path / "log.txt").read_bytes() == b"[t] first\n[t] second\n"
+
+
+def test_opening_log_removes_previous_run(tmp_path, timestamp):
+    from pt_miniscreen.pages.root.projects.logs import ProjectLog
+
+    (tmp_path / "log.txt").write_text("old\n")
+    (tmp_path / "log.txt.1").write_text("older\n")
+
+    log = ProjectLog(str(tmp_path / "log.txt"))
+    log.open()
+    log.close()
+
+    assert (tmp_path / "log.txt").read_bytes() == b""
+    assert not (tmp_path / "log.txt.1").exists()
+
+
+def test_log_is_rotated_when_too_large(tmp_path):
+    from pt_miniscreen.pages.root.projects.logs import ProjectLog
+
+    log = ProjectLog(str(tmp_path / "log.txt"), max_size=10, timestamps=False)
+    log.open()
+    log.write(b"12345\n")
+    log.write(b"67890\n")
+    log.write(b"abc\n")
+    log.close()
+
+    assert (tmp_path / "log.txt.1").read_bytes() == b"12345\n"
+    assert (tmp_path / "log.txt").read_bytes() == b"67890\nabc\n"
+
+
+def test_pump_writes_complete_lines_from_both_streams(tmp_path, timestamp):
+    from pt_miniscreen.pages.root.projects.logs import ProjectLog
+
+    script = "\n".join(
+        [
+            "import sys, time",
+            "sys.stdout.write('out '); sys.stdout.flush(); time.sleep(0.2)",
+            "sys.stderr.write('err\\n'); sys.stderr.flush(); time.sleep(0.2)",
+            "sys.stdout.write('line\\n'); sys.stdout.write('no newline')",
+        ]
+    )
+    run_and_pump(ProjectLog(str(tmp_path / "log.txt")), script)
+
+    assert (tmp_path / "log.txt").read_bytes() == (
+        b"[t] err\n[t] out line\n[t] no newline\n"
+    )
+
+
+def test_pump_handles_large_output(tmp_path):
+    from pt_miniscreen.pages.root.projects.logs import ProjectLog
+
+    script = "import sys\nfor i in range(20000): print(i)"
+    run_and_pump(ProjectLog(str(tmp_path / "log.txt"), timestamps=False), script)
+
+    lines = (tmp_path / "log.txt").read_text().splitlines()
+    assert lines == [str(i) for i in range(20000)]
+
+
+def test_pump_can_be_stopped_while_pipes_are_open(tmp_path):
+    from pt_miniscreen.pages.root.projects.logs import LogPump, ProjectLog
+
+    process = Popen(
+        [sys.executable, "-c", "import time; print('hi', flush=True); time.sleep(10)"],
+        stdout=PIPE,
+        stderr=PIPE,
+    )
+    log = ProjectLog(str(tmp_path / "log.txt"), timestamps=False)
+    log.open()
+    pump = LogPump(log, [process.stdout, process.stderr])
+    pump.start()
+
+    try:
+        pump.join(0.5)
+        pump.stop()
+        pump.join(5)
+        assert not pump.is_running
+
+        # pipes are closed when stopped early
+        assert process.stdout.closed
+        assert process.stderr.closed
+    finally:
+        process.kill()
+        process.wait()
+
+    assert (tmp_path / "log.txt").read_bytes() == b"hi\n"
+
+
+def test_stopping_finished_pump_does_not_write_to_closed_pipe(tmp_path, mocker):
+    from pt_miniscreen.pages.root.projects.logs import ProjectLog
+
+    pump = run_and_pump(ProjectLog(str(tmp_path / "log.txt")), "print('done')")
+    write_spy = mocker.patch("pt_miniscreen.pages.root.projects.logs.os.write")
+
+    pump.stop()
+    write_spy.assert_not_called()
+
+
+def test_only_backup_count_segments_are_kept(tmp_path):
+    from pt_miniscreen.pages.root.projects.logs import ProjectLog
+
+    log = ProjectLog(
+        str(tmp_path / "log.txt"), max_size=4, backup_count=2, timestamps=False
+    )
+    log.open()
+    for line in (b"one\n", b"two\n", b"three\n", b"four\n"):
+        log.write(line)
+    log.close()
+
+    assert log.segments == [
+        str(tmp_path / "log.txt.2"),
+        str(tmp_path / "log.txt.1"),
+        str(tmp_path / "log.txt"),
+    ]
+    assert [open(segment).read() for segment in log.segments] == [
+        "two\n",
+        "three\n",
+        "four\n",
+    ]
+
+
+def test_backups_can_be_compressed(tmp_path):
+    import gzip
+
+    from pt_miniscreen.pages.root.projects.logs import ProjectLog
+
+    log = ProjectLog(
+        str(tmp_path / "log.txt"), max_size=4, compress=True, timestamps=False
+    )
+    log.open()
+    for line in (b"one\n", b"two\n", b"three\n"):
+        log.write(line)
+    log.close()
+
+    assert not (tmp_path / "log.txt.1").exists()
+    assert gzip.decompress((tmp_path / "log.txt.1.gz").read_bytes()) == b"two\n"
+    assert gzip.decompress((tmp_path / "log.txt.2.gz").read_bytes()) == b"one\n"
+
+    log.open()
+    assert log.segments == [str(tmp_path / "log.txt")]
+
+
+def test_reader_reads_lines_across_segments(tmp_path):
+    from pt_miniscreen.pages.root.projects.logs import LogReader, ProjectLog
+
+    log = ProjectLog(
+        str(tmp_path / "log.txt"), max_size=14, compress=True, timestamps=False
+    )
+    log.open()
+    for i in range(10):
+        log.write(f"line {i}\n".encode())
+    log.write(b"unfinished")
+    log.close()
+
+    reader = LogReader(log.path)
+    assert reader.len == 7
+    assert reader.line(0) == ""
+    assert reader.line(1) == "line 4\n"
+    assert reader.range(5, 8) == ["line 8\n", "line 9\n", "unfinished"]
+    assert reader.line(8) == ""
+
+
+def test_reader_handles_missing_log(tmp_path):
+    from pt_miniscreen.pages.root.projects.logs import LogReader
+
+    reader = LogReader(str(tmp_path / "log.txt"))
+    assert reader.len == 0
+    assert reader.line(1) == ""
+
+
+def test_backups_are_compressed_without_blocking_writes(tmp_path, mocker):
+    import gzip
+    from threading import Event, Thread
+
+    from pt_miniscreen.pages.root.projects.logs import ProjectLog
+
+    log = ProjectLog(
+        str(tmp_path / "log.txt"), max_size=4, compress=True, timestamps=False
+    )
+    compress = log._compress
+    compressing = Event()
+    compressed = Event()
+
+    def slow_compress(path):
+        compressing.set()
+        compressed.wait(5)
+        compress(path)
+
+    mocker.patch.object(log, "_compress", slow_compress)
+
+    log.open()
+    log.write(b"one\n")
+    writer = Thread(target=log.write, args=(b"two\n",))
+    writer.start()
+    writer.join(1)
+
+    # writing carries on while the backup is compressed
+    assert compressing.is_set()
+    assert not writer.is_alive()
+    assert (tmp_path / "log.txt").read_bytes() == b"two\n"
+
+    compressed.set()
+    log.close()
+    assert gzip.decompress((tmp_path / "log.txt.1.gz").read_bytes()) == b"one\n"
+    assert log.segments == [str(tmp_path / "log.txt.1.gz"), str(tmp_path / "log.txt")]
+
+
+def test_reader_skips_empty_compressed_segments(tmp_path):
+    import gzip
+
+    from pt_miniscreen.pages.root.projects.logs import LogReader
+
+    (tmp_path / "log.txt.3.gz").write_bytes(gzip.compress(b"first\n"))
+    (tmp_path / "log.txt.2.gz").write_bytes(gzip.compress(b""))
+    (tmp_path / "log.txt.1").write_bytes(b"second\n")
+    (tmp_path / "log.txt").write_bytes(b"third\n")
+
+    reader = LogReader(str(tmp_path / "log.txt"))
+    assert reader.range(1, 4) == ["first\n", "second\n", "third\n"]
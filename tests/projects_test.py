@@ -1,5 +1,5 @@
 from shutil import rmtree
-from os import path, makedirs
+from os import path, makedirs, utime
 from shutil import copytree
 from time import sleep
 
@@ -25,6 +25,14 @@ def use_example_project(mocker, tmp_path):
             "pt_miniscreen.pages.root.projects.project.switch_user",
             return_value=None,
         )
+        mocker.patch(
+            "pt_miniscreen.pages.root.projects.logs.get_timestamp",
+            return_value=b"12:00:00 ",
+        )
+        mocker.patch(
+            "pt_miniscreen.pages.root.projects.project.get_usage_summary",
+            return_value="Finished",
+        )
 
         tmp_path.mkdir(exist_ok=True)
         for base_directory in base_directories_array:
@@ -116,6 +124,25 @@ def test_open_projects_menu(miniscreen, go_to_projects_page, snapshot, create_pr
     )
 
 
+def test_projects_with_invalid_configs_are_listed(
+    miniscreen, go_to_projects_page, snapshot, create_project, tmp_path
+):
+    create_project()
+
+    # listed below the valid project as it was modified before it
+    makedirs(f"{tmp_path}/broken_project")
+    with open(f"{tmp_path}/broken_project/project.cfg", "w") as f:
+        f.write("[project]\n")
+    utime(f"{tmp_path}/broken_project/project.cfg", (1000, 1000))
+
+    go_to_projects_page()
+
+    # access user projects
+    miniscreen.select_button.release()
+    sleep(1)
+    snapshot.assert_match(miniscreen.device.display_image, "project-rows.png")
+
+
 @pytest.mark.flaky(reruns=5)
 def test_projects_on_nested_directories_display_directories_on_enter(
     miniscreen, go_to_projects_page, snapshot, use_example_project
@@ -533,6 +560,32 @@ def test_display_stop_instructions_for_hold_x_on_project_start(
         )
 
 
+def test_project_list_updates_when_projects_change(
+    miniscreen, go_to_projects_page, snapshot, create_project, tmp_path
+):
+    create_project()
+    go_to_projects_page()
+
+    # access user projects
+    miniscreen.select_button.release()
+    sleep(1)
+    snapshot.assert_match(miniscreen.device.display_image, "1-project-row.png")
+
+    # add a project while the list is open, the selected project stays
+    # selected as the new project is added above it
+    makedirs(f"{tmp_path}/my_project_2")
+    with open(f"{tmp_path}/my_project_2/project.cfg", "w") as f:
+        f.write("[project]\ntitle=Project #2\nstart=my-custom-start-command\n")
+
+    sleep(2)
+    snapshot.assert_match(miniscreen.device.display_image, "2-project-rows.png")
+
+    # remove it again
+    rmtree(f"{tmp_path}/my_project_2")
+    sleep(2)
+    snapshot.assert_match(miniscreen.device.display_image, "1-project-row.png")
+
+
 def test_load_project_config_from_valid_file():
     from pt_miniscreen.pages.root.projects.config import ProjectConfig
 
@@ -549,3 +602,35 @@ def test_load_project_config_raises_on_invalid_file():
 
     with pytest.raises(InvalidConfigFile):
         ProjectConfig.from_file(f"{config_file_path}/invalid/project.cfg")
+
+
+def test_project_page_shows_usage_while_running(mocker, parent, tmp_path):
+    from pt_miniscreen.pages.root.projects.config import ProjectConfig
+    from pt_miniscreen.pages.root.projects.enums import ProjectState
+    from pt_miniscreen.pages.root.projects.project_page import ProjectPage
+    from pt_miniscreen.services.processes import ProcessUsage
+
+    mocker.patch.object(ProjectPage, "run")
+    sample_usage = mocker.patch(
+        "pt_miniscreen.pages.root.projects.project_page.process_supervisor.sample_usage",
+        return_value=ProcessUsage(cpu_time=12.3, max_rss=45 * 1024**2, duration=20),
+    )
+    config = ProjectConfig(
+        file=f"{tmp_path}/project.cfg",
+        title="Project",
+        image="",
+        start="my-custom-start-command",
+        exit_condition="FLICK_POWER",
+    )
+    page = parent.create_child(ProjectPage, project_config=config)
+
+    # usage is only read while the project runs
+    page._update_usage()
+    sample_usage.assert_not_called()
+
+    page.state.update(
+        {"project_state": ProjectState.RUNNING_WITH_INSTRUCTIONS_IN_SCREEN}
+    )
+    page._update_usage()
+    sample_usage.assert_called_once_with(config.path)
+    assert page.text.state["text"] == ("'Project' is running...\nCPU: 12s, RAM: 45MiB")
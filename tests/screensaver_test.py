@@ -1,5 +1,6 @@
 from time import sleep
 
+import numpy as np
 import pytest
 
 from conftest import setup_app
@@ -19,14 +20,42 @@ def screensaver_app(mocker):
     app.stop()
 
 
+@pytest.fixture
+def create_screensaver_app(mocker):
+    apps = []
+
+    def create(**settings):
+        setup_app(mocker, screensaver_timeout=0.2)
+
+        from pt_miniscreen.pages.root.screensaver import ScreensaverSettings
+
+        mocker.patch(
+            "pt_miniscreen.app.get_screensaver_settings",
+            return_value=ScreensaverSettings(**settings),
+        )
+
+        from pt_miniscreen.app import App
+
+        app = App()
+        app.start()
+        apps.append(app)
+        return app
+
+    yield create
+
+    for app in apps:
+        app.stop()
+
+
 @pytest.fixture(autouse=True)
 def setup(mocker):
     # patch screensaver to display only one star in a fixed position
-    mocker.patch(
-        "pt_miniscreen.pages.root.screensaver.randrange",
-        side_effect=lambda x, y: 10 if x == 1 else 1,
+    rng = mocker.Mock()
+    rng.integers.side_effect = lambda low, high, size: np.full(
+        size, 10 if low == 1 else 1
     )
-    mocker.patch("pt_miniscreen.pages.root.screensaver.Star.DELTA_Z", 0)
+    mocker.patch("pt_miniscreen.pages.root.screensaver.default_rng", return_value=rng)
+    mocker.patch("pt_miniscreen.pages.root.screensaver.StarfieldScreensaver.SPEED", 0)
 
 
 def test_screensaver(screensaver_app, snapshot):
@@ -39,3 +68,196 @@ def test_screensaver(screensaver_app, snapshot):
 def test_dim_state(screensaver_app, setup):
     sleep(0.3)
     assert screensaver_app.miniscreen._contrast == 0
+
+
+def test_star_field_draws_stars_like_image_draw():
+    from PIL import Image, ImageDraw
+
+    from pt_miniscreen.pages.root.screensaver import StarField
+
+    stars = StarField(0)
+    stars.x = np.array([0.0, -20.5, 24.0, 3.0, -24.0])
+    stars.y = np.array([0.0, 10.2, -13.0, 13.0, 0.0])
+    stars.z = np.array([30.0, 4.5, 2.0, 16.0, 1.0])
+
+    expected = Image.new("1", (128, 64))
+    draw = ImageDraw.Draw(expected)
+    for x, y, z in zip(stars.x, stars.y, stars.z):
+        k = 64 / z
+        x, y = int(x * k + 64), int(y * k + 32)
+        if 0 <= x < 128 and 0 <= y < 64:
+            size = (1 - z / StarField.MAX_DEPTH) * 4
+            draw.rectangle((x, y, x + size, y + size), fill="white")
+
+    assert stars.rasterise((128, 64)).tobytes() == expected.tobytes()
+
+
+def test_star_field_moves_stars_back_when_they_pass_the_display():
+    from pt_miniscreen.pages.root.screensaver import StarField
+
+    stars = StarField(1000, rng=np.random.default_rng(0))
+    assert len(stars) == 1000
+    assert ((stars.z >= 1) & (stars.z < StarField.MAX_DEPTH)).all()
+
+    stars.move(0.5)
+    assert (stars.z > 0).all()
+
+    stars.move(StarField.MAX_DEPTH)
+    assert (stars.z == StarField.MAX_DEPTH).all()
+    assert ((stars.x >= -StarField.MAX_X) & (stars.x < StarField.MAX_X)).all()
+
+
+def test_settings_are_read_from_config():
+    from configparser import ConfigParser
+
+    from pt_miniscreen.pages.root.screensaver import ScreensaverSettings
+
+    config = ConfigParser()
+    assert ScreensaverSettings.from_config(config) == ScreensaverSettings()
+
+    config.read_string(
+        "[Screensaver]\n"
+        "Mode = glance\n"
+        "FrameInterval = 0.05\n"
+        "MaxFrameInterval = 1\n"
+        "AdaptiveFrameRate = no\n"
+        "LowBattery = 10\n"
+        "GlanceInterval = 30\n"
+        "SleepTimeout = 600\n"
+        "SleepMode = off\n"
+    )
+    assert ScreensaverSettings.from_config(config) == ScreensaverSettings(
+        mode="glance",
+        frame_interval=0.05,
+        max_frame_interval=1,
+        adaptive=False,
+        low_battery=10,
+        glance_interval=30,
+        sleep_timeout=600,
+        sleep_mode="off",
+    )
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        "Mode = fireworks",
+        "SleepMode = hibernate",
+        "FrameInterval = 0",
+        "MaxFrameInterval = 0.01",
+        "SleepTimeout = -1",
+        "LowBattery = lots",
+    ],
+)
+def test_invalid_settings_fall_back_to_defaults(mocker, settings):
+    from configparser import ConfigParser
+
+    from pt_miniscreen.pages.root.screensaver import (
+        ScreensaverSettings,
+        get_screensaver_settings,
+    )
+
+    config = ConfigParser()
+    config.read_string(f"[Screensaver]\n{settings}\n")
+    mocker.patch(
+        "pt_miniscreen.pages.root.screensaver.read_settings", return_value=config
+    )
+
+    with pytest.raises(ValueError):
+        ScreensaverSettings.from_config(config)
+
+    assert get_screensaver_settings() == ScreensaverSettings()
+
+
+def test_frame_rate_adapts_to_load_and_battery():
+    from pt_miniscreen.pages.root.screensaver import (
+        ScreensaverSettings,
+        get_adaptive_frame_interval,
+    )
+
+    settings = ScreensaverSettings(frame_interval=0.1, max_frame_interval=0.5)
+
+    # plugged in
+    assert get_adaptive_frame_interval(settings, 0.2, None) == 0.1
+    assert get_adaptive_frame_interval(settings, 0.75, None) == 0.3
+    assert get_adaptive_frame_interval(settings, 4, None) == 0.5
+
+    # on battery
+    assert get_adaptive_frame_interval(settings, 0.2, 80) == 0.3
+    assert get_adaptive_frame_interval(settings, 1, 80) == 0.5
+    assert get_adaptive_frame_interval(settings, 0.2, 20) == 0.5
+
+
+def test_starfield_frame_rate_changes_when_on_battery(mocker, create_component):
+    from pt_miniscreen.pages.root.screensaver import (
+        ScreensaverSettings,
+        StarfieldScreensaver,
+    )
+
+    get_power_state = mocker.patch(
+        "pt_miniscreen.pages.root.screensaver.get_power_state",
+        return_value=(0.1, None),
+    )
+    screensaver = create_component(
+        StarfieldScreensaver,
+        settings=ScreensaverSettings(frame_interval=0.1, max_frame_interval=0.5),
+    )
+
+    screensaver.start_animating()
+    assert screensaver.frame_interval == 0.1
+
+    get_power_state.return_value = (0.1, 10)
+    screensaver.adapt_frame_rate()
+    assert screensaver.frame_interval == 0.5
+    assert screensaver.animation_interval is not None
+
+    screensaver.stop_animating()
+    assert screensaver.animation_interval is None
+    assert screensaver.adapt_interval is None
+
+
+def test_screensaver_sleeps_with_display_off(create_screensaver_app):
+    app = create_screensaver_app(sleep_timeout=0.2, sleep_mode="off")
+
+    # screensaver starts after the dimming and screensaver timeouts
+    sleep(0.5)
+    assert app.root.is_screensaver_running
+    assert not app.miniscreen.device.is_hidden
+
+    sleep(0.3)
+    assert app.display_off
+    assert app.miniscreen.device.is_hidden
+
+    # frames are not sent while the display is off
+    app.miniscreen.device.display_image = b""
+    app.root.screensaver.update_positions()
+    assert app.miniscreen.device.display_image == b""
+
+    # pressing a button turns the display back on
+    app.miniscreen.select_button.release()
+    sleep(0.1)
+    assert not app.display_off
+    assert not app.miniscreen.device.is_hidden
+    assert not app.root.is_screensaver_running
+    assert app.miniscreen._contrast == 255
+    assert app.miniscreen.device.display_image != b""
+
+
+def test_screensaver_sleeps_with_static_display(create_screensaver_app):
+    app = create_screensaver_app(sleep_timeout=0.2, sleep_mode="static")
+
+    sleep(0.8)
+    assert app.root.is_screensaver_running
+    assert app.root.screensaver.animation_interval is None
+    assert not app.miniscreen.device.is_hidden
+
+
+def test_glance_screensaver(create_screensaver_app, mocker, snapshot):
+    mocker.patch(
+        "pt_miniscreen.pages.root.screensaver.get_time_text", return_value="12:00"
+    )
+    app = create_screensaver_app(mode="glance")
+
+    sleep(0.5)
+    assert app.root.is_screensaver_running
+    snapshot.assert_match(app.miniscreen.device.display_image, "glance.png")
@@ -0,0 +1,59 @@
+import pytest
+
+
+@pytest.fixture
+def scroll_engine():
+    from pt_miniscreen.components.scrollable import ScrollEngine
+
+    return ScrollEngine()
+
+
+def step_for(scroll_engine, duration, frame_time=0.05):
+    distance = 0
+    for _ in range(round(duration / frame_time)):
+        distance += scroll_engine.step(frame_time)
+    return distance
+
+
+def test_scroll_engine_is_idle_until_pressed(scroll_engine):
+    assert not scroll_engine.moving
+    assert scroll_engine.step(0.05) == 0
+
+
+def test_scroll_engine_scrolls_at_base_speed(scroll_engine):
+    scroll_engine.press(1)
+    assert scroll_engine.moving
+
+    # distance depends on elapsed time rather than the number of frames
+    distance = step_for(scroll_engine, duration=0.5, frame_time=0.05)
+    assert distance == pytest.approx(scroll_engine.BASE_SPEED * 0.5)
+
+    scroll_engine.press(1)
+    distance = step_for(scroll_engine, duration=0.5, frame_time=0.1)
+    assert distance == pytest.approx(scroll_engine.BASE_SPEED * 0.5)
+
+
+def test_scroll_engine_accelerates_while_held(scroll_engine):
+    scroll_engine.press(-1)
+
+    step_for(scroll_engine, duration=scroll_engine.ACCELERATION_DELAY)
+    assert scroll_engine.velocity == pytest.approx(-scroll_engine.BASE_SPEED)
+
+    step_for(scroll_engine, duration=scroll_engine.ACCELERATION_TIME / 2)
+    assert -scroll_engine.TOP_SPEED < scroll_engine.velocity
+    assert scroll_engine.velocity < -scroll_engine.BASE_SPEED
+
+    step_for(scroll_engine, duration=scroll_engine.ACCELERATION_TIME)
+    assert scroll_engine.velocity == pytest.approx(-scroll_engine.TOP_SPEED)
+
+
+def test_scroll_engine_stops_after_release(scroll_engine):
+    scroll_engine.press(1)
+    step_for(scroll_engine, duration=0.2)
+
+    scroll_engine.release()
+    assert scroll_engine.moving
+
+    step_for(scroll_engine, duration=0.5)
+    assert not scroll_engine.moving
+    assert scroll_engine.step(0.05) == 0
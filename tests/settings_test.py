@@ -133,6 +133,8 @@ def setup(miniscreen, mocker):
     miniscreen.select_button.release()
     sleep(1)
 
+    return settings_manager
+
 
 def test_ssh(miniscreen, snapshot):
     # enable ssh
@@ -150,6 +152,20 @@ def test_ssh(miniscreen, snapshot):
     snapshot.assert_match(miniscreen.device.display_image, "disabled.png")
 
 
+def test_ssh_changed_externally(miniscreen, snapshot, setup):
+    from pt_miniscreen.services.systemd import systemd
+
+    miniscreen.select_button.release()
+    sleep(3)
+    snapshot.assert_match(miniscreen.device.display_image, "enabled.png")
+
+    # disable ssh without using the miniscreen
+    setup.service_state["ssh"] = "Disabled"
+    systemd.publish({"ssh": "Disabled"})
+    sleep(1)
+    snapshot.assert_match(miniscreen.device.display_image, "disabled.png")
+
+
 def test_vnc(miniscreen, snapshot):
     # scroll down to vnc page
     miniscreen.down_button.release()
@@ -227,6 +243,9 @@ def test_encrypted_bluetooth(miniscreen, snapshot):
     miniscreen.down_button.release()
     sleep(1)
 
+    # pages are created when scrolled to, wait for the initial state to load
+    sleep(1)
+
     # enable
     miniscreen.select_button.release()
     sleep(1)
@@ -0,0 +1,62 @@
+import os
+
+
+def write_sources(sources_dir, filename, contents, mtime_offset=0):
+    path = sources_dir / filename
+    path.write_text(contents)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset))
+
+
+def test_read_apt_repositories(tmp_path):
+    from pt_miniscreen.services.software import read_apt_repositories
+
+    write_sources(
+        tmp_path,
+        "pi-top.list",
+        "# comment\ndeb http://apt.pi-top.com/pi-top-os/debian bullseye main\n",
+    )
+    write_sources(
+        tmp_path,
+        "experimental.list",
+        "deb http://apt.pi-top.com/pi-top-os-experimental/debian bullseye main\n",
+    )
+    write_sources(tmp_path, "other.list", "deb http://deb.debian.org/debian main\n")
+
+    assert read_apt_repositories(str(tmp_path)) == [
+        "pi-top-os-experimental",
+        "pi-top-os",
+    ]
+    assert read_apt_repositories(str(tmp_path / "missing")) == []
+
+
+def test_software_inventory(tmp_path, mocker):
+    from pt_miniscreen.services import software
+    from pt_miniscreen.services.software import SoftwareInventory
+
+    packages = mocker.Mock()
+    packages.get_version.side_effect = {"python3-pitop": "0.30.0"}.get
+    read_spy = mocker.spy(software, "read_apt_repositories")
+    inventory = SoftwareInventory(packages=packages, sources_dir=str(tmp_path))
+
+    assert inventory.get_package_versions(["python3-pitop", "pi-topd"]) == {
+        "python3-pitop": "0.30.0",
+        "pi-topd": "",
+    }
+
+    write_sources(
+        tmp_path, "pi-top.list", "deb http://apt.pi-top.com/pi-top-os/debian main\n"
+    )
+    assert inventory.get_repositories() == ["pi-top-os"]
+    assert inventory.get_repositories() == ["pi-top-os"]
+    assert read_spy.call_count == 1
+
+    # sources are read again when they change
+    write_sources(
+        tmp_path,
+        "pi-top.list",
+        "deb http://apt.pi-top.com/pi-top-os-experimental/debian main\n",
+        mtime_offset=10**9,
+    )
+    assert inventory.get_repositories() == ["pi-top-os-experimental"]
+    assert read_spy.call_count == 2
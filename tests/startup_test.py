@@ -0,0 +1,141 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+from time import sleep
+
+import pytest
+
+
+ROOT_DIRECTORY = Path(__file__).parent.parent
+
+# imports the app in a fresh interpreter, since pages imported by other tests
+# stay in sys.modules for the rest of the session
+IMPORT_APP_SCRIPT = """
+import json
+import sys
+from unittest.mock import MagicMock
+
+for module in [
+    "pitop",
+    "pitop.common.command_runner",
+    "pitop.common.common_ids",
+    "pitop.common.common_names",
+    "pitop.common.current_session_info",
+    "pitop.common.configuration_file",
+    "pitop.common.firmware_device",
+    "pitop.common.formatting",
+    "pitop.common.pt_os",
+    "pitop.common.ptdm",
+    "pitop.common.switch_user",
+    "further_link",
+    "further_link.util",
+    "further_link.util.bluetooth",
+    "further_link.util.bluetooth.utils",
+    "pt_fw_updater",
+    "pt_fw_updater.utils",
+]:
+    sys.modules[module] = MagicMock()
+
+from tests.mocks import battery, pitop, sys_info
+
+sys.modules["pitop.common.sys_info"] = sys_info
+sys.modules["pitop.battery"] = battery
+sys.modules["pitop.system.pitop"] = pitop
+
+import pt_miniscreen.app
+
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def get_modules_imported_by_app():
+    output = subprocess.check_output(
+        [sys.executable, "-c", IMPORT_APP_SCRIPT], cwd=ROOT_DIRECTORY
+    )
+    return json.loads(output)
+
+
+def test_pages_are_not_imported_on_startup():
+    modules = get_modules_imported_by_app()
+
+    assert "pt_miniscreen.root" in modules
+    assert "pt_miniscreen.pages.root.system_menu" in modules
+    assert "pt_miniscreen.pages.root.projects.menu_page" in modules
+
+    for module in [
+        "pt_miniscreen.pages.system.software",
+        "pt_miniscreen.pages.system.last_update",
+        "pt_miniscreen.pages.network.wifi",
+        "pt_miniscreen.pages.settings.ssh_toggle",
+        "pt_miniscreen.pages.root.projects.overview",
+        "pt_miniscreen.pages.root.projects.project",
+    ]:
+        assert module not in modules
+
+
+def test_lazy_component_imports_component_when_created(tmp_path, monkeypatch):
+    from pt_miniscreen.startup import timeline
+    from pt_miniscreen.utils import LazyComponent
+
+    (tmp_path / "lazy_page_module.py").write_text(
+        "class LazyPage:\n"
+        "    def __init__(self, value):\n"
+        "        self.value = value\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    try:
+        LazyPage = LazyComponent("lazy_page_module", "LazyPage")
+        assert "lazy_page_module" not in sys.modules
+
+        page = LazyPage(value=1)
+        assert page.value == 1
+        assert "lazy_page_module" in sys.modules
+        assert "lazy_page_module" in timeline.import_times
+    finally:
+        sys.modules.pop("lazy_page_module", None)
+
+
+def test_lazy_component_raises_if_component_missing():
+    from pt_miniscreen.utils import LazyComponent
+
+    with pytest.raises(AttributeError):
+        LazyComponent("pt_miniscreen.utils", "MissingComponent")()
+
+
+def test_timeline_records_events_in_order():
+    from pt_miniscreen.startup import StartupTimeline
+
+    timeline = StartupTimeline()
+    timeline.mark("first")
+    sleep(0.01)
+    timeline.mark("second")
+
+    (first, first_time), (second, second_time) = timeline.events
+    assert (first, second) == ("first", "second")
+    assert 0 <= first_time < second_time
+    assert second_time <= timeline.elapsed()
+    assert "second" in timeline.report()
+    assert timeline.to_dict()["events"] == {"first": first_time, "second": second_time}
+
+
+def test_timeline_times_imports(tmp_path, monkeypatch):
+    from pt_miniscreen.startup import StartupTimeline
+
+    (tmp_path / "slow_startup_module.py").write_text(
+        "import time\ntime.sleep(0.05)\nVALUE = 1\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    timeline = StartupTimeline()
+    timeline.time_imports()
+    try:
+        import slow_startup_module
+    finally:
+        timeline.stop_timing_imports()
+        sys.modules.pop("slow_startup_module", None)
+
+    assert slow_startup_module.VALUE == 1
+    assert timeline.import_times["slow_startup_module"] >= 0.05
+    assert "slow_startup_module" in timeline.report()
@@ -29,7 +29,7 @@ def battery():
 def cpu_percent(mocker):
     def set_cpu_percent(cpu_percentages, interval=1):
         mocker.patch(
-            "pt_miniscreen.components.cpu_bars.cpu_percent",
+            "pt_miniscreen.services.metrics.CPUUsage.update",
             return_value=cpu_percentages,
         )
 
@@ -53,11 +53,11 @@ def memory(mocker):
 
     def set_memory(virtual, swap):
         mocker.patch(
-            "pt_miniscreen.pages.system.memory.psutil.virtual_memory",
+            "pt_miniscreen.services.metrics.get_memory_usage",
             return_value=MockMemoryStats(total=999, used=virtual),
         )
         mocker.patch(
-            "pt_miniscreen.pages.system.memory.psutil.swap_memory",
+            "pt_miniscreen.services.metrics.get_swap_usage",
             return_value=MockMemoryStats(total=500, used=swap),
         )
 
@@ -69,11 +69,9 @@ def software_page_mocks(mocker):
     def set_software_page_mocks(
         os_version, run_number, sdk_version, pitopd_version, repos
     ):
-        def get_package_version_mock(package_name):
-            if package_name == "python3-pitop":
-                return sdk_version
-            elif package_name == "pi-topd":
-                return pitopd_version
+        def get_package_versions_mock(package_names):
+            versions = {"python3-pitop": sdk_version, "pi-topd": pitopd_version}
+            return {name: versions[name] for name in package_names}
 
         def get_apt_repositories_mock():
             return repos
@@ -87,8 +85,8 @@ def software_page_mocks(mocker):
             return_value=OsInfoMock,
         )
         mocker.patch(
-            "pt_miniscreen.pages.system.software.get_package_version",
-            get_package_version_mock,
+            "pt_miniscreen.pages.system.software.get_package_versions",
+            get_package_versions_mock,
         )
         mocker.patch(
             "pt_miniscreen.pages.system.software.get_apt_repositories",
@@ -254,6 +252,15 @@ def test_updates(miniscreen, snapshot, mocker):
         last_update_date_mock,
     )
 
+    # check for updates every time the page polls instead of using the cache
+    from pt_miniscreen.pages.system.last_update import (
+        firmware_update_status,
+        system_update_status,
+    )
+
+    mocker.patch.object(system_update_status, "max_age", 0)
+    mocker.patch.object(firmware_update_status, "max_age", 0)
+
     # scroll to updates page
     miniscreen.down_button.release()
     sleep(1)
@@ -314,6 +321,32 @@ def test_software(miniscreen, snapshot):
     snapshot.assert_match(miniscreen.device.display_image, "software.png")
 
 
+def test_software_info_is_kept_between_pages(mocker, parent, software_page_mocks):
+    from pt_miniscreen.pages.system.software import SoftwarePage
+
+    # restore the cached info after the test
+    mocker.patch.multiple(
+        SoftwarePage, sdk="", pitopd="", repos="", os="OS Information"
+    )
+    software_page_mocks("5.0", "100", "0.30.0", "3.4.0", ["sirius"])
+
+    page = parent.create_child(SoftwarePage)
+    sleep(0.5)
+    assert page.list.rows[1].state["text"] == "SDK: 0.30.0"
+    parent.remove_child(page)
+
+    # reopening the page shows the last info read while it is refreshed
+    get_package_versions = mocker.patch(
+        "pt_miniscreen.pages.system.software.get_package_versions",
+        side_effect=lambda package_names: sleep(1),
+    )
+    page = parent.create_child(SoftwarePage)
+    texts = [row.state["text"] for row in page.list.rows]
+    assert texts == ["Repos: sirius", "SDK: 0.30.0", "pi-topd: 3.4.0"]
+    assert page.title.state["text"] == "pi-topOS 5.0-100"
+    get_package_versions.assert_called_once()
+
+
 def test_pitop_hardware(miniscreen, snapshot):
     # scroll to pi-top hardware page
     miniscreen.down_button.release()
@@ -0,0 +1,201 @@
+import os
+from threading import Event, Thread
+from time import sleep
+
+SHOW_OUTPUT = """UnitFileState=enabled
+
+UnitFileState=disabled
+
+UnitFileState=masked
+
+UnitFileState=
+"""
+
+
+def test_parse_unit_file_states():
+    from pt_miniscreen.services.systemd import parse_unit_file_states
+
+    assert parse_unit_file_states(
+        SHOW_OUTPUT, ["ssh", "further-link.service", "masked.service", "missing"]
+    ) == {
+        "ssh": "Enabled",
+        "further-link.service": "Disabled",
+        "masked.service": "Masked",
+        "missing": "Unknown",
+    }
+
+
+def test_states_are_fetched_in_one_call(mocker):
+    from pt_miniscreen.services.systemd import SystemdClient
+
+    systemctl_mock = mocker.patch.object(
+        SystemdClient, "_systemctl", return_value=SHOW_OUTPUT
+    )
+    client = SystemdClient(units=["ssh", "further-link.service", "masked.service"])
+
+    threads = [
+        Thread(target=client.get_enabled_state, args=(unit,))
+        for unit in ("ssh", "further-link.service", "masked.service")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    systemctl_mock.assert_called_once_with(
+        "systemctl show --property=UnitFileState ssh further-link.service masked.service"
+    )
+    assert client.get_enabled_state("ssh") == "Enabled"
+    assert client.get_enabled_state("further-link.service") == "Disabled"
+    assert systemctl_mock.call_count == 1
+
+
+def test_enable_and_start_notifies_subscribers(mocker):
+    from pt_miniscreen.services.systemd import SystemdClient
+
+    class Subscriber:
+        def __init__(self):
+            self.changes = []
+
+        def on_change(self, changes):
+            self.changes.append(changes)
+
+    systemctl_mock = mocker.patch.object(
+        SystemdClient, "_systemctl", return_value="UnitFileState=disabled\n"
+    )
+    client = SystemdClient(units=["ssh"])
+    assert client.get_enabled_state("ssh") == "Disabled"
+
+    subscriber = Subscriber()
+    client.subscribe(subscriber.on_change)
+
+    systemctl_mock.return_value = "UnitFileState=enabled\n"
+    client.enable_and_start("ssh")
+
+    systemctl_mock.assert_any_call("sudo systemctl enable --now ssh", timeout=30)
+    assert subscriber.changes == [{"ssh": "Enabled"}]
+    assert client.get_enabled_state("ssh") == "Enabled"
+
+
+def test_config_changes_are_pushed_to_subscribers(mocker, tmp_path):
+    from pt_miniscreen.services.systemd import SystemdClient
+
+    class Subscriber:
+        def __init__(self):
+            self.changes = []
+
+        def on_change(self, changes):
+            self.changes.append(changes)
+
+    wants_directory = tmp_path / "multi-user.target.wants"
+    wants_directory.mkdir()
+    systemctl_mock = mocker.patch.object(
+        SystemdClient, "_systemctl", return_value="UnitFileState=disabled\n"
+    )
+    client = SystemdClient(
+        units=["ssh"], watch_interval=0.1, config_directory=str(tmp_path)
+    )
+    assert client.get_enabled_state("ssh") == "Disabled"
+
+    subscriber = Subscriber()
+    client.subscribe(subscriber.on_change)
+
+    # cached state is used while the config is unchanged
+    sleep(0.3)
+    assert client.get_enabled_state("ssh") == "Disabled"
+    assert systemctl_mock.call_count == 1
+    assert subscriber.changes == []
+
+    # enabling ssh elsewhere adds a symlink to a .wants directory
+    systemctl_mock.return_value = "UnitFileState=enabled\n"
+    (wants_directory / "ssh.service").symlink_to("/lib/systemd/system/ssh.service")
+    stat = wants_directory.stat()
+    os.utime(wants_directory, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    sleep(0.3)
+
+    assert subscriber.changes == [{"ssh": "Enabled"}]
+    assert systemctl_mock.call_count == 2
+
+
+def test_config_is_only_watched_while_subscribers_are_active(mocker, tmp_path):
+    from pt_miniscreen.services.systemd import (
+        SystemdClient,
+        get_unit_config_fingerprint,
+    )
+
+    class Subscriber:
+        def on_change(self, changes):
+            pass
+
+    systemctl_mock = mocker.patch.object(
+        SystemdClient, "_systemctl", return_value="UnitFileState=disabled\n"
+    )
+    client = SystemdClient(
+        units=["ssh"], watch_interval=0.1, config_directory=str(tmp_path)
+    )
+    assert client.get_enabled_state("ssh") == "Disabled"
+
+    fingerprint_spy = mocker.patch(
+        "pt_miniscreen.services.systemd.get_unit_config_fingerprint",
+        wraps=get_unit_config_fingerprint,
+    )
+    active_event = Event()
+    subscriber = Subscriber()
+    client.subscribe(subscriber.on_change, active_event=active_event)
+
+    def get_fingerprint_reads():
+        # clients from other tests are still watching their directories
+        return [c for c in fingerprint_spy.call_args_list if c.args == (str(tmp_path),)]
+
+    # nothing is read while the subscriber is inactive
+    sleep(0.3)
+    assert get_fingerprint_reads() == []
+
+    # systemctl isn't called again while the config is unchanged
+    active_event.set()
+    sleep(0.3)
+    assert len(get_fingerprint_reads()) > 0
+    assert systemctl_mock.call_count == 1
+
+
+def test_inactive_pages_are_updated_when_config_changes(mocker, tmp_path, parent):
+    from pt_miniscreen.components.action_page import ActionPage, ActionState
+    from pt_miniscreen.services.systemd import SystemdClient
+
+    class Subscriber:
+        def on_change(self, changes):
+            pass
+
+    wants_directory = tmp_path / "multi-user.target.wants"
+    wants_directory.mkdir()
+    systemctl_mock = mocker.patch.object(
+        SystemdClient, "_systemctl", return_value="UnitFileState=disabled\n"
+    )
+    client = SystemdClient(
+        units=["ssh"], watch_interval=0.1, config_directory=str(tmp_path)
+    )
+
+    # a warm page that isn't being shown
+    page = parent.create_child(
+        ActionPage,
+        text="SSH",
+        action=lambda: None,
+        get_enabled_state=lambda: client.get_enabled_state("ssh"),
+        state_publisher=client,
+    )
+    page._set_active(False)
+    sleep(0.3)
+    assert page.state["action_state"] == ActionState.DISABLED
+
+    # another page is active so the config is watched
+    subscriber = Subscriber()
+    client.subscribe(subscriber.on_change)
+
+    systemctl_mock.return_value = "UnitFileState=enabled\n"
+    (wants_directory / "ssh.service").symlink_to("/lib/systemd/system/ssh.service")
+    stat = wants_directory.stat()
+    os.utime(wants_directory, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    sleep(0.3)
+
+    page._set_active(True)
+    assert page.state["action_state"] == ActionState.ENABLED
@@ -0,0 +1,77 @@
+import os
+from time import sleep
+from unittest.mock import Mock
+
+
+def test_cached_check_reuses_result(tmp_path):
+    from pt_miniscreen.services.updates import CachedCheck
+
+    watched_file = tmp_path / "status"
+    watched_file.write_text("")
+    check = Mock(return_value="checked")
+    cached_check = CachedCheck(
+        check, watched_paths=[str(watched_file)], initial_value="Loading..."
+    )
+
+    # initial value is returned while the first check runs in the background
+    assert cached_check.get() == "Loading..."
+    sleep(0.1)
+    assert cached_check.get() == "checked"
+    assert check.call_count == 1
+
+    # result is reused while nothing has changed
+    sleep(0.1)
+    assert cached_check.get() == "checked"
+    assert check.call_count == 1
+
+    # modifying a watched path causes the check to run again
+    stat = watched_file.stat()
+    os.utime(watched_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    check.return_value = "changed"
+    cached_check.get()
+    sleep(0.1)
+    assert cached_check.get() == "changed"
+    assert check.call_count == 2
+
+
+def test_cached_check_max_age():
+    from pt_miniscreen.services.updates import CachedCheck
+
+    check = Mock(return_value="checked")
+    cached_check = CachedCheck(check, max_age=0.2)
+
+    cached_check.get()
+    sleep(0.1)
+    cached_check.get()
+    assert check.call_count == 1
+
+    sleep(0.2)
+    cached_check.get()
+    sleep(0.1)
+    assert check.call_count == 2
+
+
+def test_cached_check_publishes_results():
+    from pt_miniscreen.services.updates import CachedCheck
+
+    class Subscriber:
+        def __init__(self):
+            self.values = []
+
+        def on_value(self, value):
+            self.values.append(value)
+
+    subscriber = Subscriber()
+    cached_check = CachedCheck(Mock(side_effect=["first", "second"]), max_age=0)
+    cached_check.subscribe(subscriber.on_value)
+
+    cached_check.check_if_stale()
+    sleep(0.1)
+    cached_check.check_if_stale()
+    sleep(0.1)
+    assert subscriber.values == ["first", "second"]
+
+    # errors keep the previous result
+    cached_check.check_if_stale()
+    sleep(0.1)
+    assert cached_check.value == "second"